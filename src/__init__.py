@@ -21,10 +21,26 @@ VERSION_INFO = {
 
 # 편의성을 위한 주요 모듈/클래스 임포트
 from src.core.config import config
-from src.document.pdf_processor import PDFProcessor
-from src.ocr.ensemble import OCREngine
-from src.extraction.llm_processor import LLMProcessor
-from src.storage.manager import StorageManager
+
+# 무거운 의존성(OCR/ML)을 가진 클래스는 처음 사용할 때 임포트
+# (웹 프로세스처럼 사용하지 않는 역할에서 시작 시간/메모리 절약)
+_LAZY_IMPORTS = {
+    'PDFProcessor': 'src.document.pdf_processor',
+    'OCREngine': 'src.ocr.ensemble',
+    'LLMProcessor': 'src.extraction.llm_processor',
+    'StorageManager': 'src.storage.manager',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 # 로깅 설정 초기화
 import logging
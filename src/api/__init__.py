@@ -16,6 +16,7 @@ API_INFO: Dict[str, Any] = {
     'version': '1.0.0',
     'endpoints': {
         'ocr': '/api/v1/ocr',
+        'ocr_batch': '/api/v1/ocr/batch',
         'extraction': '/api/v1/extraction',
         'fields': '/api/v1/fields',
         'health': '/api/v1/health',
@@ -42,7 +43,7 @@ API_ALLOWED_EXTENSIONS = ['.pdf', '.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bm
 # 편의성을 위한 주요 모듈/클래스 임포트
 from src.api.routes import router as api_router
 from src.api.models import (
-    OCRRequest, OCRResponse, OCRResult, 
+    OCRRequest, OCRResponse, OCRBatchResponse, OCRResult, 
     ExtractionRequest, ExtractionResult
 )
 
@@ -50,6 +50,14 @@ class OCRResponse(BaseModel):
     )
 
 
+class OCRBatchResponse(BaseModel):
+    """OCR 일괄 작업 상태 응답 모델"""
+    
+    tasks: List[OCRResponse] = Field(
+        description="파일별 작업 상태 (요청한 파일 순서)"
+    )
+
+
 class OCRPage(BaseModel):
     """OCR 페이지 결과 모델"""
     
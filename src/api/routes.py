@@ -7,34 +7,65 @@ API 라우트 모듈
 
 import os
 import time
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional, Union
 from fastapi import APIRouter, File, UploadFile, Form, HTTPException, BackgroundTasks, Depends, Query
-from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, StreamingResponse
 import json
 import rq
 from rq.job import Job
 import redis
 
 from src.core.config import config
-from src.api.models import OCRRequest, OCRResponse, OCRResult, ExtractionRequest, ExtractionResult
-from src.worker.tasks import process_document, extract_data_from_document
+from src.api import API_ALLOWED_EXTENSIONS
+from src.utils.serialization import JOB_SERIALIZER
+from src.api.models import OCRRequest, OCRResponse, OCRBatchResponse, OCRResult, ExtractionRequest, ExtractionResult
+from src.storage.manager import StorageManager
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# JSON 처리 (orjson이 있으면 C 구현으로 옵션 파싱 및 응답 직렬화, 없으면 표준 json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    DEFAULT_RESPONSE_CLASS = ORJSONResponse
+except ImportError:
+    _json_loads = json.loads
+    DEFAULT_RESPONSE_CLASS = JSONResponse
+
+# 작업 함수 경로 (작업자 프로세스에서만 임포트되도록 문자열로 지정,
+# API 프로세스에서 OCR/ML 의존성을 불러오지 않음)
+_PROCESS_DOCUMENT_TASK = 'src.worker.tasks.process_document'
+_PROCESS_STORED_DOCUMENT_TASK = 'src.worker.tasks.process_stored_document'
+_EXTRACT_DATA_TASK = 'src.worker.tasks.extract_data_from_document'
+
 # Redis 연결
 try:
     redis_conn = redis.Redis.from_url(config.get('queue.redis_url', 'redis://localhost:6379/0'))
-    queue = rq.Queue(config.get('queue.queue_name', 'ocr_tasks'), connection=redis_conn)
+    queue = rq.Queue(config.get('queue.queue_name', 'ocr_tasks'), connection=redis_conn,
+                     serializer=JOB_SERIALIZER)
     logger.info("Redis 작업 큐 초기화 성공")
 except Exception as e:
     logger.error(f"Redis 작업 큐 초기화 오류: {e}")
     redis_conn = None
     queue = None
 
+# 스토리지 관리자 (일괄 업로드 시 생성)
+_storage_manager: Optional[StorageManager] = None
+
+
+def _get_storage_manager() -> StorageManager:
+    """공유 스토리지 관리자 반환"""
+    global _storage_manager
+    if _storage_manager is None:
+        _storage_manager = StorageManager()
+    return _storage_manager
+
+
 # 라우터 생성
-router = APIRouter(prefix="/api/v1")
+router = APIRouter(prefix="/api/v1", default_response_class=DEFAULT_RESPONSE_CLASS)
 
 
 # OCR 처리 API
@@ -60,17 +91,16 @@ async def ocr_document(
         
         # 파일 확장자 확인
         file_ext = os.path.splitext(file.filename)[1].lower()
-        supported_types = [".pdf", ".jpg", ".jpeg", ".png", ".tiff", ".tif", ".bmp", ".gif"]
         
-        if file_ext not in supported_types:
+        if file_ext not in API_ALLOWED_EXTENSIONS:
             raise HTTPException(
                 status_code=400, 
-                detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(supported_types)}"
+                detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(API_ALLOWED_EXTENSIONS)}"
             )
         
         # 옵션 파싱
         try:
-            options_dict = json.loads(options)
+            options_dict = _json_loads(options)
         except json.JSONDecodeError:
             options_dict = {}
         
@@ -79,7 +109,7 @@ async def ocr_document(
         
         # 작업 큐에 추가
         job = queue.enqueue(
-            process_document,
+            _PROCESS_DOCUMENT_TASK,
             args=(file_bytes, file.filename, options_dict),
             job_timeout=config.get('queue.timeout', 3600)  # 기본 1시간 타임아웃
         )
@@ -100,6 +130,88 @@ async def ocr_document(
         raise HTTPException(status_code=500, detail=f"OCR 요청 처리 오류: {str(e)}")
 
 
+@router.post("/ocr/batch", response_model=OCRBatchResponse)
+async def ocr_documents_batch(
+    files: List[UploadFile] = File(...),
+    options: str = Form("{}")
+):
+    """
+    여러 문서 일괄 텍스트 추출 API
+    
+    파일은 스토리지에 동시에 저장하고, 작업은 한 번의 Redis 파이프라인으로 큐에 추가
+    
+    Args:
+        files: PDF 또는 이미지 파일 목록
+        options: JSON 문자열 (OCRRequest 모델, 모든 파일에 적용)
+    
+    Returns:
+        파일별 작업 ID 및 상태
+    """
+    try:
+        # 작업 큐 확인
+        if queue is None:
+            raise HTTPException(status_code=503, detail="작업 큐를 사용할 수 없습니다.")
+        
+        # 파일 확장자 확인 (하나라도 지원하지 않으면 전체 거부)
+        for file in files:
+            file_ext = os.path.splitext(file.filename)[1].lower()
+            if file_ext not in API_ALLOWED_EXTENSIONS:
+                raise HTTPException(
+                    status_code=400, 
+                    detail=f"지원하지 않는 파일 형식입니다 ({file.filename}). 지원 형식: {', '.join(API_ALLOWED_EXTENSIONS)}"
+                )
+        
+        # 옵션 파싱
+        try:
+            options_dict = _json_loads(options)
+        except json.JSONDecodeError:
+            options_dict = {}
+        
+        # 파일 동시 저장 (작업에는 파일 내용 대신 스토리지 경로 전달)
+        storage_manager = _get_storage_manager()
+        saved = await asyncio.gather(*(
+            storage_manager.save_file_stream(file.file, file.filename) for file in files
+        ), return_exceptions=True)
+        file_paths = [path for path in saved if not isinstance(path, BaseException)]
+        
+        try:
+            # 하나라도 저장에 실패하면 전체 실패 처리
+            for result in saved:
+                if isinstance(result, BaseException):
+                    raise result
+            
+            # 작업 일괄 추가 (Redis 왕복 한 번)
+            job_timeout = config.get('queue.timeout', 3600)  # 기본 1시간 타임아웃
+            jobs = await asyncio.to_thread(queue.enqueue_many, [
+                rq.Queue.prepare_data(
+                    _PROCESS_STORED_DOCUMENT_TASK,
+                    args=(file_path, file.filename, options_dict),
+                    timeout=job_timeout
+                )
+                for file_path, file in zip(file_paths, files)
+            ])
+        
+        except BaseException:
+            # 작업으로 이어지지 못한 저장 파일 정리
+            await asyncio.gather(*(storage_manager.delete_file(path) for path in file_paths),
+                                 return_exceptions=True)
+            raise
+        
+        logger.info(f"OCR 작업 {len(jobs)}개 일괄 큐에 추가")
+        
+        return {
+            "tasks": [{"task_id": job.id, "status": "processing"} for job in jobs]
+        }
+    
+    except HTTPException as e:
+        # HTTP 예외는 그대로 전달
+        raise
+    
+    except Exception as e:
+        logger.error(f"OCR 일괄 요청 처리 오류: {e}")
+        raise HTTPException(status_code=500, detail=f"OCR 일괄 요청 처리 오류: {str(e)}")
+
+
 @router.get("/ocr/{task_id}", response_model=Union[OCRResult, OCRResponse])
 async def get_ocr_result(task_id: str):
     """
@@ -118,7 +230,7 @@ async def get_ocr_result(task_id: str):
         
         # 작업 가져오기
         try:
-            job = Job.fetch(task_id, connection=redis_conn)
+            job = Job.fetch(task_id, connection=redis_conn, serializer=JOB_SERIALIZER)
         except Exception as e:
             raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {task_id}")
         
@@ -171,7 +283,7 @@ async def extract_data(
         
         # OCR 작업 확인
         try:
-            ocr_job = Job.fetch(task_id, connection=redis_conn)
+            ocr_job = Job.fetch(task_id, connection=redis_conn, serializer=JOB_SERIALIZER)
         except Exception as e:
             raise HTTPException(status_code=404, detail=f"OCR 작업을 찾을 수 없습니다: {task_id}")
         
@@ -181,13 +293,13 @@ async def extract_data(
         
         # 옵션 파싱
         try:
-            options_dict = json.loads(options)
+            options_dict = _json_loads(options)
         except json.JSONDecodeError:
             options_dict = {}
         
         # 추출 작업 큐에 추가
         extraction_job = queue.enqueue(
-            extract_data_from_document,
+            _EXTRACT_DATA_TASK,
             args=(task_id, options_dict),
             job_timeout=config.get('queue.timeout', 3600)  # 기본 1시간 타임아웃
         )
@@ -226,7 +338,7 @@ async def get_extraction_result(task_id: str):
         
         # 작업 가져오기
         try:
-            job = Job.fetch(task_id, connection=redis_conn)
+            job = Job.fetch(task_id, connection=redis_conn, serializer=JOB_SERIALIZER)
         except Exception as e:
             raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {task_id}")
         
@@ -271,7 +383,7 @@ async def get_extraction_csv(task_id: str):
         
         # 작업 가져오기
         try:
-            job = Job.fetch(task_id, connection=redis_conn)
+            job = Job.fetch(task_id, connection=redis_conn, serializer=JOB_SERIALIZER)
         except Exception as e:
             raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {task_id}")
         
@@ -290,11 +402,10 @@ async def get_extraction_csv(task_id: str):
         from src.extraction.csv_exporter import CSVExporter
         
         exporter = CSVExporter()
-        csv_data = exporter.export_single(result['fields'])
         
         # CSV 파일 다운로드 응답
         return StreamingResponse(
-            iter([csv_data.getvalue()]),
+            exporter.iter_single(result['fields']),
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment;filename=extraction_{task_id}.csv"
@@ -347,13 +458,11 @@ async def update_extraction_fields(fields: List[Dict[str, Any]]):
         
         field_config = FieldConfig()
         
-        # 모든 필드 확인
-        for field in fields:
-            if 'name' not in field:
-                raise HTTPException(status_code=400, detail="모든 필드에 'name' 키가 필요합니다.")
-        
-        # 필드 업데이트
-        field_config.fields = fields
+        # 필드 업데이트 (형식이 올바르지 않으면 400)
+        try:
+            field_config.fields = fields
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"필드 설정 형식 오류: {str(e)}")
         field_config._save_fields()
         
         logger.info(f"필드 설정 업데이트: {len(fields)}개의 필드")
@@ -42,7 +42,7 @@ class PDFProcessor:
             'strict': False
         }
     
-    def convert_to_images(self, pdf_content: Union[bytes, BinaryIO], 
+    def convert_to_images(self, pdf_content: Union[bytes, memoryview, BinaryIO], 
                          start_page: int = 1, 
                          end_page: Optional[int] = None, 
                          check_orientation: bool = True) -> List[Dict[str, Any]]:
@@ -50,7 +50,7 @@ class PDFProcessor:
         PDF를 이미지 목록으로 변환
         
         Args:
-            pdf_content: PDF 파일 내용 (바이트 또는 파일 객체)
+            pdf_content: PDF 파일 내용 (바이트, memoryview 또는 파일 객체)
             start_page: 시작 페이지 번호 (1부터 시작)
             end_page: 종료 페이지 번호 (None이면 마지막 페이지까지)
             check_orientation: 페이지 방향 감지 및 보정 여부
@@ -60,7 +60,7 @@ class PDFProcessor:
         """
         try:
             # PDF 바이트 처리
-            if not isinstance(pdf_content, bytes):
+            if not isinstance(pdf_content, (bytes, bytearray, memoryview)):
                 pdf_bytes = pdf_content.read()
             else:
                 pdf_bytes = pdf_content
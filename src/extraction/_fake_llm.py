@@ -0,0 +1,49 @@
+"""
+테스트/CI용 가짜 LLM 클라이언트 모듈
+- 외부 API 호출 없이 고정된 JSON 응답 반환
+- OpenAI 클라이언트와 같은 chat.completions.create 인터페이스 제공
+"""
+
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+
+class _FakeCompletions:
+    """chat.completions 네임스페이스"""
+
+    def __init__(self, client: 'FakeLLMClient'):
+        self._client = client
+
+    def create(self, **kwargs) -> SimpleNamespace:
+        """
+        채팅 응답 생성 (고정 응답 반환)
+
+        Args:
+            **kwargs: OpenAI chat.completions.create와 같은 인자 (model, messages 등)
+
+        Returns:
+            choices[0].message.content에 고정 응답을 담은 응답 객체
+        """
+        self._client.calls.append(kwargs)
+        message = SimpleNamespace(content=self._client.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeLLMClient:
+    """
+    가짜 LLM 클라이언트
+
+    provider가 'fake'이면 LLMProcessor가 실제 API 대신 사용.
+    호출 인자는 calls에 기록되어 테스트에서 프롬프트를 확인할 수 있음.
+    """
+
+    def __init__(self, content: Optional[str] = None):
+        """
+        초기화
+
+        Args:
+            content: 항상 반환할 응답 텍스트 (None이면 빈 JSON 객체)
+        """
+        self.content = content if content is not None else "{}"
+        self.calls: List[Dict[str, Any]] = []
+        self.chat = SimpleNamespace(completions=_FakeCompletions(self))
@@ -7,14 +7,18 @@ CSV 내보내기 모듈
 import csv
 import os
 import io
+import codecs
 import logging
-from typing import Dict, Any, List, Optional, Union, BinaryIO
+from typing import Dict, Any, List, Optional, Union, BinaryIO, Iterable, Iterator
 from pathlib import Path
 from src.extraction.field_config import FieldConfig
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# UTF-8 BOM (Excel에서 UTF-8 CSV로 인식)
+_UTF8_BOM = codecs.BOM_UTF8
+
 
 class CSVExporter:
     """추출 데이터를 CSV로 내보내는 클래스"""
@@ -51,6 +55,25 @@ class CSVExporter:
         else:
             return self._save_to_memory([header, row])
     
+    def iter_single(self, extracted_data: Dict[str, Any]) -> Iterator[bytes]:
+        """
+        단일 문서 데이터를 CSV 청크로 순차 생성 (스트리밍 응답용)
+        
+        Args:
+            extracted_data: 추출된 필드 데이터
+        
+        Returns:
+            UTF-8 BOM으로 시작하는 CSV 바이트 청크 이터레이터
+        """
+        # 필드 목록 가져오기
+        fields = self.field_config.get_fields()
+        
+        # 헤더 및 데이터 행 구성
+        header = [field['name'] for field in fields]
+        row = [extracted_data.get(field_name, '') for field_name in header]
+        
+        return self._iter_rows([header, row])
+    
     def export_multiple(self, 
                        extracted_data_list: List[Dict[str, Any]], 
                        file_path: Optional[str] = None,
@@ -76,37 +99,32 @@ class CSVExporter:
         # 기본 헤더 구성
         header = [field['name'] for field in fields]
         
-        # 추가 열이 있으면 헤더에 추가
+        # 추가 열이 있으면 헤더에 추가 (필드 이름과 겹치지 않는 열만, 앞에 역순으로 배치)
         if additional_columns:
-            for col_name in additional_columns.keys():
-                if col_name not in header:
-                    header.insert(0, col_name)  # 추가 열을 앞에 배치
+            known = self.field_config.get_fields_by_names(additional_columns)
+            extra = [col_name for col_name, field in zip(additional_columns, known) if field is None]
+            header = extra[::-1] + header
         
-        # 모든 데이터 행 구성
-        rows = []
-        rows.append(header)  # 헤더 행 추가
+        # 열별 값 출처를 한 번만 결정 (추가 열 값 목록, None이면 추출 데이터)
+        column_sources = [
+            (col_name, additional_columns.get(col_name) if additional_columns else None)
+            for col_name in header
+        ]
         
-        for i, extracted_data in enumerate(extracted_data_list):
-            row = []
-            
-            # 추가 열 데이터 추가
-            if additional_columns:
-                for col_name in header:
-                    if col_name in additional_columns:
-                        # 인덱스가 범위를 벗어나면 빈 값 사용
-                        if i < len(additional_columns[col_name]):
-                            row.append(additional_columns[col_name][i])
-                        else:
-                            row.append('')
-                    elif col_name in extracted_data:
-                        row.append(extracted_data.get(col_name, ''))
-                    else:
-                        row.append('')
-            else:
-                # 추가 열 없이 추출 데이터만 사용
-                row = [extracted_data.get(field_name, '') for field_name in header]
+        def iter_rows() -> Iterator[List[Any]]:
+            # 헤더 행
+            yield header
             
-            rows.append(row)
+            # 데이터 행을 목록으로 모으지 않고 작성기에 바로 전달
+            for i, extracted_data in enumerate(extracted_data_list):
+                yield [
+                    # 추가 열 인덱스가 범위를 벗어나면 빈 값 사용
+                    (values[i] if i < len(values) else '') if values is not None
+                    else extracted_data.get(col_name, '')
+                    for col_name, values in column_sources
+                ]
+        
+        rows = iter_rows()
         
         # CSV 파일로 저장 또는 메모리에 저장
         if file_path:
@@ -114,7 +132,7 @@ class CSVExporter:
         else:
             return self._save_to_memory(rows)
     
-    def _save_to_file(self, rows: List[List[Any]], file_path: str) -> str:
+    def _save_to_file(self, rows: Iterable[List[Any]], file_path: str) -> str:
         """
         데이터를 CSV 파일로 저장
         
@@ -141,7 +159,7 @@ class CSVExporter:
             logger.error(f"CSV 파일 저장 오류: {str(e)}")
             raise
     
-    def _save_to_memory(self, rows: List[List[Any]]) -> BinaryIO:
+    def _save_to_memory(self, rows: Iterable[List[Any]]) -> BinaryIO:
         """
         데이터를 메모리 내 CSV로 저장
         
@@ -152,14 +170,18 @@ class CSVExporter:
             CSV 데이터가 포함된 BytesIO 객체
         """
         try:
-            # UTF-8 BOM 인코딩으로 메모리에 저장 (Excel 호환)
-            csv_buffer = io.StringIO()
-            writer = csv.writer(csv_buffer)
+            # UTF-8 BOM 인코딩으로 메모리에 저장 (Excel 호환, utf-8-sig와 동일)
+            memory_file = io.BytesIO()
+            memory_file.write(_UTF8_BOM)
+            
+            # 문자열 버퍼를 거치지 않고 BytesIO에 바로 인코딩해 기록
+            text_writer = io.TextIOWrapper(memory_file, encoding='utf-8', newline='')
+            writer = csv.writer(text_writer)
             writer.writerows(rows)
             
-            # BytesIO로 변환
-            memory_file = io.BytesIO()
-            memory_file.write(csv_buffer.getvalue().encode('utf-8-sig'))
+            # 래퍼를 분리해 래퍼 정리 시 BytesIO가 닫히지 않도록 함
+            text_writer.flush()
+            text_writer.detach()
             memory_file.seek(0)
             
             logger.info("CSV 데이터를 메모리에 저장")
@@ -169,6 +191,30 @@ class CSVExporter:
             logger.error(f"CSV 메모리 저장 오류: {str(e)}")
             raise
     
+    @staticmethod
+    def _iter_rows(rows: Iterable[List[Any]]) -> Iterator[bytes]:
+        """
+        CSV 행을 한 줄씩 인코딩해 생성 (전체 CSV를 메모리에 만들지 않음)
+        
+        Args:
+            rows: CSV 행 데이터 (첫 번째 행은 헤더)
+        
+        Returns:
+            CSV 바이트 청크 이터레이터
+        """
+        # UTF-8 BOM (Excel 호환, utf-8-sig와 동일)
+        yield _UTF8_BOM
+        
+        # 행 버퍼 하나를 재사용
+        line_buffer = io.StringIO()
+        writer = csv.writer(line_buffer)
+        
+        for row in rows:
+            writer.writerow(row)
+            yield line_buffer.getvalue().encode('utf-8')
+            line_buffer.seek(0)
+            line_buffer.truncate()
+    
     def export_fields_template(self, file_path: Optional[str] = None) -> Union[str, BinaryIO]:
         """
         필드 설정 템플릿 내보내기
@@ -5,18 +5,41 @@
 """
 
 import os
+import sys
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import contextlib
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Iterator
 from src.core.config import config
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
 
+def _validate_fields(fields: Any) -> None:
+    """
+    필드 설정 목록 형식 확인
+    
+    Args:
+        fields: 필드 설정 목록
+    
+    Raises:
+        ValueError: 목록이 아니거나, 문자열 'name' 키가 있는 dict가 아닌 항목이 있는 경우
+    """
+    if not isinstance(fields, list):
+        raise ValueError("필드 설정은 목록이어야 합니다.")
+    
+    for i, field in enumerate(fields):
+        if not isinstance(field, dict) or not isinstance(field.get('name'), str):
+            raise ValueError(f"{i}번째 필드에 문자열 'name' 키가 필요합니다.")
+
+
 class FieldConfig:
     """필드 설정 관리 클래스"""
     
+    # 파일별 로드 결과 캐시 {절대 경로: ((mtime_ns, 크기), 필드 목록)}
+    _file_cache: Dict[str, Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
+    
     def __init__(self, config_file: Optional[str] = None):
         """
         초기화
@@ -29,23 +52,65 @@ class FieldConfig:
         # 기본 필드 설정
         self.default_fields = config.get('extraction.default_fields', [])
         
-        # 사용자 정의 필드 로드
+        # 사용자 정의 필드 로드 (이름 색인도 함께 구성)
         self.fields = self._load_fields()
+        
+        # 쓰기 지연 상태 (defer_writes 중첩 깊이, 저장 대기 여부)
+        self._defer_depth = 0
+        self._dirty = False
+    
+    @property
+    def fields(self) -> List[Dict[str, Any]]:
+        """필드 설정 목록"""
+        return self._fields
+    
+    @fields.setter
+    def fields(self, fields: List[Dict[str, Any]]) -> None:
+        """
+        필드 설정 목록 교체 (외부에서 직접 교체해도 이름 색인이 어긋나지 않도록 재구성)
+        
+        Raises:
+            ValueError: 필드 설정 형식이 올바르지 않은 경우 (기존 설정 유지)
+        """
+        _validate_fields(fields)
+        self._fields = fields
+        self._reindex()
+    
+    def _reindex(self) -> None:
+        """필드 이름 -> 필드 설정 색인 재구성 (이름이 중복되면 앞의 필드 우선, 이름은 인터닝)"""
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        for field in self._fields:
+            name = field['name'] = sys.intern(field['name'])
+            self._by_name.setdefault(name, field)
     
     def _load_fields(self) -> List[Dict[str, Any]]:
         """
         필드 설정 파일 로드
         
+        같은 파일이 마지막 로드 이후 변경되지 않았으면 캐시된 내용을 사용
+        
         Returns:
             필드 설정 목록
         """
         try:
             # 파일이 존재하면 로드
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    fields = json.load(f)
-                logger.info(f"필드 설정 로드: {len(fields)}개의 필드")
-                return fields
+                cache_key = os.path.abspath(self.config_file)
+                stat = os.stat(self.config_file)
+                version = (stat.st_mtime_ns, stat.st_size)
+                
+                cached = self._file_cache.get(cache_key)
+                if cached is not None and cached[0] == version:
+                    fields = cached[1]
+                else:
+                    with open(self.config_file, 'r', encoding='utf-8') as f:
+                        fields = json.load(f)
+                    _validate_fields(fields)
+                    self._file_cache[cache_key] = (version, fields)
+                    logger.info(f"필드 설정 로드: {len(fields)}개의 필드")
+                
+                # 인스턴스 간 캐시 공유로 인한 변경 전파 방지
+                return [dict(field) for field in fields]
             
             # 파일이 없으면 기본 필드 반환
             logger.info(f"필드 설정 파일이 없습니다. 기본 설정 사용 ({len(self.default_fields)}개의 필드)")
@@ -74,10 +139,24 @@ class FieldConfig:
         Returns:
             필드 설정 (없으면 None)
         """
-        for field in self.fields:
-            if field['name'] == field_name:
-                return field.copy()
-        return None
+        field = self._by_name.get(field_name)
+        return field.copy() if field is not None else None
+    
+    def get_fields_by_names(self, field_names: Iterable[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        여러 필드 설정을 이름으로 한 번에 가져오기
+        
+        Args:
+            field_names: 필드 이름 목록
+        
+        Returns:
+            이름 순서대로의 필드 설정 목록 (없는 이름은 None)
+        """
+        by_name = self._by_name
+        return [
+            field.copy() if field is not None else None
+            for field in map(by_name.get, field_names)
+        ]
     
     def add_field(self, field: Dict[str, Any]) -> bool:
         """
@@ -95,13 +174,14 @@ class FieldConfig:
             return False
         
         # 중복 확인
-        for existing_field in self.fields:
-            if existing_field['name'] == field['name']:
-                logger.warning(f"이미 존재하는 필드 이름: {field['name']}")
-                return False
+        if field['name'] in self._by_name:
+            logger.warning(f"이미 존재하는 필드 이름: {field['name']}")
+            return False
         
         # 필드 추가
+        field['name'] = sys.intern(field['name'])
         self.fields.append(field)
+        self._by_name[field['name']] = field
         
         # 설정 저장
         self._save_fields()
@@ -126,6 +206,7 @@ class FieldConfig:
                 # 이름 변경 없이 업데이트하는 경우
                 if updated_field.get('name') == field_name:
                     self.fields[i] = updated_field
+                    self._reindex()
                     self._save_fields()
                     logger.info(f"필드 업데이트: {field_name}")
                     return True
@@ -138,6 +219,7 @@ class FieldConfig:
                 
                 # 업데이트
                 self.fields[i] = updated_field
+                self._reindex()
                 self._save_fields()
                 logger.info(f"필드 업데이트: {field_name} -> {updated_field['name']}")
                 return True
@@ -172,15 +254,47 @@ class FieldConfig:
         self._save_fields()
         logger.info("필드 설정을 기본값으로 재설정")
     
+    @contextlib.contextmanager
+    def defer_writes(self) -> Iterator["FieldConfig"]:
+        """
+        블록 안의 필드 변경을 모아 블록 종료 시 한 번만 저장
+        
+        Returns:
+            현재 FieldConfig 인스턴스 (with 문 대상)
+        """
+        self._defer_depth += 1
+        try:
+            yield self
+        finally:
+            self._defer_depth -= 1
+            if self._defer_depth == 0 and self._dirty:
+                self._save_fields()
+    
     def _save_fields(self) -> None:
-        """필드 설정 파일 저장"""
+        """필드 설정 파일 저장 (defer_writes 블록 안에서는 종료 시까지 지연)"""
+        if self._defer_depth:
+            self._dirty = True
+            return
+        
+        self._dirty = False
         try:
             # 디렉토리 생성
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+            config_dir = os.path.dirname(self.config_file)
+            if config_dir:
+                os.makedirs(config_dir, exist_ok=True)
             
-            # 파일 저장
-            with open(self.config_file, 'w', encoding='utf-8') as f:
+            # 임시 파일에 쓴 뒤 교체 (저장 중 다른 프로세스가 불완전한 파일을 읽지 않도록)
+            tmp_file = f"{self.config_file}.{os.getpid()}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump(self.fields, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.config_file)
+            
+            # 방금 저장한 내용으로 캐시 갱신
+            stat = os.stat(self.config_file)
+            self._file_cache[os.path.abspath(self.config_file)] = (
+                (stat.st_mtime_ns, stat.st_size),
+                [dict(field) for field in self.fields]
+            )
             
             logger.info(f"필드 설정 저장: {self.config_file}")
         
@@ -1,32 +1,168 @@
 """
 LLM 기반 데이터 추출 모듈
 - 추출된 OCR 텍스트에서 구조화된 정보 추출
-- OpenAI 또는 Anthropic API 활용
+- OpenAI 또는 Anthropic API 활용 (테스트용 가짜 제공자 'fake' 지원)
 """
 
 import os
+import re
 import json
 import logging
 import time
-from typing import Dict, Any, List, Optional, Union
-import openai
+import asyncio
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, Union
+from openai import OpenAI
 from anthropic import Anthropic
+
+# 비동기 클라이언트 (동시 요청용, 지원하지 않는 SDK 버전이면 사용 불가)
+try:
+    from openai import AsyncOpenAI
+except ImportError:
+    AsyncOpenAI = None
+
+try:
+    from anthropic import AsyncAnthropic
+except ImportError:
+    AsyncAnthropic = None
 from src.core.config import config
 from src.extraction.field_config import FieldConfig
+from src.extraction._fake_llm import FakeLLMClient
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# JSON 파싱 (orjson이 있으면 C 구현 사용, 없으면 표준 json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# 필드 추출 시스템 프롬프트
+SYSTEM_PROMPT = "You are a document extraction specialist that always responds in valid JSON format."
+
+# 배치 작업 종료 상태 (OpenAI Batch API)
+_OPENAI_BATCH_FINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# 금액 필드에서 제거할 문자 (숫자와 소수점 이외)
+_AMOUNT_STRIP_RE = re.compile(r'[^\d.]')
+
+
+def _find_json_object(text: str) -> Optional[Tuple[int, int]]:
+    """
+    텍스트에서 가장 바깥쪽 JSON 객체 범위 탐색 (코드 블록이나 설명 문장이 섞여 있어도 한 번의 순회로 처리)
+    
+    Args:
+        text: LLM 응답 텍스트
+    
+    Returns:
+        (시작, 끝) 인덱스 (끝은 포함하지 않음), 객체가 없으면 None
+    """
+    start = text.find('{')
+    if start < 0:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    
+    for i in range(start, len(text)):
+        char = text[i]
+        
+        if in_string:
+            # 문자열 내부의 괄호는 무시 (이스케이프된 따옴표 처리)
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+    
+    return None
+
+
+def _loads_json_object(text: str) -> Dict[str, Any]:
+    """
+    LLM 응답에서 JSON 객체 파싱
+    
+    Args:
+        text: LLM 응답 텍스트
+    
+    Returns:
+        파싱된 객체
+    
+    Raises:
+        ValueError: JSON 객체가 없거나 파싱할 수 없는 경우
+    """
+    stripped = text.strip()
+    
+    # 응답 전체가 JSON 객체인 경우 (가장 흔한 경우) 범위 탐색 생략
+    if stripped.startswith('{') and stripped.endswith('}'):
+        json_part = stripped
+    else:
+        span = _find_json_object(text)
+        if span is None:
+            raise ValueError("응답에서 JSON 객체를 찾을 수 없습니다.")
+        json_part = text[span[0]:span[1]]
+    
+    try:
+        data = _json_loads(json_part)
+    except ValueError:
+        # orjson이 거부하는 표준 json 확장 (NaN 등) 처리
+        if _json_loads is json.loads:
+            raise
+        data = json.loads(json_part)
+    
+    if not isinstance(data, dict):
+        raise ValueError("응답 JSON이 객체가 아닙니다.")
+    
+    return data
+
+
+def _fields_fingerprint(fields: List[Dict[str, Any]]) -> Tuple:
+    """
+    필드 설명 생성에 쓰이는 속성만 모은 해시 가능한 필드 구성 키
+    
+    Args:
+        fields: 추출할 필드 목록
+    
+    Returns:
+        (이름, 유형, 컨텍스트, 정규식) 튜플의 튜플
+    """
+    return tuple(
+        (field['name'], field.get('type', 'text'), field.get('context', ''), field.get('regex', ''))
+        for field in fields
+    )
+
 
 class LLMProcessor:
     """LLM을 사용하여 OCR 텍스트에서 구조화된 데이터 추출"""
     
+    # (언어, 필드 구성)별 시스템 프롬프트 캐시 크기
+    SYSTEM_PROMPT_CACHE_SIZE = 64
+    
     def __init__(self):
         """초기화"""
         self.provider = config.get('extraction.llm.provider', 'openai')
         self.temperature = config.get('extraction.llm.temperature', 0.1)
         self.max_tokens = config.get('extraction.llm.max_tokens', 4000)
         
+        # 배치 API 설정 (결과 폴링 주기 및 최대 대기 시간, 초)
+        self.batch_poll_interval = config.get('extraction.llm.batch_poll_interval', 30)
+        self.batch_timeout = config.get('extraction.llm.batch_timeout', 24 * 3600)
+        
+        # 비동기 동시 요청 수
+        self.concurrency = config.get('extraction.llm.concurrency', 16)
+        
         # OpenAI 설정
         self.openai_api_key = config.get('extraction.llm.openai_api_key')
         self.openai_model = config.get('extraction.llm.openai_model', 'gpt-4')
@@ -38,6 +174,9 @@ class LLMProcessor:
         # 필드 설정 로드
         self.field_config = FieldConfig()
         
+        # 시스템 프롬프트 캐시 ((언어, 필드 구성 키) -> 문자열)
+        self._system_prompt_cache: OrderedDict = OrderedDict()
+        
         # API 클라이언트 초기화
         self._init_clients()
     
@@ -48,7 +187,8 @@ class LLMProcessor:
                 logger.warning("OpenAI API 키가 설정되지 않았습니다.")
                 return
             
-            openai.api_key = self.openai_api_key
+            # 재시도는 _call_llm에서 처리
+            self.openai_client = OpenAI(api_key=self.openai_api_key, max_retries=0)
             logger.info(f"OpenAI 클라이언트 초기화 (모델: {self.openai_model})")
         
         elif self.provider == 'anthropic':
@@ -58,6 +198,37 @@ class LLMProcessor:
             
             self.anthropic_client = Anthropic(api_key=self.anthropic_api_key)
             logger.info(f"Anthropic 클라이언트 초기화 (모델: {self.anthropic_model})")
+        
+        elif self.provider == 'fake':
+            # 외부 API 없이 고정 응답 반환 (테스트/CI용)
+            self.fake_client = FakeLLMClient(config.get('extraction.llm.fake_response'))
+            logger.info("가짜 LLM 클라이언트 초기화")
+    
+    def _get_async_client(self):
+        """
+        비동기 API 클라이언트 반환 (처음 사용할 때 생성, 요청 간 연결 풀 공유)
+        
+        Returns:
+            AsyncOpenAI 또는 AsyncAnthropic 클라이언트
+        """
+        client = getattr(self, '_async_client', None)
+        if client is not None:
+            return client
+        
+        # 재시도는 _call_llm_async에서 처리
+        if self.provider == 'openai':
+            if AsyncOpenAI is None:
+                raise RuntimeError("openai 패키지가 비동기 클라이언트를 지원하지 않습니다.")
+            client = AsyncOpenAI(api_key=self.openai_api_key, max_retries=0)
+        elif self.provider == 'anthropic':
+            if AsyncAnthropic is None:
+                raise RuntimeError("anthropic 패키지가 비동기 클라이언트를 지원하지 않습니다.")
+            client = AsyncAnthropic(api_key=self.anthropic_api_key, max_retries=0)
+        else:
+            raise ValueError(f"지원하지 않는 LLM 제공자: {self.provider}")
+        
+        self._async_client = client
+        return client
     
     def extract_fields(self, 
                       ocr_text: str, 
@@ -83,14 +254,56 @@ class LLMProcessor:
             fields = self.field_config.get_fields()
         
         try:
-            # 구체적인 필드 설명 및 컨텍스트 구성
-            field_descriptions = self._prepare_field_descriptions(fields, language)
+            # LLM에 전달할 프롬프트 구성 (지시와 필드 설명은 시스템 프롬프트, OCR 텍스트는 사용자 메시지)
+            system_prompt, user_prompt = self._get_prompts(ocr_text, fields, language)
+            
+            # LLM 호출
+            response = self._call_llm(system_prompt, user_prompt)
+            
+            # 응답 파싱
+            extracted_data = self._parse_response(response, fields)
             
-            # LLM에 전달할 프롬프트 구성
-            prompt = self._build_prompt(ocr_text, field_descriptions, language)
+            return {
+                'fields': extracted_data,
+                'raw_response': response
+            }
+        
+        except Exception as e:
+            logger.error(f"필드 추출 오류: {str(e)}")
+            return {
+                'fields': {},
+                'error': f'필드 추출 오류: {str(e)}'
+            }
+    
+    async def extract_fields_async(self, 
+                                  ocr_text: str, 
+                                  fields: Optional[List[Dict[str, Any]]] = None, 
+                                  language: str = 'jpn') -> Dict[str, Any]:
+        """
+        OCR 텍스트에서 필드 추출 (비동기 버전)
+        
+        Args:
+            ocr_text: OCR로 추출된 텍스트
+            fields: 추출할 필드 목록 (None이면 기본 필드 사용)
+            language: 텍스트 언어 코드
+        
+        Returns:
+            추출된 필드와 값
+        """
+        if not ocr_text:
+            logger.warning("추출할 텍스트가 없습니다.")
+            return {'fields': {}, 'error': '추출할 텍스트가 없습니다.'}
+        
+        # 필드 목록이 전달되지 않았으면 기본 필드 사용
+        if fields is None:
+            fields = self.field_config.get_fields()
+        
+        try:
+            # 프롬프트 구성
+            system_prompt, user_prompt = self._get_prompts(ocr_text, fields, language)
             
             # LLM 호출
-            response = self._call_llm(prompt)
+            response = await self._call_llm_async(system_prompt, user_prompt)
             
             # 응답 파싱
             extracted_data = self._parse_response(response, fields)
@@ -107,6 +320,199 @@ class LLMProcessor:
                 'error': f'필드 추출 오류: {str(e)}'
             }
     
+    async def gather_extract(self, 
+                            items: List[Tuple[str, Optional[List[Dict[str, Any]]], str]], 
+                            concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        여러 문서의 필드를 동시에 추출 (중간 규모 일괄 처리용, 대량 처리는 batch_extract_fields 사용)
+        
+        Args:
+            items: (OCR 텍스트, 필드 목록, 언어 코드) 목록 (필드 목록이 None이면 기본 필드 사용)
+            concurrency: 최대 동시 요청 수 (None이면 설정값 사용)
+        
+        Returns:
+            문서별 추출 결과 목록 (입력 순서)
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+        
+        async def _extract(ocr_text: str, fields: Optional[List[Dict[str, Any]]], language: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.extract_fields_async(ocr_text, fields, language)
+        
+        return await asyncio.gather(*(_extract(*item) for item in items))
+    
+    def batch_extract_fields(self, 
+                            items: List[Tuple[str, Optional[List[Dict[str, Any]]], str]]) -> List[Dict[str, Any]]:
+        """
+        여러 문서의 필드를 제공자 배치 API로 한 번에 추출 (대량 처리용, 결과가 나올 때까지 폴링)
+        
+        Args:
+            items: (OCR 텍스트, 필드 목록, 언어 코드) 목록 (필드 목록이 None이면 기본 필드 사용)
+        
+        Returns:
+            문서별 추출 결과 목록 (입력 순서, 항목 형식은 extract_fields와 동일)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        prompts: Dict[str, Tuple[str, str]] = {}
+        item_fields: Dict[str, List[Dict[str, Any]]] = {}
+        
+        # 문서별 프롬프트 구성 (custom_id는 입력 순서 인덱스)
+        for i, (ocr_text, fields, language) in enumerate(items):
+            if not ocr_text:
+                results[i] = {'fields': {}, 'error': '추출할 텍스트가 없습니다.'}
+                continue
+            
+            if fields is None:
+                fields = self.field_config.get_fields()
+            
+            prompts[str(i)] = self._get_prompts(ocr_text, fields, language)
+            item_fields[str(i)] = fields
+        
+        if not prompts:
+            return results
+        
+        try:
+            if self.provider == 'openai':
+                responses = self._batch_call_openai(prompts)
+            elif self.provider == 'anthropic':
+                responses = self._batch_call_anthropic(prompts)
+            else:
+                raise ValueError(f"지원하지 않는 LLM 제공자: {self.provider}")
+        
+        except Exception as e:
+            logger.error(f"배치 필드 추출 오류: {str(e)}")
+            for custom_id in prompts:
+                results[int(custom_id)] = {'fields': {}, 'error': f'필드 추출 오류: {str(e)}'}
+            return results
+        
+        # 응답 파싱 (요청 단위 실패는 해당 문서에만 오류 기록)
+        for custom_id in prompts:
+            response = responses.get(custom_id)
+            if isinstance(response, str):
+                results[int(custom_id)] = {
+                    'fields': self._parse_response(response, item_fields[custom_id]),
+                    'raw_response': response
+                }
+            else:
+                error = response.get('error') if isinstance(response, dict) else '배치 결과가 없습니다.'
+                results[int(custom_id)] = {'fields': {}, 'error': f'필드 추출 오류: {error}'}
+        
+        return results
+    
+    def _batch_call_openai(self, prompts: Dict[str, Tuple[str, str]]) -> Dict[str, Any]:
+        """
+        OpenAI Batch API 호출 (JSONL 파일 업로드 후 완료될 때까지 폴링)
+        
+        Args:
+            prompts: custom_id -> (시스템 프롬프트, 사용자 프롬프트)
+        
+        Returns:
+            custom_id -> 응답 텍스트 (요청 단위 실패는 {'error': ...})
+        """
+        # 요청 JSONL 구성
+        lines = []
+        for custom_id, (system_prompt, user_prompt) in prompts.items():
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.openai_model,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    "temperature": self.temperature,
+                    "max_tokens": self.max_tokens
+                }
+            }, ensure_ascii=False))
+        
+        input_file = self.openai_client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        batch = self.openai_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"OpenAI 배치 작업 생성: {batch.id} ({len(prompts)}건)")
+        
+        # 완료 대기
+        deadline = time.monotonic() + self.batch_timeout
+        while batch.status not in _OPENAI_BATCH_FINAL_STATES:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"OpenAI 배치 작업 시간 초과: {batch.id}")
+            time.sleep(self.batch_poll_interval)
+            batch = self.openai_client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed":
+            raise RuntimeError(f"OpenAI 배치 작업 실패: {batch.id} ({batch.status})")
+        
+        # 결과 매핑 (출력 파일은 요청 순서를 보장하지 않으므로 custom_id 기준)
+        responses: Dict[str, Any] = {}
+        
+        if batch.output_file_id:
+            output = self.openai_client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                body = (record.get("response") or {}).get("body") or {}
+                if record.get("error") or not body.get("choices"):
+                    responses[record["custom_id"]] = {'error': record.get("error") or body.get("error")}
+                else:
+                    responses[record["custom_id"]] = body["choices"][0]["message"]["content"].strip()
+        
+        return responses
+    
+    def _batch_call_anthropic(self, prompts: Dict[str, Tuple[str, str]]) -> Dict[str, Any]:
+        """
+        Anthropic Message Batches API 호출 (처리가 끝날 때까지 폴링)
+        
+        Args:
+            prompts: custom_id -> (시스템 프롬프트, 사용자 프롬프트)
+        
+        Returns:
+            custom_id -> 응답 텍스트 (요청 단위 실패는 {'error': ...})
+        """
+        batch = self.anthropic_client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": custom_id,
+                    "params": {
+                        "model": self.anthropic_model,
+                        "system": self._anthropic_system(system_prompt),
+                        "messages": [{"role": "user", "content": user_prompt}],
+                        "temperature": self.temperature,
+                        "max_tokens": self.max_tokens
+                    }
+                }
+                for custom_id, (system_prompt, user_prompt) in prompts.items()
+            ]
+        )
+        logger.info(f"Anthropic 배치 작업 생성: {batch.id} ({len(prompts)}건)")
+        
+        # 완료 대기
+        deadline = time.monotonic() + self.batch_timeout
+        while batch.processing_status != "ended":
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Anthropic 배치 작업 시간 초과: {batch.id}")
+            time.sleep(self.batch_poll_interval)
+            batch = self.anthropic_client.messages.batches.retrieve(batch.id)
+        
+        # 결과 매핑
+        responses: Dict[str, Any] = {}
+        
+        for entry in self.anthropic_client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                responses[entry.custom_id] = entry.result.message.content[0].text.strip()
+            else:
+                error = getattr(entry.result, 'error', None)
+                responses[entry.custom_id] = {'error': str(error) if error else entry.result.type}
+        
+        return responses
+    
     def _prepare_field_descriptions(self, 
                                   fields: List[Dict[str, Any]], 
                                   language: str) -> str:
@@ -157,12 +563,41 @@ class LLMProcessor:
         
         return "\n\n".join(descriptions)
     
+    def _get_prompts(self, 
+                    ocr_text: str, 
+                    fields: List[Dict[str, Any]], 
+                    language: str) -> Tuple[str, str]:
+        """
+        시스템/사용자 프롬프트 반환 (같은 언어와 필드 구성의 시스템 프롬프트는 재사용)
+        
+        Args:
+            ocr_text: OCR로 추출된 텍스트
+            fields: 추출할 필드 목록
+            language: 텍스트 언어 코드
+        
+        Returns:
+            (시스템 프롬프트, 사용자 프롬프트) 튜플
+        """
+        cache_key = (language, _fields_fingerprint(fields))
+        system_prompt = self._system_prompt_cache.get(cache_key)
+        
+        if system_prompt is None:
+            field_descriptions = self._prepare_field_descriptions(fields, language)
+            system_prompt = self._build_system_prompt(field_descriptions, language)
+            self._system_prompt_cache[cache_key] = system_prompt
+            if len(self._system_prompt_cache) > self.SYSTEM_PROMPT_CACHE_SIZE:
+                self._system_prompt_cache.popitem(last=False)
+        else:
+            self._system_prompt_cache.move_to_end(cache_key)
+        
+        return system_prompt, self._build_user_prompt(ocr_text)
+    
     def _build_prompt(self, 
                     ocr_text: str, 
                     field_descriptions: str, 
-                    language: str) -> str:
+                    language: str) -> Tuple[str, str]:
         """
-        LLM 프롬프트 구성
+        LLM 프롬프트 구성 (고정 부분과 문서별 부분을 분리해 제공자 프롬프트 캐시 활용)
         
         Args:
             ocr_text: OCR로 추출된 텍스트
@@ -170,7 +605,23 @@ class LLMProcessor:
             language: 텍스트 언어 코드
         
         Returns:
-            LLM에 전달할 프롬프트
+            (시스템 프롬프트, 사용자 프롬프트) 튜플
+        """
+        return (
+            self._build_system_prompt(field_descriptions, language),
+            self._build_user_prompt(ocr_text)
+        )
+    
+    def _build_system_prompt(self, field_descriptions: str, language: str) -> str:
+        """
+        시스템 프롬프트 구성 (지시, 필드 설명, 추출 규칙, 응답 형식)
+        
+        Args:
+            field_descriptions: 필드 설명 문자열
+            language: 텍스트 언어 코드
+        
+        Returns:
+            시스템 프롬프트
         """
         # 언어별 지시 조정
         language_instructions = {
@@ -184,7 +635,9 @@ class LLMProcessor:
         instruction = language_instructions.get(language, language_instructions['eng'])
         
         # 프롬프트 구성
-        prompt = f"""# 문서 필드 추출
+        prompt = f"""{SYSTEM_PROMPT}
+
+# 문서 필드 추출
 
 {instruction}
 
@@ -198,30 +651,54 @@ class LLMProcessor:
 4. 여러 비슷한 값이 있으면, 문서 문맥에 가장 적합한 것을 선택하세요.
 5. 응답은 JSON 형식으로 제공하세요.
 
-## OCR로 추출된 텍스트
-```
-{ocr_text}
-```
-
 ## 응답 형식
 다음과 같은, 필드 이름과 해당 값으로 이루어진 JSON 형식으로 응답하세요:
 ```json
-{
+{{
   "필드1": "값1",
   "필드2": "값2",
   ...
-}
+}}
 ```
 JSON만 반환하고 다른 설명은 포함하지 마세요."""
 
         return prompt
     
-    def _call_llm(self, prompt: str) -> str:
+    def _build_user_prompt(self, ocr_text: str) -> str:
+        """
+        사용자 프롬프트 구성 (문서별로 바뀌는 OCR 텍스트만 포함)
+        
+        Args:
+            ocr_text: OCR로 추출된 텍스트
+        
+        Returns:
+            사용자 프롬프트
+        """
+        return f"""## OCR로 추출된 텍스트
+```
+{ocr_text}
+```"""
+    
+    @staticmethod
+    def _anthropic_system(system_prompt: str) -> List[Dict[str, Any]]:
+        """
+        Anthropic 시스템 블록 구성 (시스템 프롬프트를 캐시 지점으로 지정)
+        
+        Args:
+            system_prompt: 시스템 프롬프트
+        
+        Returns:
+            Anthropic system 파라미터
+        """
+        return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+    
+    def _call_llm(self, system_prompt: str, user_prompt: str) -> str:
         """
         LLM API 호출
         
         Args:
-            prompt: LLM에 전달할 프롬프트
+            system_prompt: 시스템 프롬프트 (지시 및 필드 설명)
+            user_prompt: 사용자 프롬프트 (OCR 텍스트)
         
         Returns:
             LLM 응답 텍스트
@@ -232,9 +709,11 @@ JSON만 반환하고 다른 설명은 포함하지 마세요."""
         for attempt in range(max_retries):
             try:
                 if self.provider == 'openai':
-                    return self._call_openai(prompt)
+                    return self._call_openai(system_prompt, user_prompt)
                 elif self.provider == 'anthropic':
-                    return self._call_anthropic(prompt)
+                    return self._call_anthropic(system_prompt, user_prompt)
+                elif self.provider == 'fake':
+                    return self._call_fake(system_prompt, user_prompt)
                 else:
                     raise ValueError(f"지원하지 않는 LLM 제공자: {self.provider}")
             
@@ -247,21 +726,56 @@ JSON만 반환하고 다른 설명은 포함하지 마세요."""
                 else:
                     raise
     
-    def _call_openai(self, prompt: str) -> str:
+    async def _call_llm_async(self, system_prompt: str, user_prompt: str) -> str:
+        """
+        LLM API 호출 (비동기 버전, 재시도 대기 중에도 다른 요청 진행)
+        
+        Args:
+            system_prompt: 시스템 프롬프트 (지시 및 필드 설명)
+            user_prompt: 사용자 프롬프트 (OCR 텍스트)
+        
+        Returns:
+            LLM 응답 텍스트
+        """
+        max_retries = 3
+        retry_delay = 2
+        
+        for attempt in range(max_retries):
+            try:
+                if self.provider == 'openai':
+                    return await self._call_openai_async(system_prompt, user_prompt)
+                elif self.provider == 'anthropic':
+                    return await self._call_anthropic_async(system_prompt, user_prompt)
+                elif self.provider == 'fake':
+                    return self._call_fake(system_prompt, user_prompt)
+                else:
+                    raise ValueError(f"지원하지 않는 LLM 제공자: {self.provider}")
+            
+            except Exception as e:
+                logger.warning(f"LLM API 호출 오류 (시도 {attempt+1}/{max_retries}): {str(e)}")
+                
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 2  # 지수 백오프
+                else:
+                    raise
+    
+    def _call_openai(self, system_prompt: str, user_prompt: str) -> str:
         """
         OpenAI API 호출
         
         Args:
-            prompt: LLM에 전달할 프롬프트
+            system_prompt: 시스템 프롬프트 (지시 및 필드 설명)
+            user_prompt: 사용자 프롬프트 (OCR 텍스트)
         
         Returns:
             LLM 응답 텍스트
         """
-        response = openai.ChatCompletion.create(
+        response = self.openai_client.chat.completions.create(
             model=self.openai_model,
             messages=[
-                {"role": "system", "content": "You are a document extraction specialist that always responds in valid JSON format."},
-                {"role": "user", "content": prompt}
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
             ],
             temperature=self.temperature,
             max_tokens=self.max_tokens
@@ -269,21 +783,95 @@ JSON만 반환하고 다른 설명은 포함하지 마세요."""
         
         return response.choices[0].message.content.strip()
     
-    def _call_anthropic(self, prompt: str) -> str:
+    def _call_anthropic(self, system_prompt: str, user_prompt: str) -> str:
         """
         Anthropic API 호출
         
         Args:
-            prompt: LLM에 전달할 프롬프트
+            system_prompt: 시스템 프롬프트 (지시 및 필드 설명)
+            user_prompt: 사용자 프롬프트 (OCR 텍스트)
         
         Returns:
             LLM 응답 텍스트
         """
         response = self.anthropic_client.messages.create(
             model=self.anthropic_model,
-            system="You are a document extraction specialist that always responds in valid JSON format.",
+            system=self._anthropic_system(system_prompt),
             messages=[
-                {"role": "user", "content": prompt}
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=self.temperature,
+            max_tokens=self.max_tokens
+        )
+        
+        return response.content[0].text.strip()
+    
+    def _call_fake(self, system_prompt: str, user_prompt: str) -> str:
+        """
+        가짜 LLM 클라이언트 호출 (네트워크 없음, 비동기 경로에서도 그대로 사용)
+        
+        Args:
+            system_prompt: 시스템 프롬프트 (지시 및 필드 설명)
+            user_prompt: 사용자 프롬프트 (OCR 텍스트)
+        
+        Returns:
+            고정 응답 텍스트
+        """
+        client = getattr(self, 'fake_client', None)
+        if client is None:
+            client = self.fake_client = FakeLLMClient(config.get('extraction.llm.fake_response'))
+        
+        response = client.chat.completions.create(
+            model='fake',
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=self.temperature,
+            max_tokens=self.max_tokens
+        )
+        
+        return response.choices[0].message.content.strip()
+    
+    async def _call_openai_async(self, system_prompt: str, user_prompt: str) -> str:
+        """
+        OpenAI API 호출 (비동기 버전)
+        
+        Args:
+            system_prompt: 시스템 프롬프트 (지시 및 필드 설명)
+            user_prompt: 사용자 프롬프트 (OCR 텍스트)
+        
+        Returns:
+            LLM 응답 텍스트
+        """
+        response = await self._get_async_client().chat.completions.create(
+            model=self.openai_model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=self.temperature,
+            max_tokens=self.max_tokens
+        )
+        
+        return response.choices[0].message.content.strip()
+    
+    async def _call_anthropic_async(self, system_prompt: str, user_prompt: str) -> str:
+        """
+        Anthropic API 호출 (비동기 버전)
+        
+        Args:
+            system_prompt: 시스템 프롬프트 (지시 및 필드 설명)
+            user_prompt: 사용자 프롬프트 (OCR 텍스트)
+        
+        Returns:
+            LLM 응답 텍스트
+        """
+        response = await self._get_async_client().messages.create(
+            model=self.anthropic_model,
+            system=self._anthropic_system(system_prompt),
+            messages=[
+                {"role": "user", "content": user_prompt}
             ],
             temperature=self.temperature,
             max_tokens=self.max_tokens
@@ -304,17 +892,8 @@ JSON만 반환하고 다른 설명은 포함하지 마세요."""
         Returns:
             추출된 필드와 값
         """
-        # JSON 코드 블록 추출 (```json ... ``` 형식인 경우)
-        if "```json" in response and "```" in response.split("```json", 1)[1]:
-            json_part = response.split("```json", 1)[1].split("```", 1)[0].strip()
-        # JSON 코드 블록 추출 (``` ... ``` 형식인 경우)
-        elif "```" in response and "```" in response.split("```", 1)[1]:
-            json_part = response.split("```", 1)[1].split("```", 1)[0].strip()
-        else:
-            json_part = response.strip()
-        
         try:
-            extracted_data = json.loads(json_part)
+            extracted_data = _loads_json_object(response)
             
             # 필드 유형에 따른 후처리
             processed_data = {}
@@ -339,8 +918,7 @@ JSON만 반환하고 다른 설명은 포함하지 마세요."""
                 elif field_type == 'amount' and value:
                     # 숫자만 유지
                     if isinstance(value, str):
-                        import re
-                        value = re.sub(r'[^\d.]', '', value)
+                        value = _AMOUNT_STRIP_RE.sub('', value)
                         try:
                             value = float(value)
                         except ValueError:
@@ -352,6 +930,6 @@ JSON만 반환하고 다른 설명은 포함하지 마세요."""
             
             return processed_data
         
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"JSON 파싱 오류: {str(e)}, 응답: {response}")
             return {}
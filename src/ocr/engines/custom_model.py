@@ -6,7 +6,8 @@
 
 import os
 import logging
-from typing import Dict, Any, Optional, Union, List
+import functools
+from typing import Dict, Any, Optional, Union, List, Tuple
 import numpy as np
 from PIL import Image
 import torch
@@ -19,6 +20,87 @@ from src.ocr.engines.base import BaseOCREngine
 logger = logging.getLogger(__name__)
 
 
+# 로컬 모델이 없을 때 사용할 Hugging Face 모델
+_HF_JAPANESE_MODEL = "microsoft/trocr-base-japanese"
+_HF_PRINTED_MODEL = "microsoft/trocr-base-printed"
+
+
+def _trocr_model_paths() -> Dict[str, str]:
+    """
+    설정된 언어별 TrOCR 모델 경로 반환 (로컬 모델이 없으면 Hugging Face 모델)
+    
+    Returns:
+        언어 코드 -> 모델 경로
+    """
+    model_dir = config.get('ocr.model_dir', './models')
+    
+    # 지원 언어 목록
+    languages = config.get('ocr.supported_languages', {
+        'jpn': '일본어',
+        'eng': '영어',
+        'kor': '한국어',
+        'chi_sim': '중국어 간체',
+        'chi_tra': '중국어 번체'
+    }).keys()
+    
+    paths = {}
+    for lang in languages:
+        if lang == 'jpn':
+            # 일본어 모델
+            path = os.path.join(model_dir, 'trocr', 'japanese')
+            if not os.path.exists(path):
+                logger.info(f"로컬에 일본어 TrOCR 모델이 없어 Hugging Face에서 다운로드합니다.")
+                path = _HF_JAPANESE_MODEL
+            paths[lang] = path
+        
+        elif lang == 'eng':
+            # 영어 모델
+            path = os.path.join(model_dir, 'trocr', 'printed')
+            if not os.path.exists(path):
+                logger.info(f"로컬에 영어 TrOCR 모델이 없어 Hugging Face에서 다운로드합니다.")
+                path = _HF_PRINTED_MODEL
+            paths[lang] = path
+    
+    # 다른 언어 (아직 공식 모델이 없는 경우 영어 모델 활용)
+    for lang in languages:
+        if lang in ['kor', 'chi_sim', 'chi_tra']:
+            path = os.path.join(model_dir, 'trocr', lang)
+            if not os.path.exists(path):
+                logger.warning(f"{lang}용 TrOCR 모델이 없어 영어 모델로 대체합니다.")
+                path = paths.get('eng', _HF_PRINTED_MODEL)
+            paths[lang] = path
+    
+    return paths
+
+
+@functools.lru_cache(maxsize=None)
+def _load_trocr(model_path: str) -> Tuple[TrOCRProcessor, VisionEncoderDecoderModel]:
+    """
+    TrOCR 처리기와 모델을 CPU에 로드 (경로별로 프로세스당 한 번)
+    
+    Args:
+        model_path: 로컬 경로 또는 Hugging Face 모델 이름
+    
+    Returns:
+        (처리기, 모델)
+    """
+    return TrOCRProcessor.from_pretrained(model_path), VisionEncoderDecoderModel.from_pretrained(model_path)
+
+
+def preload_models() -> None:
+    """
+    TrOCR 가중치를 CPU에 미리 로드
+    
+    CUDA를 초기화하지 않으므로 fork 전 부모 프로세스에서 호출해 작업자 간 가중치 메모리를
+    공유할 수 있음 (장치 이동은 작업자에서 CustomModelEngine 생성 시 진행)
+    """
+    for lang, model_path in _trocr_model_paths().items():
+        try:
+            _load_trocr(model_path)
+        except Exception as e:
+            logger.error(f"TrOCR {lang} 모델 로드 오류: {e}")
+
+
 class CustomModelEngine(BaseOCREngine):
     """TrOCR 기반 커스텀 OCR 엔진"""
     
@@ -37,79 +119,16 @@ class CustomModelEngine(BaseOCREngine):
         self._initialize_models()
     
     def _initialize_models(self):
-        """언어별 TrOCR 모델 초기화"""
-        model_dir = config.get('ocr.model_dir', './models')
-        
-        # 지원 언어 목록
-        languages = config.get('ocr.supported_languages', {
-            'jpn': '일본어',
-            'eng': '영어',
-            'kor': '한국어',
-            'chi_sim': '중국어 간체',
-            'chi_tra': '중국어 번체'
-        }).keys()
-        
-        # 언어별 모델 로드
-        for lang in languages:
+        """언어별 TrOCR 모델 초기화 (CPU에 로드된 공유 모델을 실행 장치로 이동)"""
+        for lang, model_path in _trocr_model_paths().items():
             try:
-                if lang == 'jpn':
-                    # 일본어 모델
-                    processor_path = os.path.join(model_dir, 'trocr', 'japanese')
-                    model_path = processor_path
-                    
-                    # 모델 파일이 없으면 Hugging Face에서 직접 로드
-                    if not os.path.exists(model_path):
-                        logger.info(f"로컬에 일본어 TrOCR 모델이 없어 Hugging Face에서 다운로드합니다.")
-                        processor_path = "microsoft/trocr-base-japanese"
-                        model_path = "microsoft/trocr-base-japanese"
-                    
-                    self.processors[lang] = TrOCRProcessor.from_pretrained(processor_path)
-                    self.models[lang] = VisionEncoderDecoderModel.from_pretrained(model_path)
-                    self.models[lang].to(self.device)
-                    logger.info(f"일본어 TrOCR 모델 로드 완료")
-                
-                elif lang == 'eng':
-                    # 영어 모델
-                    processor_path = os.path.join(model_dir, 'trocr', 'printed')
-                    model_path = processor_path
-                    
-                    # 모델 파일이 없으면 Hugging Face에서 직접 로드
-                    if not os.path.exists(model_path):
-                        logger.info(f"로컬에 영어 TrOCR 모델이 없어 Hugging Face에서 다운로드합니다.")
-                        processor_path = "microsoft/trocr-base-printed"
-                        model_path = "microsoft/trocr-base-printed"
-                    
-                    self.processors[lang] = TrOCRProcessor.from_pretrained(processor_path)
-                    self.models[lang] = VisionEncoderDecoderModel.from_pretrained(model_path)
-                    self.models[lang].to(self.device)
-                    logger.info(f"영어 TrOCR 모델 로드 완료")
+                processor, model = _load_trocr(model_path)
+                model.to(self.device)
                 
-                # 다른 언어에 대한 모델 로드 로직 추가 (아직 공식 모델이 없는 경우 영어 모델 활용)
-                elif lang in ['kor', 'chi_sim', 'chi_tra']:
-                    # 해당 언어 전용 모델이 있는지 확인
-                    lang_path = os.path.join(model_dir, 'trocr', lang)
-                    
-                    if os.path.exists(lang_path):
-                        # 언어별 특화 모델이 있으면 로드
-                        self.processors[lang] = TrOCRProcessor.from_pretrained(lang_path)
-                        self.models[lang] = VisionEncoderDecoderModel.from_pretrained(lang_path)
-                        self.models[lang].to(self.device)
-                        logger.info(f"{lang} TrOCR 모델 로드 완료")
-                    else:
-                        # 없으면 영어 모델 대체 사용
-                        logger.warning(f"{lang}용 TrOCR 모델이 없어 영어 모델로 대체합니다.")
-                        if 'eng' not in self.processors:
-                            # 영어 모델도 없으면 로드
-                            processor_path = "microsoft/trocr-base-printed"
-                            model_path = "microsoft/trocr-base-printed"
-                            
-                            self.processors['eng'] = TrOCRProcessor.from_pretrained(processor_path)
-                            self.models['eng'] = VisionEncoderDecoderModel.from_pretrained(model_path)
-                            self.models['eng'].to(self.device)
-                        
-                        # 영어 모델 복사
-                        self.processors[lang] = self.processors['eng']
-                        self.models[lang] = self.models['eng']
+                # 같은 경로를 쓰는 언어(영어 모델 대체 등)는 같은 객체를 공유
+                self.processors[lang] = processor
+                self.models[lang] = model
+                logger.info(f"{lang} TrOCR 모델 로드 완료 ({model_path})")
             
             except Exception as e:
                 logger.error(f"TrOCR {lang} 모델 로드 오류: {e}")
@@ -5,7 +5,6 @@ OCR 엔진 앙상블 모듈
 - 캐싱 지원
 """
 
-import io
 import json
 import hashlib
 import logging
@@ -27,6 +26,15 @@ from src.ocr.postprocessor import PostProcessor
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 캐시 직렬화 (orjson이 있으면 C 구현 사용, 없으면 표준 json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = lambda obj: json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
 
 class OCREngine:
     """OCR 엔진 앙상블 클래스"""
@@ -50,11 +58,15 @@ class OCREngine:
         # 신뢰도 임계값
         self.confidence_threshold = config.get('ocr.confidence_threshold', 0.85)
         
+        # 조기 종료 신뢰도 (언어 지정 시, None이면 항상 모든 엔진 결과를 기다림)
+        self.early_exit_threshold = config.get('ocr.early_exit_confidence', 0.95)
+        
         # 특수 항목 처리
         special_config = {
             'detect_stamps': config.get('ocr.special_items.detect_stamps', True),
             'detect_handwriting': config.get('ocr.special_items.detect_handwriting', True),
-            'detect_strikethrough': config.get('ocr.special_items.detect_strikethrough', True)
+            'detect_strikethrough': config.get('ocr.special_items.detect_strikethrough', True),
+            'high_quality_denoise': config.get('ocr.special_items.high_quality_denoise', False)
         }
         self.special_detector = SpecialItemDetector(special_config)
         
@@ -128,9 +140,14 @@ class OCREngine:
         Returns:
             인식 결과
         """
-        # 캐시 확인
+        # 캐시 키는 한 번만 계산해 조회/저장에 공유
+        cache_key = None
         if use_cache and self.cache_enabled:
-            cache_result = self._check_cache(image, lang)
+            cache_key = self._cache_key(image, lang)
+        
+        # 캐시 확인
+        if cache_key:
+            cache_result = self._check_cache(cache_key)
             if cache_result:
                 logger.info("캐시에서 OCR 결과 로드")
                 return cache_result
@@ -161,8 +178,8 @@ class OCREngine:
         processed_result = self.post_processor.process(ensemble_result)
         
         # 캐시에 저장
-        if use_cache and self.cache_enabled:
-            self._save_to_cache(image, lang, processed_result)
+        if cache_key:
+            self._save_to_cache(cache_key, processed_result)
         
         return processed_result
     
@@ -179,6 +196,10 @@ class OCREngine:
         Returns:
             엔진별 인식 결과
         """
+        # 언어가 지정되면 충분히 확실한 결과가 먼저 나오는 즉시 반환
+        if lang and self.early_exit_threshold is not None and len(self.engines) > 1:
+            return await self._run_ocr_engines_early_exit(image, lang)
+        
         # 각 엔진의 인식 태스크 생성
         tasks = []
         for engine_name, engine in self.engines.items():
@@ -198,6 +219,51 @@ class OCREngine:
         
         return engine_results
     
+    async def _run_ocr_engines_early_exit(self, 
+                                         image: Image.Image, 
+                                         lang: str) -> Dict[str, Dict[str, Any]]:
+        """
+        모든 OCR 엔진을 병렬 실행하되, 지정 언어의 고신뢰도 결과가 나오면 나머지 엔진 취소
+        
+        Args:
+            image: PIL 이미지
+            lang: 언어 코드
+        
+        Returns:
+            엔진별 인식 결과 (조기 종료 시 해당 엔진 결과만 포함)
+        """
+        # 태스크 -> 엔진 이름
+        tasks = {
+            asyncio.create_task(self._run_single_engine(engine_name, engine, image, lang)): engine_name
+            for engine_name, engine in self.engines.items()
+        }
+        
+        engine_results = {}
+        pending = set(tasks)
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                
+                for task in done:
+                    engine_name = tasks[task]
+                    result = task.result()
+                    engine_results[engine_name] = result
+                    
+                    if (result.get('language') == lang and 
+                            result.get('confidence', 0.0) >= self.early_exit_threshold and
+                            result.get('text', '').strip()):
+                        logger.debug(f"{engine_name} 결과로 조기 종료 (취소된 엔진 {len(pending)}개)")
+                        return {engine_name: result}
+        
+        finally:
+            # 조기 종료 또는 호출 측 취소 시 남은 엔진 취소
+            for task in pending:
+                task.cancel()
+        
+        # 완료 순서와 무관하게 엔진 설정 순서로 정렬
+        return {name: engine_results[name] for name in self.engines if name in engine_results}
+    
     async def _run_single_engine(self, 
                                engine_name: str, 
                                engine: BaseOCREngine, 
@@ -348,69 +414,73 @@ class OCREngine:
         Returns:
             이미지 해시 문자열
         """
-        # 이미지를 바이트로 변환
-        img_byte_arr = io.BytesIO()
-        image.save(img_byte_arr, format='JPEG', quality=95)
-        img_bytes = img_byte_arr.getvalue()
-        
-        # MD5 해시 계산
-        return hashlib.md5(img_bytes).hexdigest()
+        # JPEG 인코딩 없이 원시 픽셀 데이터를 직접 해시 (크기/모드 포함)
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{image.size}:{image.mode}".encode())
+        hasher.update(image.tobytes())
+        return hasher.hexdigest()
     
-    def _check_cache(self, 
-                    image: Image.Image, 
-                    lang: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    def _cache_key(self, image: Image.Image, lang: Optional[str] = None) -> Optional[str]:
         """
-        캐시에서 OCR 결과 확인
+        OCR 결과 캐시 키 생성
         
         Args:
             image: PIL 이미지
             lang: 언어 코드
         
         Returns:
-            캐시된 OCR 결과 (없으면 None)
+            캐시 키 (캐시를 사용할 수 없거나 오류 시 None)
         """
         if not self.cache_enabled or not self.cache:
             return None
         
         try:
-            # 캐시 키 생성
             image_hash = self._calculate_image_hash(image)
             lang_suffix = lang or 'auto'
-            cache_key = f"ocr:{image_hash}:{lang_suffix}"
-            
+            return f"ocr:{image_hash}:{lang_suffix}"
+        
+        except Exception as e:
+            logger.warning(f"캐시 키 생성 오류: {e}")
+            return None
+    
+    def _check_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시에서 OCR 결과 확인
+        
+        Args:
+            cache_key: 캐시 키
+        
+        Returns:
+            캐시된 OCR 결과 (없으면 None)
+        """
+        if not self.cache_enabled or not self.cache:
+            return None
+        
+        try:
             # 캐시 확인
             cached_data = self.cache.get(cache_key)
             if not cached_data:
                 return None
             
             # JSON 파싱
-            return json.loads(cached_data)
+            return _json_loads(cached_data)
         
         except Exception as e:
             logger.warning(f"캐시 확인 오류: {e}")
             return None
     
-    def _save_to_cache(self, 
-                      image: Image.Image, 
-                      lang: Optional[str], 
-                      result: Dict[str, Any]) -> None:
+    def _save_to_cache(self, cache_key: str, result: Dict[str, Any]) -> None:
         """
         OCR 결과를 캐시에 저장
         
         Args:
-            image: PIL 이미지
-            lang: 언어 코드
+            cache_key: 캐시 키
             result: OCR 결과
         """
         if not self.cache_enabled or not self.cache:
             return
         
         try:
-            # 캐시 키 생성
-            image_hash = self._calculate_image_hash(image)
-            lang_suffix = lang or 'auto'
-            cache_key = f"ocr:{image_hash}:{lang_suffix}"
-            
             # 디버깅용 세부 결과는 캐시에서 제외
             cache_result = result.copy()
             if 'engine_results' in cache_result:
@@ -420,7 +490,7 @@ class OCREngine:
             self.cache.setex(
                 cache_key,
                 self.cache_ttl,
-                json.dumps(cache_result)
+                _json_dumps(cache_result)
             )
             
             logger.debug(f"OCR 결과 캐시 저장: {cache_key}")
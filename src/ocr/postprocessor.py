@@ -7,6 +7,7 @@ OCR 텍스트 후처리 모듈
 
 import re
 import logging
+import threading
 from typing import Dict, Any, List, Optional, Union, Tuple
 import unicodedata
 
@@ -40,6 +41,257 @@ except ImportError:
     logger.warning("NLTK 라이브러리가 설치되지 않았습니다. 텍스트 분석 기능이 제한됩니다.")
 
 
+# 비즈니스 문서 패턴
+_BUSINESS_PATTERN_RULES = {
+    'jpn': {
+        'date': [
+            # 일본식 날짜 패턴 (2023年1月1日 → 2023年01月01日)
+            (r'(\d{4})年(\d{1})月(\d{1})日', r'\1年0\2月0\3日'),  # 2023年1月1日
+            (r'(\d{4})年(\d{2})月(\d{1})日', r'\1年\2月0\3日'),   # 2023年01月1日
+            (r'(\d{4})年(\d{1})月(\d{2})日', r'\1年0\2月\3日'),   # 2023年1月01日
+
+            # 令和/平成/昭和 연호
+            (r'(令和|平成|昭和)(\d{1})年(\d{1})月(\d{1})日', r'\1\2年0\3月0\4日'),
+            (r'(令和|平成|昭和)(\d{2})年(\d{1})月(\d{1})日', r'\1\2年0\3月0\4日')
+        ],
+        'amount': [
+            # 일본식 금액 정규화 (¥1000 → ¥1,000)
+            (r'¥\s*(\d{4,})', lambda m: f"¥{int(m.group(1)):,}"),
+            (r'(\d{4,})\s*円', lambda m: f"{int(m.group(1)):,}円")
+        ],
+        'company': [
+            # 회사명 패턴 정규화
+            (r'株式含社', r'株式会社'),
+            (r'株式会杜', r'株式会社'),
+            (r'株式會社', r'株式会社'),
+            (r'有恨会社', r'有限会社'),
+            (r'含同会社', r'合同会社')
+        ],
+        'postcode': [
+            # 우편번호 패턴 정규화
+            (r'〒\s*(\d{3})\s*[-−]\s*(\d{4})', r'〒\1-\2')
+        ]
+    },
+    'kor': {
+        'date': [
+            # 한국식 날짜 패턴 정규화
+            (r'(\d{4})년\s*(\d{1})월\s*(\d{1})일', r'\1년 0\2월 0\3일'),
+            (r'(\d{4})년\s*(\d{2})월\s*(\d{1})일', r'\1년 \2월 0\3일'),
+            (r'(\d{4})년\s*(\d{1})월\s*(\d{2})일', r'\1년 0\2월 \3일'),
+
+            # 표준 날짜 형식
+            (r'(\d{4})[./-](\d{1})[./-](\d{1})', r'\1-0\2-0\3'),
+            (r'(\d{4})[./-](\d{2})[./-](\d{1})', r'\1-\2-0\3'),
+            (r'(\d{4})[./-](\d{1})[./-](\d{2})', r'\1-0\2-\3')
+        ],
+        'amount': [
+            # 한국식 금액 정규화
+            (r'₩\s*(\d{4,})', lambda m: f"₩{int(m.group(1)):,}"),
+            (r'(\d{4,})\s*원', lambda m: f"{int(m.group(1)):,}원")
+        ],
+        'company': [
+            # 회사명 패턴 정규화
+            (r'(주)\s*식\s*회\s*사', r'(주)'),
+            (r'주\s*식\s*회\s*사', r'주식회사')
+        ],
+        'registration': [
+            # 사업자등록번호 패턴 정규화
+            (r'(\d{3})\s*[-−]?\s*(\d{2})\s*[-−]?\s*(\d{5})', r'\1-\2-\3')
+        ]
+    },
+    'eng': {
+        'date': [
+            # 영어 날짜 패턴 정규화
+            (r'(\w{3})\s+(\d{1}),\s+(\d{4})', r'\1 0\2, \3'),  # Jan 1, 2023
+            (r'(\d{1})/(\d{1})/(\d{4})', r'0\1/0\2/\3'),       # 1/1/2023
+            (r'(\d{1})/(\d{2})/(\d{4})', r'0\1/\2/\3'),        # 1/01/2023
+            (r'(\d{2})/(\d{1})/(\d{4})', r'\1/0\2/\3')         # 01/1/2023
+        ],
+        'amount': [
+            # 영어 금액 정규화
+            (r'\$\s*(\d{4,})', lambda m: f"${int(m.group(1)):,}"),
+            (r'(\d{4,})\s*USD', lambda m: f"{int(m.group(1)):,} USD")
+        ],
+        'company': [
+            # 회사명 패턴 정규화
+            (r'Inc\b\.?', r'Inc.'),
+            (r'Corp\b\.?', r'Corp.'),
+            (r'Ltd\b\.?', r'Ltd.'),
+            (r'LLC\b\.?', r'LLC'),
+            (r'LLP\b\.?', r'LLP')
+        ]
+    }
+}
+
+_BUSINESS_PATTERNS = {
+    lang: {
+        pattern_type: [(re.compile(pattern), replacement) for pattern, replacement in patterns]
+        for pattern_type, patterns in rules.items()
+    }
+    for lang, rules in _BUSINESS_PATTERN_RULES.items()
+}
+
+# 공통 정규화 패턴 (공백/줄바꿈 정리는 _normalize_common에서 str.split으로 처리)
+_COMMON_PATTERNS = {
+    'email': [
+        # 이메일 형식 정규화
+        (re.compile(r'([a-zA-Z0-9_.+-]+)@([a-zA-Z0-9-]+)\.([a-zA-Z0-9-.]+)'), 
+         lambda m: f"{m.group(1)}@{m.group(2)}.{m.group(3).lower()}")
+    ]
+}
+
+# 언어별 단어/문장 토큰화 패턴
+_SENTENCE_PATTERNS = {
+    'jpn': re.compile(r'(?<=[。．！？])'),
+    'kor': re.compile(r'(?<=[.!?])'),
+    'eng': re.compile(r'(?<=[.!?])\s'),
+    'chi_sim': re.compile(r'(?<=[。！？])'),
+    'chi_tra': re.compile(r'(?<=[。！？])')
+}
+
+# 전각 숫자 -> 반각 숫자 변환 테이블
+_FULLWIDTH_DIGIT_TABLE = str.maketrans('０１２３４５６７８９', '0123456789')
+
+# 전각 숫자 + 중점 기호 정규화 테이블 (일본어/중국어)
+_CJK_TABLE = {**_FULLWIDTH_DIGIT_TABLE, **str.maketrans('﹅﹆', '・・')}
+
+# 변환 대상 문자의 연속 구간 (비ASCII 문자열의 str.translate는 문자마다 사전을 조회하므로
+# 정규식으로 대상 구간만 찾아 구간 단위로 변환)
+_FULLWIDTH_DIGIT_RUN_RE = re.compile(r'[０-９]+')
+_CJK_RUN_RE = re.compile(r'[０-９﹅﹆]+')
+
+
+def _translate_fullwidth_digits(text: str) -> str:
+    """전각 숫자를 반각으로 변환"""
+    return _FULLWIDTH_DIGIT_RUN_RE.sub(lambda m: m.group(0).translate(_FULLWIDTH_DIGIT_TABLE), text)
+
+
+def _translate_cjk(text: str) -> str:
+    """전각 숫자를 반각으로, 중점 기호(﹅﹆)를 ・로 변환"""
+    return _CJK_RUN_RE.sub(lambda m: m.group(0).translate(_CJK_TABLE), text)
+
+
+# 언어별 텍스트 정규화 패턴
+_JPN_SENTENCE_END_RE = re.compile(r'(?<=[。．！？])\s*(?=\S)')
+_KOR_PARTICLE_RE = re.compile(r'([가-힣])\s+(을|를|이|가|은|는|의|에|로|으로|에서|도|만)')
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s*(?=\S)')
+_ENG_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_CHI_PERIOD_RE = re.compile(r'。\s*')
+
+# 일반적인 영어 비즈니스 용어 교정
+_ENG_BUSINESS_TERMS = [
+    (re.compile(fr'\b{wrong}\b'), correct)
+    for wrong, correct in {
+        "Ud.": "Ltd.",
+        "Ine.": "Inc.",
+        "Ilc": "LLC",
+        "Lld.": "Ltd.",
+        "limiled": "limited",
+        "corporalion": "corporation"
+    }.items()
+]
+
+# 비즈니스 엔티티 추출 패턴
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_PHONE_RES = [
+    re.compile(r'\+\d{1,3}[\s-]?\(?\d{1,4}\)?[\s-]?\d{1,4}[\s-]?\d{1,4}'),  # 국제 형식
+    re.compile(r'\d{2,4}[\s-]?\d{2,4}[\s-]?\d{2,4}')                        # 국내 형식
+]
+_ENTITY_PATTERN_RULES = {
+    'jpn': {
+        # 일본어 회사명 (주식회사, 유한회사 등)
+        'companies': [
+            r'株式会社[\s]?([^\s・（()]{1,20})',
+            r'合同会社[\s]?([^\s・（()]{1,20})',
+            r'有限会社[\s]?([^\s・（()]{1,20})'
+        ],
+        # 일본식 날짜
+        'dates': [
+            r'(令和|平成|昭和)?\s*(\d{1,2})?\s*年\s*(\d{1,2})?\s*月\s*(\d{1,2})?\s*日',
+            r'\d{4}年\d{1,2}月\d{1,2}日',
+            r'\d{4}/\d{1,2}/\d{1,2}'
+        ],
+        # 일본식 금액
+        'amounts': [
+            r'¥\s*(\d{1,3}(,\d{3})*(\.\d+)?)',
+            r'(\d{1,3}(,\d{3})*(\.\d+)?)\s*円'
+        ],
+        # 주소 (일본 우편번호 포함)
+        'addresses': [
+            r'〒\d{3}-\d{4}',
+            r'[東西南北]?京都?[府県]'
+        ]
+    },
+    'kor': {
+        # 한국 회사명
+        'companies': [
+            r'(주)\s*식\s*회\s*사\s*([^\s]{1,20})',
+            r'([^\s]{1,20})\s*(주)\s*식\s*회\s*사',
+            r'([^\s]{1,20})\s*주식회사'
+        ],
+        # 한국식 날짜
+        'dates': [
+            r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일',
+            r'\d{4}[-\.]\d{1,2}[-\.]\d{1,2}'
+        ],
+        # 한국식 금액
+        'amounts': [
+            r'₩\s*(\d{1,3}(,\d{3})*(\.\d+)?)',
+            r'(\d{1,3}(,\d{3})*(\.\d+)?)\s*원'
+        ]
+    },
+    'eng': {
+        # 영어 회사명
+        'companies': [
+            r'([A-Z][a-zA-Z0-9\s,]{2,30})\s+(Inc|Corp|LLC|Ltd|LLP|Limited|Corporation)\.?',
+            r'([A-Z][a-zA-Z0-9\s,]{2,30})\s+Company'
+        ],
+        # 영어 날짜
+        'dates': [
+            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2},\s+\d{4}',
+            r'\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}',
+            r'\d{1,2}/\d{1,2}/\d{4}',
+            r'\d{4}-\d{1,2}-\d{1,2}'
+        ],
+        # 영어 금액
+        'amounts': [
+            r'\$\s*(\d{1,3}(,\d{3})*(\.\d+)?)',
+            r'USD\s*(\d{1,3}(,\d{3})*(\.\d+)?)'
+        ]
+    }
+}
+
+# 패턴끼리 같은 위치에서 겹쳐 일치할 수 있는 유형 (예: '¥1,000円'의 '¥1,000'과 '1,000円')
+# 교대 패턴으로 결합하면 한 번의 순회에서 겹치는 일치를 잃으므로 패턴별로 따로 순회
+_OVERLAPPING_ENTITY_TYPES = frozenset({'companies', 'dates', 'amounts'})
+
+
+def _compile_entity_patterns(key: str, patterns: List[str]) -> Tuple[re.Pattern, ...]:
+    """
+    엔티티 유형의 패턴 컴파일 (겹칠 수 없는 유형은 하나의 교대 패턴으로 결합해 텍스트를 한 번만 순회)
+    
+    Args:
+        key: 엔티티 유형
+        patterns: 패턴 문자열 목록
+    
+    Returns:
+        순회할 컴파일된 패턴 목록
+    """
+    if key in _OVERLAPPING_ENTITY_TYPES:
+        return tuple(re.compile(pattern) for pattern in patterns)
+    return (re.compile('|'.join(f'(?:{pattern})' for pattern in patterns)),)
+
+
+_ENTITY_RES = {
+    lang: {
+        key: _compile_entity_patterns(key, patterns)
+        for key, patterns in rules.items()
+    }
+    for lang, rules in _ENTITY_PATTERN_RULES.items()
+}
+
+
+
 class PostProcessor:
     """OCR 텍스트 후처리 클래스"""
     
@@ -49,115 +301,17 @@ class PostProcessor:
         self.tokenizers = {}
         self._initialize_tokenizers()
         
-        # 비즈니스 문서 패턴
-        self.business_patterns = {
-            'jpn': {
-                'date': [
-                    # 일본식 날짜 패턴 (2023年1月1日 → 2023年01月01日)
-                    (r'(\d{4})年(\d{1})月(\d{1})日', r'\1年0\2月0\3日'),  # 2023年1月1日
-                    (r'(\d{4})年(\d{2})月(\d{1})日', r'\1年\2月0\3日'),   # 2023年01月1日
-                    (r'(\d{4})年(\d{1})月(\d{2})日', r'\1年0\2月\3日'),   # 2023年1月01日
-                    
-                    # 令和/平成/昭和 연호
-                    (r'(令和|平成|昭和)(\d{1})年(\d{1})月(\d{1})日', r'\1\2年0\3月0\4日'),
-                    (r'(令和|平成|昭和)(\d{2})年(\d{1})月(\d{1})日', r'\1\2年0\3月0\4日')
-                ],
-                'amount': [
-                    # 일본식 금액 정규화 (¥1000 → ¥1,000)
-                    (r'¥\s*(\d{4,})', lambda m: f"¥{int(m.group(1)):,}"),
-                    (r'(\d{4,})\s*円', lambda m: f"{int(m.group(1)):,}円")
-                ],
-                'company': [
-                    # 회사명 패턴 정규화
-                    (r'株式含社', r'株式会社'),
-                    (r'株式会杜', r'株式会社'),
-                    (r'株式會社', r'株式会社'),
-                    (r'有恨会社', r'有限会社'),
-                    (r'含同会社', r'合同会社')
-                ],
-                'postcode': [
-                    # 우편번호 패턴 정규화
-                    (r'〒\s*(\d{3})\s*[-−]\s*(\d{4})', r'〒\1-\2')
-                ]
-            },
-            'kor': {
-                'date': [
-                    # 한국식 날짜 패턴 정규화
-                    (r'(\d{4})년\s*(\d{1})월\s*(\d{1})일', r'\1년 0\2월 0\3일'),
-                    (r'(\d{4})년\s*(\d{2})월\s*(\d{1})일', r'\1년 \2월 0\3일'),
-                    (r'(\d{4})년\s*(\d{1})월\s*(\d{2})일', r'\1년 0\2월 \3일'),
-                    
-                    # 표준 날짜 형식
-                    (r'(\d{4})[./-](\d{1})[./-](\d{1})', r'\1-0\2-0\3'),
-                    (r'(\d{4})[./-](\d{2})[./-](\d{1})', r'\1-\2-0\3'),
-                    (r'(\d{4})[./-](\d{1})[./-](\d{2})', r'\1-0\2-\3')
-                ],
-                'amount': [
-                    # 한국식 금액 정규화
-                    (r'₩\s*(\d{4,})', lambda m: f"₩{int(m.group(1)):,}"),
-                    (r'(\d{4,})\s*원', lambda m: f"{int(m.group(1)):,}원")
-                ],
-                'company': [
-                    # 회사명 패턴 정규화
-                    (r'(주)\s*식\s*회\s*사', r'(주)'),
-                    (r'주\s*식\s*회\s*사', r'주식회사')
-                ],
-                'registration': [
-                    # 사업자등록번호 패턴 정규화
-                    (r'(\d{3})\s*[-−]?\s*(\d{2})\s*[-−]?\s*(\d{5})', r'\1-\2-\3')
-                ]
-            },
-            'eng': {
-                'date': [
-                    # 영어 날짜 패턴 정규화
-                    (r'(\w{3})\s+(\d{1}),\s+(\d{4})', r'\1 0\2, \3'),  # Jan 1, 2023
-                    (r'(\d{1})/(\d{1})/(\d{4})', r'0\1/0\2/\3'),       # 1/1/2023
-                    (r'(\d{1})/(\d{2})/(\d{4})', r'0\1/\2/\3'),        # 1/01/2023
-                    (r'(\d{2})/(\d{1})/(\d{4})', r'\1/0\2/\3')         # 01/1/2023
-                ],
-                'amount': [
-                    # 영어 금액 정규화
-                    (r'\$\s*(\d{4,})', lambda m: f"${int(m.group(1)):,}"),
-                    (r'(\d{4,})\s*USD', lambda m: f"{int(m.group(1)):,} USD")
-                ],
-                'company': [
-                    # 회사명 패턴 정규화
-                    (r'Inc\b\.?', r'Inc.'),
-                    (r'Corp\b\.?', r'Corp.'),
-                    (r'Ltd\b\.?', r'Ltd.'),
-                    (r'LLC\b\.?', r'LLC'),
-                    (r'LLP\b\.?', r'LLP')
-                ]
-            }
-        }
+        # 형태소 분석기는 스레드 안전하지 않으므로 페이지를 스레드에서 동시 후처리할 때 호출 직렬화
+        self._tokenizer_lock = threading.Lock()
+        
+        # 비즈니스 문서 패턴 (모듈 수준에서 한 번만 컴파일)
+        self.business_patterns = _BUSINESS_PATTERNS
         
         # 공통 정규화 패턴
-        self.common_patterns = {
-            'whitespace': [
-                # 공백 정규화
-                (r'\s+', ' '),                      # 여러 공백을 하나로
-                (r'^\s+|\s+$', '')                  # 앞뒤 공백 제거
-            ],
-            'linebreak': [
-                # 줄바꿈 정규화
-                (r'\n\s*\n+', '\n\n'),             # 여러 빈 줄을 하나로
-                (r'^\n+|\n+$', '')                  # 앞뒤 줄바꿈 제거
-            ],
-            'email': [
-                # 이메일 형식 정규화
-                (r'([a-zA-Z0-9_.+-]+)@([a-zA-Z0-9-]+)\.([a-zA-Z0-9-.]+)', 
-                 lambda m: f"{m.group(1)}@{m.group(2)}.{m.group(3).lower()}")
-            ]
-        }
+        self.common_patterns = _COMMON_PATTERNS
         
         # 언어별 단어/문장 토큰화 패턴
-        self.sentence_patterns = {
-            'jpn': r'(?<=[。．！？])',
-            'kor': r'(?<=[.!?])',
-            'eng': r'(?<=[.!?])\s',
-            'chi_sim': r'(?<=[。！？])',
-            'chi_tra': r'(?<=[。！？])'
-        }
+        self.sentence_patterns = _SENTENCE_PATTERNS
     
     def _initialize_tokenizers(self):
         """언어별 토큰화기 초기화"""
@@ -262,10 +416,13 @@ class PostProcessor:
         # 유니코드 정규화 (NFKC)
         text = unicodedata.normalize('NFKC', text)
         
+        # 공백 정규화 (연속 공백/줄바꿈을 하나로, 앞뒤 공백 제거)
+        text = ' '.join(text.split())
+        
         # 공통 패턴 적용
         for pattern_type, patterns in self.common_patterns.items():
             for pattern, replacement in patterns:
-                text = re.sub(pattern, replacement, text)
+                text = pattern.sub(replacement, text)
         
         return text
     
@@ -286,22 +443,20 @@ class PostProcessor:
         if jaconv is not None:
             text = jaconv.normalize(text)
         
-        # 특수 기호 정규화
-        text = re.sub(r'[﹅﹆]', '・', text)  # 중점 정규화
-        
-        # 일본어 숫자 정규화 (전각 → 반각)
-        text = re.sub(r'[０-９]', lambda x: chr(ord(x.group(0)) - 0xFEE0), text)
+        # 특수 기호(중점) 및 숫자 정규화 (전각 → 반각)
+        text = _translate_cjk(text)
         
         # 일본어 형태소 분석 (토큰화)
         if "jpn" in self.tokenizers:
             try:
-                tokenized = self.tokenizers["jpn"].parse(text)
+                with self._tokenizer_lock:
+                    tokenized = self.tokenizers["jpn"].parse(text)
                 text = tokenized.strip()
             except Exception as e:
                 logger.warning(f"일본어 토큰화 오류: {e}")
         
         # 줄바꿈 정규화
-        text = re.sub(r'(?<=[。．！？])\s*(?=\S)', '\n', text)
+        text = _JPN_SENTENCE_END_RE.sub('\n', text)
         
         return text
     
@@ -319,13 +474,13 @@ class PostProcessor:
             return ""
         
         # 한국어 숫자 정규화 (전각 → 반각)
-        text = re.sub(r'[０-９]', lambda x: chr(ord(x.group(0)) - 0xFEE0), text)
+        text = _translate_fullwidth_digits(text)
         
         # 한국어 조사 정규화
-        text = re.sub(r'([가-힣])\s+(을|를|이|가|은|는|의|에|로|으로|에서|도|만)', r'\1\2', text)
+        text = _KOR_PARTICLE_RE.sub(r'\1\2', text)
         
         # 줄바꿈 정규화
-        text = re.sub(r'(?<=[.!?])\s*(?=\S)', '\n', text)
+        text = _SENTENCE_END_RE.sub('\n', text)
         
         return text
     
@@ -343,22 +498,13 @@ class PostProcessor:
             return ""
         
         # 문장 시작 대문자화
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _ENG_SENTENCE_SPLIT_RE.split(text)
         sentences = [s[0].upper() + s[1:] if s and len(s) > 0 else s for s in sentences]
         text = ' '.join(sentences)
         
         # 일반적인 영어 비즈니스 용어 교정
-        business_terms = {
-            "Ud.": "Ltd.",
-            "Ine.": "Inc.",
-            "Ilc": "LLC",
-            "Lld.": "Ltd.",
-            "limiled": "limited",
-            "corporalion": "corporation"
-        }
-        
-        for wrong, correct in business_terms.items():
-            text = re.sub(fr'\b{wrong}\b', correct, text)
+        for pattern, correct in _ENG_BUSINESS_TERMS:
+            text = pattern.sub(correct, text)
         
         return text
     
@@ -376,14 +522,11 @@ class PostProcessor:
         if not text:
             return ""
         
-        # 중국어 숫자 정규화 (전각 → 반각)
-        text = re.sub(r'[０-９]', lambda x: chr(ord(x.group(0)) - 0xFEE0), text)
-        
-        # 특수 기호 정규화
-        text = re.sub(r'[﹅﹆]', '・', text)
+        # 중국어 숫자 및 특수 기호 정규화 (전각 → 반각)
+        text = _translate_cjk(text)
         
         # 중국어 구두점 정규화
-        text = re.sub(r'。\s*', '。\n', text)
+        text = _CHI_PERIOD_RE.sub('。\n', text)
         
         return text
     
@@ -405,7 +548,7 @@ class PostProcessor:
         if lang in self.business_patterns:
             for pattern_type, patterns in self.business_patterns[lang].items():
                 for pattern, replacement in patterns:
-                    text = re.sub(pattern, replacement, text)
+                    text = pattern.sub(replacement, text)
         
         return text
     
@@ -435,7 +578,7 @@ class PostProcessor:
                 pass
         
         # 패턴 기반 문장 분리
-        return re.split(pattern, text)
+        return pattern.split(text)
     
     def extract_business_entities(self, text: str, lang: str = "eng") -> Dict[str, List[str]]:
         """
@@ -462,111 +605,26 @@ class PostProcessor:
             return entities
         
         # 이메일 추출 (공통)
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        entities['emails'] = re.findall(email_pattern, text)
+        entities['emails'] = _EMAIL_RE.findall(text)
         
         # 전화번호 추출 (공통)
-        phone_patterns = [
-            r'\+\d{1,3}[\s-]?\(?\d{1,4}\)?[\s-]?\d{1,4}[\s-]?\d{1,4}',  # 국제 형식
-            r'\d{2,4}[\s-]?\d{2,4}[\s-]?\d{2,4}'                        # 국내 형식
-        ]
-        for pattern in phone_patterns:
-            entities['phones'].extend(re.findall(pattern, text))
+        for pattern in _PHONE_RES:
+            entities['phones'].extend(pattern.findall(text))
         
         # 언어별 엔티티 추출
-        if lang == "jpn":
-            # 일본어 회사명 (주식회사, 유한회사 등)
-            company_patterns = [
-                r'株式会社[\s]?([^\s・（()]{1,20})',
-                r'合同会社[\s]?([^\s・（()]{1,20})',
-                r'有限会社[\s]?([^\s・（()]{1,20})'
-            ]
-            for pattern in company_patterns:
-                for match in re.finditer(pattern, text):
-                    if match.group(0) not in entities['companies']:
-                        entities['companies'].append(match.group(0))
-            
-            # 일본식 날짜
-            date_patterns = [
-                r'(令和|平成|昭和)?\s*(\d{1,2})?\s*年\s*(\d{1,2})?\s*月\s*(\d{1,2})?\s*日',
-                r'\d{4}年\d{1,2}月\d{1,2}日',
-                r'\d{4}/\d{1,2}/\d{1,2}'
-            ]
-            for pattern in date_patterns:
-                entities['dates'].extend(re.findall(pattern, text))
-            
-            # 일본식 금액
-            amount_patterns = [
-                r'¥\s*(\d{1,3}(,\d{3})*(\.\d+)?)',
-                r'(\d{1,3}(,\d{3})*(\.\d+)?)\s*円'
-            ]
-            for pattern in amount_patterns:
-                entities['amounts'].extend(re.findall(pattern, text))
-            
-            # 주소 (일본 우편번호 포함)
-            address_patterns = [
-                r'〒\d{3}-\d{4}',
-                r'[東西南北]?京都?[府県]'
-            ]
-            for pattern in address_patterns:
-                for match in re.finditer(pattern, text):
-                    # 주변 문맥 추출
-                    start = max(0, match.start() - 30)
-                    end = min(len(text), match.end() + 30)
-                    entities['addresses'].append(text[start:end])
-        
-        elif lang == "kor":
-            # 한국 회사명
-            company_patterns = [
-                r'(주)\s*식\s*회\s*사\s*([^\s]{1,20})',
-                r'([^\s]{1,20})\s*(주)\s*식\s*회\s*사',
-                r'([^\s]{1,20})\s*주식회사'
-            ]
-            for pattern in company_patterns:
-                entities['companies'].extend(re.findall(pattern, text))
-            
-            # 한국식 날짜
-            date_patterns = [
-                r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일',
-                r'\d{4}[-\.]\d{1,2}[-\.]\d{1,2}'
-            ]
-            for pattern in date_patterns:
-                entities['dates'].extend(re.findall(pattern, text))
-            
-            # 한국식 금액
-            amount_patterns = [
-                r'₩\s*(\d{1,3}(,\d{3})*(\.\d+)?)',
-                r'(\d{1,3}(,\d{3})*(\.\d+)?)\s*원'
-            ]
-            for pattern in amount_patterns:
-                entities['amounts'].extend(re.findall(pattern, text))
-        
-        elif lang == "eng":
-            # 영어 회사명
-            company_patterns = [
-                r'([A-Z][a-zA-Z0-9\s,]{2,30})\s+(Inc|Corp|LLC|Ltd|LLP|Limited|Corporation)\.?',
-                r'([A-Z][a-zA-Z0-9\s,]{2,30})\s+Company'
-            ]
-            for pattern in company_patterns:
-                entities['companies'].extend(re.findall(pattern, text))
-            
-            # 영어 날짜
-            date_patterns = [
-                r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2},\s+\d{4}',
-                r'\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}',
-                r'\d{1,2}/\d{1,2}/\d{4}',
-                r'\d{4}-\d{1,2}-\d{1,2}'
-            ]
-            for pattern in date_patterns:
-                entities['dates'].extend(re.findall(pattern, text))
-            
-            # 영어 금액
-            amount_patterns = [
-                r'\$\s*(\d{1,3}(,\d{3})*(\.\d+)?)',
-                r'USD\s*(\d{1,3}(,\d{3})*(\.\d+)?)'
-            ]
-            for pattern in amount_patterns:
-                entities['amounts'].extend(re.findall(pattern, text))
+        lang_patterns = _ENTITY_RES.get(lang)
+        if lang_patterns is not None:
+            for key, patterns in lang_patterns.items():
+                for pattern in patterns:
+                    if key == 'addresses':
+                        # 주변 문맥 추출
+                        for match in pattern.finditer(text):
+                            start = max(0, match.start() - 30)
+                            end = min(len(text), match.end() + 30)
+                            entities['addresses'].append(text[start:end])
+                    else:
+                        # 전체 일치 문자열 사용 (패턴 그룹 튜플 대신)
+                        entities[key].extend(match.group(0) for match in pattern.finditer(text))
         
         # 중복 제거
         for key in entities:
@@ -5,15 +5,172 @@
 - 노이즈 제거 및 이미지 품질 개선
 """
 
+import os
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 import numpy as np
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Dict, Any, List, Mapping, Optional, Union, Tuple
 from PIL import Image, ImageFilter, ImageEnhance
 import cv2
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 선택적 라이브러리 임포트
+try:
+    import numba  # JIT 컴파일 (획 두께 통계 가속)
+except ImportError:
+    numba = None
+    logger.warning("numba 라이브러리가 설치되지 않았습니다. 손글씨 감지가 NumPy 구현으로 동작합니다.")
+
+# 모폴로지 연산용 커널 (불변이므로 모듈 로드 시 한 번만 생성)
+_K2 = np.ones((2, 2), np.uint8)
+_K3 = np.ones((3, 3), np.uint8)
+_K5 = np.ones((5, 5), np.uint8)
+_KH15 = np.ones((1, 15), np.uint8)  # 수평선 강조
+_KH30 = np.ones((1, 30), np.uint8)  # 수평선 강조
+_KV30 = np.ones((30, 1), np.uint8)  # 수직선 강조
+
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _stroke_stats(dist: np.ndarray, y: int, x: int, h: int, w: int) -> Tuple[float, float]:
+        """
+        ROI 내 0이 아닌 획 두께의 평균/표준편차 (Welford 단일 패스)
+        
+        Args:
+            dist: 거리 변환 결과
+            y, x, h, w: ROI 경계 상자
+        
+        Returns:
+            평균 획 두께, 획 두께 표준편차
+        """
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(y, y + h):
+            for j in range(x, x + w):
+                value = dist[i, j]
+                if value > 0:
+                    count += 1
+                    delta = value - mean
+                    mean += delta / count
+                    m2 += delta * (value - mean)
+        if count == 0:
+            return 0.0, 0.0
+        return mean, np.sqrt(m2 / count)
+else:
+    def _stroke_stats(dist: np.ndarray, y: int, x: int, h: int, w: int) -> Tuple[float, float]:
+        """
+        ROI 내 0이 아닌 획 두께의 평균/표준편차 (NumPy 대체 구현)
+        
+        Args:
+            dist: 거리 변환 결과
+            y, x, h, w: ROI 경계 상자
+        
+        Returns:
+            평균 획 두께, 획 두께 표준편차
+        """
+        roi = dist[y:y+h, x:x+w]
+        values = roi[roi > 0]
+        if values.size == 0:
+            return 0.0, 0.0
+        return float(values.mean()), float(values.std())
+
+
+def _compute_red_mask(bgr: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    빨간색 영역 마스크 계산 (일본식 도장은 주로 빨간색)
+    
+    Args:
+        bgr: OpenCV 이미지 (BGR)
+    
+    Returns:
+        노이즈가 제거된 빨간색 마스크, HSV 이미지
+    """
+    # HSV 색 공간으로 변환
+    hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+    
+    # 빨간색은 색상환 양 끝에 걸쳐 있으므로 두 범위를 결합
+    lower_red1 = np.array([0, 100, 100])
+    upper_red1 = np.array([10, 255, 255])
+    lower_red2 = np.array([160, 100, 100])
+    upper_red2 = np.array([180, 255, 255])
+    
+    mask1 = cv2.inRange(hsv, lower_red1, upper_red1)
+    mask2 = cv2.inRange(hsv, lower_red2, upper_red2)
+    red_mask = cv2.bitwise_or(mask1, mask2, dst=mask1)
+    
+    # 노이즈 제거
+    red_mask = cv2.morphologyEx(red_mask, cv2.MORPH_OPEN, _K5)
+    
+    return red_mask, hsv
+
+
+def _fill_holes(mask: np.ndarray) -> np.ndarray:
+    """
+    이진 마스크의 내부 구멍 채우기 (바깥 윤곽선 내부 전체를 전경으로)
+    
+    Args:
+        mask: 이진 마스크 (0 또는 255)
+    
+    Returns:
+        구멍이 채워진 마스크
+    """
+    # 테두리를 한 줄 추가해 바깥 배경이 하나의 영역으로 연결되도록 한 뒤 바깥에서 채움
+    flooded = cv2.copyMakeBorder(mask, 1, 1, 1, 1, cv2.BORDER_CONSTANT, value=0)
+    cv2.floodFill(flooded, None, (0, 0), 255)
+    
+    # 바깥에서 닿지 않은 배경 = 구멍
+    holes = cv2.bitwise_not(flooded[1:-1, 1:-1])
+    return cv2.bitwise_or(mask, holes)
+
+
+def _component_boxes(mask: np.ndarray, min_area: int) -> np.ndarray:
+    """
+    바깥 윤곽선 단위 경계 상자 일괄 계산 (면적 필터 포함)
+    
+    findContours(RETR_EXTERNAL) + contourArea와 같은 기준이 되도록 구멍을 채운 뒤
+    연결 요소를 구함 (고리 모양 도장, 표 격자 내부의 요소는 별도 영역이 되지 않음)
+    
+    Args:
+        mask: 이진 마스크 (0 또는 255)
+        min_area: 최소 면적 (구멍을 포함한 바깥 윤곽선 내부 픽셀 수)
+    
+    Returns:
+        경계 상자 배열 (N, 4), 각 행은 [x, y, w, h]
+    """
+    _, _, stats, _ = cv2.connectedComponentsWithStats(_fill_holes(mask), connectivity=8, ltype=cv2.CV_32S)
+    
+    # 0번 요소는 배경
+    stats = stats[1:]
+    keep = stats[:, cv2.CC_STAT_AREA] >= min_area
+    return stats[keep, :4]
+
+
+def _detect_line_segments(gray: np.ndarray) -> Optional[np.ndarray]:
+    """
+    선분 검출 (FastLineDetector 우선, 없으면 LSD)
+    
+    Args:
+        gray: 그레이스케일 NumPy 배열
+    
+    Returns:
+        선분 좌표 배열 (N, 1, 4) 또는 None
+    """
+    if hasattr(cv2, 'ximgproc'):
+        # opencv-contrib: 내부에서 Canny를 수행하는 고속 선분 검출기
+        detector = cv2.ximgproc.createFastLineDetector(50, 1.414, 50, 150, 3, False)
+        return detector.detect(gray)
+    
+    # 기본 OpenCV: LSD 선분 검출기 (검출기는 스레드 간 공유하지 않음)
+    detector = cv2.createLineSegmentDetector(cv2.LSD_REFINE_NONE)
+    return detector.detect(gray)[0]
+
 
 class Preprocessor:
     """OCR 이미지 전처리 클래스"""
@@ -126,11 +283,29 @@ class Preprocessor:
                 'sharpness': 1.6
             }
         }
+        
+        # 선형 변환 룩업 테이블 캐시 ((alpha, beta) -> LUT)
+        self._lut_cache: Dict[Tuple[float, float], np.ndarray] = {}
+        
+        # 언어 x 문서 유형 조합별 병합 파라미터 (읽기 전용, 호출마다 복사하지 않음)
+        self._merged = {
+            (lang, doc_type): MappingProxyType({
+                **lang_params,
+                **self.doc_type_params.get(doc_type, {})
+            })
+            for lang, lang_params in self.lang_params.items()
+            for doc_type in (None, *self.doc_type_params)
+        }
+        
+        # 언어별 변형 병렬 전처리용 스레드 풀 (OpenCV 연산은 GIL을 해제함)
+        self._executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="preprocess")
     
     def process_image(self, 
                      image: Union[Image.Image, np.ndarray], 
                      lang: str = "eng", 
-                     doc_type: Optional[str] = None) -> Image.Image:
+                     doc_type: Optional[str] = None,
+                     max_dim: Optional[int] = 1600,
+                     restore_size: bool = False) -> Image.Image:
         """
         OCR용 이미지 전처리
         
@@ -138,98 +313,385 @@ class Preprocessor:
             image: PIL 이미지 또는 NumPy 배열
             lang: 언어 코드 (jpn, kor, eng, chi_sim, chi_tra)
             doc_type: 문서 유형 (receipt, invoice, form, handwritten)
+            max_dim: 처리 해상도의 최대 변 길이 (None이면 제한 없음)
+            restore_size: 처리 후 축소 전 크기로 복원할지 여부
         
         Returns:
             전처리된 PIL 이미지
         """
         try:
-            # PIL 이미지로 변환
-            if isinstance(image, np.ndarray):
-                # OpenCV 배열 (BGR)을 PIL 이미지 (RGB)로 변환
-                if len(image.shape) == 3:
-                    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-                pil_image = Image.fromarray(image)
-            else:
-                pil_image = image
-            
-            # 이미지가 너무 작으면 스케일 업
-            width, height = pil_image.size
-            min_dim = min(width, height)
-            if min_dim < 600:
-                scale_factor = 600 / min_dim
-                new_width = int(width * scale_factor)
-                new_height = int(height * scale_factor)
-                pil_image = pil_image.resize((new_width, new_height), Image.LANCZOS)
-                logger.debug(f"이미지 크기 조정: {width}x{height} -> {new_width}x{new_height}")
-            
-            # 언어 파라미터 선택
-            if lang not in self.lang_params:
-                lang = "eng"  # 지원하지 않는 언어면 영어로 대체
-            
-            params = self.lang_params[lang].copy()
-            
-            # 문서 유형별 파라미터 오버라이드
-            if doc_type in self.doc_type_params:
-                params.update(self.doc_type_params[doc_type])
-            
-            # OpenCV 처리를 위한 변환
-            cv_image = np.array(pil_image)
-            if len(cv_image.shape) == 3:
-                cv_image = cv2.cvtColor(cv_image, cv2.COLOR_RGB2BGR)
-            
-            # 그레이스케일 변환
-            if len(cv_image.shape) == 3:
-                gray = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = cv_image
+            # 그레이스케일 변환 (단일 패스)
+            gray = self._to_gray(image)
             
-            # 각 처리 단계 적용
-            processed = self._apply_processing_pipeline(gray, params)
+            # 그레이스케일 파이프라인 적용
+            processed = self._process_gray(gray, lang, doc_type, max_dim, restore_size)
             
             # 결과 이미지를 PIL로 변환
-            result_image = Image.fromarray(processed)
-            
-            return result_image
+            return Image.fromarray(processed)
         
         except Exception as e:
             logger.error(f"이미지 전처리 오류: {e}")
             # 오류 발생 시 원본 이미지 반환
-            return pil_image if isinstance(image, Image.Image) else Image.fromarray(image)
+            return self._as_pil(image)
+    
+    def process_image_batch(self, 
+                           images: List[Union[Image.Image, np.ndarray]], 
+                           langs: Union[str, List[str]] = "eng", 
+                           doc_types: Union[Optional[str], List[Optional[str]]] = None,
+                           max_dim: Optional[int] = 1600,
+                           restore_size: bool = False) -> List[Image.Image]:
+        """
+        여러 이미지 (또는 같은 이미지의 언어/문서 유형 변형)를 한 번에 전처리
+        
+        같은 이미지 객체는 그레이스케일 변환과 크기 조정을 한 번만 수행하고,
+        파라미터가 같은 블러/노이즈 제거/대비 조정 단계 결과를 변형 간에 재사용함.
+        
+        Args:
+            images: PIL 이미지 또는 NumPy 배열 목록
+            langs: 언어 코드 또는 이미지별 언어 코드 목록
+            doc_types: 문서 유형 또는 이미지별 문서 유형 목록
+            max_dim: 처리 해상도의 최대 변 길이 (None이면 제한 없음)
+            restore_size: 처리 후 축소 전 크기로 복원할지 여부
+        
+        Returns:
+            전처리된 PIL 이미지 목록 (입력 순서와 동일)
+        """
+        if isinstance(langs, str):
+            langs = [langs] * len(images)
+        if doc_types is None or isinstance(doc_types, str):
+            doc_types = [doc_types] * len(images)
+        
+        # 이미지 객체별 준비된 그레이스케일과 단계별 중간 결과
+        prepared: Dict[int, Tuple[np.ndarray, Tuple[int, int], Dict[Any, np.ndarray]]] = {}
+        results = []
+        
+        for image, lang, doc_type in zip(images, langs, doc_types):
+            try:
+                entry = prepared.get(id(image))
+                if entry is None:
+                    gray, original_size = self._prepare_gray(self._to_gray(image), max_dim)
+                    entry = prepared[id(image)] = (gray, original_size, {})
+                gray, original_size, stages = entry
+                
+                processed = self._apply_processing_pipeline(gray, self._select_params(lang, doc_type), stages=stages)
+                results.append(Image.fromarray(self._restore_size(processed, original_size, restore_size)))
+            
+            except Exception as e:
+                logger.error(f"이미지 전처리 오류: {e}")
+                results.append(self._as_pil(image))
+        
+        return results
+    
+    def process_image_multi(self, 
+                           image: Union[Image.Image, np.ndarray], 
+                           langs: List[str], 
+                           doc_type: Optional[str] = None,
+                           max_dim: Optional[int] = 1600,
+                           restore_size: bool = False) -> Dict[str, Image.Image]:
+        """
+        같은 이미지를 여러 언어 파라미터로 병렬 전처리
+        
+        그레이스케일 변환과 크기 조정은 한 번만 수행하고, 노이즈 제거 파라미터가 같은
+        언어끼리 한 작업으로 묶어 중간 결과를 공유한 뒤 작업들을 스레드 풀에서 동시에 실행함.
+        
+        Args:
+            image: PIL 이미지 또는 NumPy 배열
+            langs: 언어 코드 목록
+            doc_type: 문서 유형
+            max_dim: 처리 해상도의 최대 변 길이 (None이면 제한 없음)
+            restore_size: 처리 후 축소 전 크기로 복원할지 여부
+        
+        Returns:
+            언어 코드별 전처리된 PIL 이미지 (입력 순서)
+        """
+        try:
+            gray, original_size = self._prepare_gray(self._to_gray(image), max_dim)
+        except Exception as e:
+            logger.error(f"이미지 전처리 오류: {e}")
+            original = self._as_pil(image)
+            return {lang: original for lang in langs}
+        
+        # (블러, 노이즈 제거) 파라미터별 언어 그룹 (가장 비싼 노이즈 제거 단계를 그룹 안에서 재사용)
+        groups: Dict[Tuple[Any, Any], List[str]] = {}
+        for lang in dict.fromkeys(langs):
+            params = self._select_params(lang, doc_type)
+            groups.setdefault((params.get('blur_kernel', 3), params.get('denoise_h', 10)), []).append(lang)
+        
+        def _process_group(group_langs: List[str]) -> Dict[str, Image.Image]:
+            # 단계별 중간 결과는 작업마다 따로 두어 스레드 간에 공유하지 않음
+            stages: Dict[Any, np.ndarray] = {}
+            processed_images = {}
+            for lang in group_langs:
+                try:
+                    processed = self._apply_processing_pipeline(gray, self._select_params(lang, doc_type), stages=stages)
+                    processed_images[lang] = Image.fromarray(self._restore_size(processed, original_size, restore_size))
+                except Exception as e:
+                    logger.error(f"이미지 전처리 오류: {e}")
+                    processed_images[lang] = self._as_pil(image)
+            return processed_images
+        
+        results: Dict[str, Image.Image] = {}
+        if len(groups) == 1:
+            results.update(_process_group(next(iter(groups.values()))))
+        else:
+            futures = [self._executor.submit(_process_group, group_langs) for group_langs in groups.values()]
+            for future in futures:
+                results.update(future.result())
+        
+        return {lang: results[lang] for lang in langs}
     
-    def _apply_processing_pipeline(self, image: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
+    def _to_gray(self, image: Union[Image.Image, np.ndarray]) -> np.ndarray:
+        """
+        입력 이미지를 그레이스케일 NumPy 배열로 변환
+        
+        Args:
+            image: PIL 이미지 (RGB) 또는 NumPy 배열 (BGR 또는 그레이스케일)
+        
+        Returns:
+            그레이스케일 NumPy 배열
+        """
+        if isinstance(image, np.ndarray):
+            # 이미 그레이스케일이면 그대로 사용
+            if image.ndim == 2:
+                return image
+            # OpenCV 배열 (BGR)
+            return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        
+        # np.asarray는 추가 복사 없이 읽기 전용 배열을 반환 (이후 연산은 모두 새 배열 생성)
+        if image.mode == 'L':
+            return np.asarray(image)
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        
+        # RGB -> GRAY 한 번만 변환 (중간 BGR 변환 생략)
+        return cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
+    
+    def _to_cv(self, image: Union[Image.Image, np.ndarray]) -> np.ndarray:
+        """
+        입력 이미지를 OpenCV 배열로 변환 (NumPy 입력은 복사하지 않음)
+        
+        Args:
+            image: PIL 이미지 (RGB) 또는 NumPy 배열 (BGR 또는 그레이스케일)
+        
+        Returns:
+            BGR 또는 그레이스케일 NumPy 배열
+        """
+        if isinstance(image, np.ndarray):
+            return image
+        
+        if image.mode == 'L':
+            return np.asarray(image)
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        return cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2BGR)
+    
+    def _to_pil(self, image: np.ndarray) -> Image.Image:
+        """
+        OpenCV 배열 (BGR)을 PIL 이미지 (RGB)로 변환
+        
+        Args:
+            image: NumPy 배열 (BGR 또는 그레이스케일)
+        
+        Returns:
+            PIL 이미지
+        """
+        if image.ndim == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        return Image.fromarray(image)
+    
+    def _as_pil(self, image: Union[Image.Image, np.ndarray]) -> Image.Image:
+        """
+        입력 이미지를 PIL 이미지로 반환 (오류 시 원본 반환용)
+        
+        Args:
+            image: PIL 이미지 또는 NumPy 배열 (BGR 또는 그레이스케일)
+        
+        Returns:
+            PIL 이미지
+        """
+        if isinstance(image, Image.Image):
+            return image
+        return self._to_pil(image)
+    
+    def _process_gray(self, 
+                     gray: np.ndarray, 
+                     lang: str = "eng", 
+                     doc_type: Optional[str] = None,
+                     max_dim: Optional[int] = 1600,
+                     restore_size: bool = False) -> np.ndarray:
+        """
+        그레이스케일 이미지 전처리 (내부 진입점)
+        
+        Args:
+            gray: 그레이스케일 NumPy 배열
+            lang: 언어 코드
+            doc_type: 문서 유형
+            max_dim: 처리 해상도의 최대 변 길이 (None이면 제한 없음)
+            restore_size: 처리 후 축소 전 크기로 복원할지 여부
+        
+        Returns:
+            전처리된 그레이스케일 NumPy 배열
+        """
+        gray, original_size = self._prepare_gray(gray, max_dim)
+        
+        # 각 처리 단계 적용
+        processed = self._apply_processing_pipeline(gray, self._select_params(lang, doc_type))
+        
+        return self._restore_size(processed, original_size, restore_size)
+    
+    def _prepare_gray(self, gray: np.ndarray, max_dim: Optional[int]) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """
+        처리 해상도로 크기 조정 (작은 이미지는 확대, 큰 이미지는 축소)
+        
+        Args:
+            gray: 그레이스케일 NumPy 배열
+            max_dim: 처리 해상도의 최대 변 길이 (None이면 제한 없음)
+        
+        Returns:
+            (크기 조정된 배열, 축소 전 크기 (width, height))
+        """
+        # 이미지가 너무 작으면 스케일 업
+        height, width = gray.shape[:2]
+        min_dim = min(width, height)
+        if min_dim < 600:
+            scale_factor = 600 / min_dim
+            new_width = int(width * scale_factor)
+            new_height = int(height * scale_factor)
+            gray = cv2.resize(gray, (new_width, new_height), interpolation=cv2.INTER_LANCZOS4)
+            logger.debug(f"이미지 크기 조정: {width}x{height} -> {new_width}x{new_height}")
+        
+        # 이미지가 너무 크면 무거운 필터링 전에 축소 (최소 변 600 유지)
+        original_size = (gray.shape[1], gray.shape[0])
+        return self._clamp_resolution(gray, max_dim), original_size
+    
+    def _select_params(self, lang: str, doc_type: Optional[str]) -> Mapping[str, Any]:
+        """
+        언어 x 문서 유형 병합 파라미터 선택
+        
+        Args:
+            lang: 언어 코드 (지원하지 않으면 영어)
+            doc_type: 문서 유형 (지원하지 않으면 None)
+        
+        Returns:
+            읽기 전용 처리 파라미터
+        """
+        # 언어 파라미터 선택
+        if lang not in self.lang_params:
+            lang = "eng"  # 지원하지 않는 언어면 영어로 대체
+        
+        # 문서 유형별 파라미터가 병합된 설정 선택
+        if doc_type not in self.doc_type_params:
+            doc_type = None
+        
+        return self._merged[(lang, doc_type)]
+    
+    def _restore_size(self, processed: np.ndarray, original_size: Tuple[int, int], restore_size: bool) -> np.ndarray:
+        """
+        필요 시 원래 크기로 복원 (이진 이미지이므로 최근접 보간)
+        
+        Args:
+            processed: 처리된 NumPy 배열
+            original_size: 축소 전 크기 (width, height)
+            restore_size: 복원 여부
+        
+        Returns:
+            복원된 (또는 그대로의) NumPy 배열
+        """
+        if restore_size and (processed.shape[1], processed.shape[0]) != original_size:
+            processed = cv2.resize(processed, original_size, interpolation=cv2.INTER_NEAREST)
+        return processed
+    
+    def _clamp_resolution(self, image: np.ndarray, max_dim: Optional[int]) -> np.ndarray:
+        """
+        처리 해상도를 최대 변 길이로 제한
+        
+        Args:
+            image: NumPy 배열
+            max_dim: 최대 변 길이 (None이면 제한 없음)
+        
+        Returns:
+            축소된 (또는 원본) NumPy 배열
+        """
+        if not max_dim:
+            return image
+        
+        height, width = image.shape[:2]
+        if max(width, height) <= max_dim:
+            return image
+        
+        # 최소 변이 600 아래로 내려가지 않도록 축소 비율 제한
+        scale = max(max_dim / max(width, height), 600 / min(width, height))
+        if scale >= 1.0:
+            return image
+        
+        new_size = (int(width * scale), int(height * scale))
+        logger.debug(f"처리 해상도 축소: {width}x{height} -> {new_size[0]}x{new_size[1]}")
+        return cv2.resize(image, new_size, interpolation=cv2.INTER_AREA)
+    
+    def _apply_processing_pipeline(self, 
+                                  image: np.ndarray, 
+                                  params: Mapping[str, Any],
+                                  edges: Optional[np.ndarray] = None,
+                                  stages: Optional[Dict[Any, np.ndarray]] = None) -> np.ndarray:
         """
         이미지 처리 파이프라인 적용
         
         Args:
             image: 그레이스케일 NumPy 배열
             params: 처리 파라미터
+            edges: 대비 조정 이미지의 미리 계산된 에지 (None이면 새로 계산)
+            stages: 같은 이미지에 대한 단계별 중간 결과 캐시 (파라미터 조합 -> 배열)
         
         Returns:
             처리된 NumPy 배열
         """
-        # 1. 노이즈 제거 (블러)
         blur_kernel = params.get('blur_kernel', 3)
-        if blur_kernel > 0:
-            blurred = cv2.GaussianBlur(image, (blur_kernel, blur_kernel), 0)
-        else:
-            blurred = image
-        
-        # 2. 노이즈 제거 (비-로컬 평균)
         denoise_h = params.get('denoise_h', 10)
-        if denoise_h > 0:
-            denoised = cv2.fastNlMeansDenoising(blurred, None, denoise_h, 7, 21)
-        else:
-            denoised = blurred
-        
-        # 3. 대비 조정
         alpha = params.get('contrast', 1.0)  # 대비 인자 (1.0보다 크면 대비 증가)
         beta = 0  # 밝기 조정
-        contrasted = cv2.convertScaleAbs(denoised, alpha=alpha, beta=beta)
+        
+        # 1~3단계 결과는 (블러, 노이즈 제거, 대비) 파라미터에만 의존하므로 변형 간 재사용
+        stage_key = (blur_kernel, denoise_h, alpha)
+        contrasted = stages.get(stage_key) if stages is not None else None
+        
+        if contrasted is None:
+            denoise_key = (blur_kernel, denoise_h)
+            denoised = stages.get(denoise_key) if stages is not None else None
+            
+            if denoised is None:
+                # 1. 노이즈 제거 (블러)
+                if blur_kernel > 0:
+                    blurred = cv2.GaussianBlur(image, (blur_kernel, blur_kernel), 0)
+                else:
+                    blurred = image
+                
+                # 2. 노이즈 제거 (비-로컬 평균)
+                if denoise_h > 0:
+                    denoised = cv2.fastNlMeansDenoising(blurred, None, denoise_h, 7, 21)
+                else:
+                    denoised = blurred
+                
+                if stages is not None:
+                    stages[denoise_key] = denoised
+            
+            # 3. 대비 조정
+            contrasted = cv2.LUT(denoised, self._scale_lut(alpha, beta))
+            
+            if stages is not None:
+                stages[stage_key] = contrasted
         
         # 4. 이진화
         binarization_method = params.get('binarization_method', 'adaptive')
         
+        # 대비가 높은 깨끗한 스캔은 Otsu 전역 이진화로 충분 (적응형보다 훨씬 저렴)
+        use_otsu = False
         if binarization_method == 'adaptive':
+            _, std = cv2.meanStdDev(contrasted)
+            use_otsu = std[0, 0] > 60
+        
+        if use_otsu:
+            _, binary = cv2.threshold(contrasted, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        elif binarization_method == 'adaptive':
             # 적응형 이진화
             block_size = params.get('block_size', 11)
             c_value = params.get('c_value', 7)
@@ -251,27 +713,42 @@ class Preprocessor:
         edge_enhancement = params.get('edge_enhancement', 1.0)
         if edge_enhancement > 1.0:
             # 에지 감지
-            edges = cv2.Canny(contrasted, 50, 150)
+            if edges is None and stages is not None:
+                edges = stages.get(('edges', stage_key))
+            if edges is None:
+                edges = cv2.Canny(contrasted, 50, 150)
+                if stages is not None:
+                    stages[('edges', stage_key)] = edges
             
-            # 에지 강화
-            edge_enhanced = cv2.addWeighted(binary, 1.0, edges, edge_enhancement - 1.0, 0)
+            # 에지 강화 (binary + edges * (계수 - 1)을 uint8 LUT와 포화 덧셈으로 계산)
+            weighted_edges = cv2.LUT(edges, self._scale_lut(edge_enhancement - 1.0, 0))
+            edge_enhanced = cv2.add(binary, weighted_edges)
         else:
             edge_enhanced = binary
         
         # 6. 모폴로지 연산 (작은 노이즈 제거)
-        kernel = np.ones((2, 2), np.uint8)
-        morphed = cv2.morphologyEx(edge_enhanced, cv2.MORPH_OPEN, kernel)
-        
-        # 7. 선명화
-        sharpness = params.get('sharpness', 1.0)
-        if sharpness > 1.0:
-            # 언샤프 마스킹
-            blurred = cv2.GaussianBlur(morphed, (0, 0), 3)
-            sharpened = cv2.addWeighted(morphed, sharpness, blurred, -(sharpness - 1), 0)
-        else:
-            sharpened = morphed
+        # 이진화 이후이므로 언샤프 마스킹(sharpness)은 적용하지 않음 (효과가 거의 없음)
+        return cv2.morphologyEx(edge_enhanced, cv2.MORPH_OPEN, _K2)
+    
+    def _scale_lut(self, alpha: float, beta: float) -> np.ndarray:
+        """
+        선형 변환 (alpha * x + beta) 룩업 테이블 (convertScaleAbs와 동일한 결과)
         
-        return sharpened
+        Args:
+            alpha: 배율
+            beta: 오프셋
+        
+        Returns:
+            256 크기의 uint8 룩업 테이블
+        """
+        key = (alpha, beta)
+        lut = self._lut_cache.get(key)
+        if lut is None:
+            # OpenCV와 동일하게 float32로 계산 후 반올림
+            values = np.abs(np.rint(np.arange(256, dtype=np.float32) * np.float32(alpha) + np.float32(beta)))
+            lut = np.clip(values, 0, 255).astype(np.uint8)
+            self._lut_cache[key] = lut
+        return lut
     
     def process_handwritten(self, image: Union[Image.Image, np.ndarray]) -> Image.Image:
         """
@@ -310,49 +787,24 @@ class Preprocessor:
             전처리된 PIL 이미지
         """
         try:
-            # PIL 이미지로 변환
-            if isinstance(image, np.ndarray):
-                # OpenCV 배열 (BGR)을 PIL 이미지 (RGB)로 변환
-                if len(image.shape) == 3:
-                    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-                pil_image = Image.fromarray(image)
-            else:
-                pil_image = image
-            
-            # OpenCV 처리를 위한 변환
-            cv_image = np.array(pil_image)
-            if len(cv_image.shape) == 3:
-                # HSV 색 공간으로 변환
-                hsv = cv2.cvtColor(cv_image, cv2.COLOR_RGB2HSV)
-                
-                # 빨간색 영역 마스크 (일본식 도장은 주로 빨간색)
-                lower_red1 = np.array([0, 100, 100])
-                upper_red1 = np.array([10, 255, 255])
-                lower_red2 = np.array([160, 100, 100])
-                upper_red2 = np.array([180, 255, 255])
-                
-                mask1 = cv2.inRange(hsv, lower_red1, upper_red1)
-                mask2 = cv2.inRange(hsv, lower_red2, upper_red2)
-                red_mask = mask1 + mask2
-                
-                # 노이즈 제거
-                kernel = np.ones((5, 5), np.uint8)
-                red_mask = cv2.morphologyEx(red_mask, cv2.MORPH_OPEN, kernel)
+            # OpenCV 처리를 위한 변환 (NumPy 입력은 그대로 사용)
+            cv_image = self._to_cv(image)
+            if cv_image.ndim == 3:
+                # 빨간색 영역 마스크
+                red_mask, _ = _compute_red_mask(cv_image)
                 
                 # 원본 이미지와 마스크 결합
                 result = cv2.bitwise_and(cv_image, cv_image, mask=red_mask)
                 
                 # 결과 이미지를 PIL로 변환
-                result_image = Image.fromarray(cv2.cvtColor(result, cv2.COLOR_BGR2RGB))
-                
-                return result_image
+                return self._to_pil(result)
             else:
                 # 그레이스케일 이미지는 그대로 반환
-                return pil_image
+                return self._as_pil(image)
         
         except Exception as e:
             logger.error(f"도장 전처리 오류: {e}")
-            return pil_image
+            return self._as_pil(image)
     
     def enhance_for_strikethrough(self, image: Union[Image.Image, np.ndarray]) -> Image.Image:
         """
@@ -365,25 +817,8 @@ class Preprocessor:
             전처리된 PIL 이미지
         """
         try:
-            # PIL 이미지로 변환
-            if isinstance(image, np.ndarray):
-                # OpenCV 배열 (BGR)을 PIL 이미지 (RGB)로 변환
-                if len(image.shape) == 3:
-                    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-                pil_image = Image.fromarray(image)
-            else:
-                pil_image = image
-            
-            # OpenCV 처리를 위한 변환
-            cv_image = np.array(pil_image)
-            if len(cv_image.shape) == 3:
-                cv_image = cv2.cvtColor(cv_image, cv2.COLOR_RGB2BGR)
-            
-            # 그레이스케일 변환
-            if len(cv_image.shape) == 3:
-                gray = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = cv_image
+            # 그레이스케일 변환 (단일 패스)
+            gray = self._to_gray(image)
             
             # 가우시안 블러
             blurred = cv2.GaussianBlur(gray, (5, 5), 0)
@@ -392,17 +827,14 @@ class Preprocessor:
             edges = cv2.Canny(blurred, 50, 150)
             
             # 선 감지를 위한 모폴로지 연산
-            kernel = np.ones((1, 15), np.uint8)  # 수평선 강조
-            dilated = cv2.dilate(edges, kernel, iterations=1)
+            dilated = cv2.dilate(edges, _KH15, iterations=1)
             
             # 결과 이미지를 PIL로 변환
-            result_image = Image.fromarray(dilated)
-            
-            return result_image
+            return Image.fromarray(dilated)
         
         except Exception as e:
             logger.error(f"취소선 전처리 오류: {e}")
-            return pil_image
+            return self._as_pil(image)
     
     def remove_background(self, image: Union[Image.Image, np.ndarray]) -> Image.Image:
         """
@@ -415,22 +847,11 @@ class Preprocessor:
             배경이 제거된 PIL 이미지
         """
         try:
-            # PIL 이미지로 변환
-            if isinstance(image, np.ndarray):
-                # OpenCV 배열 (BGR)을 PIL 이미지 (RGB)로 변환
-                if len(image.shape) == 3:
-                    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-                pil_image = Image.fromarray(image)
-            else:
-                pil_image = image
-            
-            # OpenCV 처리를 위한 변환
-            cv_image = np.array(pil_image)
-            if len(cv_image.shape) == 3:
-                cv_image = cv2.cvtColor(cv_image, cv2.COLOR_RGB2BGR)
+            # OpenCV 처리를 위한 변환 (NumPy 입력은 그대로 사용)
+            cv_image = self._to_cv(image)
             
             # 그레이스케일 변환
-            if len(cv_image.shape) == 3:
+            if cv_image.ndim == 3:
                 gray = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
             else:
                 gray = cv_image
@@ -445,55 +866,51 @@ class Preprocessor:
             )
             
             # 노이즈 제거
-            kernel = np.ones((3, 3), np.uint8)
-            opened = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
+            opened = cv2.morphologyEx(binary, cv2.MORPH_OPEN, _K3)
             
             # 텍스트 영역 확장
-            dilated = cv2.dilate(opened, kernel, iterations=1)
+            dilated = cv2.dilate(opened, _K3, iterations=1)
             
-            # 마스크 적용
-            if len(cv_image.shape) == 3:
+            # 마스크 적용 (전경은 원본, 배경은 흰색으로 한 번에 합성)
+            if cv_image.ndim == 3:
                 # 컬러 이미지의 경우
-                result = cv2.bitwise_and(cv_image, cv_image, mask=dilated)
-                
-                # 배경을 흰색으로 설정
-                white_bg = np.ones_like(cv_image, np.uint8) * 255
-                bg_mask = cv2.bitwise_not(dilated)
-                background = cv2.bitwise_and(white_bg, white_bg, mask=bg_mask)
-                
-                # 전경과 배경 결합
-                result = cv2.add(result, background)
-                
-                # BGR to RGB
-                result = cv2.cvtColor(result, cv2.COLOR_BGR2RGB)
+                result = np.where(dilated[:, :, None] > 0, cv_image, np.uint8(255))
             else:
                 # 그레이스케일 이미지의 경우
-                result = cv2.bitwise_and(gray, gray, mask=dilated)
-                
-                # 배경을 흰색으로 설정
-                white_bg = np.ones_like(gray, np.uint8) * 255
-                bg_mask = cv2.bitwise_not(dilated)
-                background = cv2.bitwise_and(white_bg, white_bg, mask=bg_mask)
-                
-                # 전경과 배경 결합
-                result = cv2.add(result, background)
+                result = np.where(dilated > 0, gray, np.uint8(255))
             
             # 결과 이미지를 PIL로 변환
-            result_image = Image.fromarray(result)
-            
-            return result_image
+            return self._to_pil(result)
         
         except Exception as e:
             logger.error(f"배경 제거 오류: {e}")
-            return pil_image
+            return self._as_pil(image)
 
 
 class DocumentPreprocessor:
     """문서 이미지 전처리 클래스"""
     
+    # 영역 유형별 신뢰도
+    REGION_CONFIDENCE = {
+        'stamp': 0.8,
+        'handwriting': 0.7,
+        'table': 0.9,
+        'strikethrough': 0.6
+    }
+    
+    # 처리 결과 캐시 최대 항목 수
+    CACHE_SIZE = 64
+    
     def __init__(self):
         """초기화"""
         self.preprocessor = Preprocessor()
+        
+        # 감지기 병렬 실행용 스레드 풀
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="doc-detect")
+        
+        # (이미지 해시, 언어, 문서 유형)별 처리 결과 LRU 캐시 (재시도/다국어 재처리용)
+        self._cache: "OrderedDict[Tuple[str, str, Optional[str]], Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def process_document(self, 
                         image: Union[Image.Image, np.ndarray], 
@@ -510,14 +927,11 @@ class DocumentPreprocessor:
         Returns:
             전처리 결과 및 분석 정보
         """
-        # PIL 이미지로 변환
-        if isinstance(image, np.ndarray):
-            # OpenCV 배열 (BGR)을 PIL 이미지 (RGB)로 변환
-            if len(image.shape) == 3:
-                image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            pil_image = Image.fromarray(image)
-        else:
-            pil_image = image
+        # 동일 이미지/설정의 이전 결과가 있으면 재사용
+        cache_key = (self._calculate_image_hash(image), lang, doc_type)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
         
         # 결과 저장 딕셔너리
         result = {
@@ -532,70 +946,50 @@ class DocumentPreprocessor:
         }
         
         try:
-            # 기본 전처리
-            processed_image = self.preprocessor.process_image(pil_image, lang, doc_type)
-            result['processed_image'] = processed_image
+            # 그레이스케일 변환 (전처리와 감지에서 공유)
+            gray = self.preprocessor._to_gray(image)
             
-            # OpenCV 처리를 위한 변환
-            cv_image = np.array(pil_image)
-            if len(cv_image.shape) == 3:
-                cv_image = cv2.cvtColor(cv_image, cv2.COLOR_RGB2BGR)
+            # 표 감지용 에지 (한 번만 계산)
+            edges = cv2.Canny(gray, 50, 150)
             
-            # 그레이스케일 변환
-            if len(cv_image.shape) == 3:
-                gray = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = cv_image
-            
-            # 도장 감지 (일본 비즈니스 문서)
+            # 감지기는 서로 독립적이고 OpenCV 연산 중 GIL을 해제하므로 스레드로 병렬 실행
+            futures = {}
             if lang == "jpn":
-                has_stamps, stamp_regions = self._detect_stamps(cv_image)
-                result['has_stamps'] = has_stamps
-                if has_stamps:
-                    for region in stamp_regions:
+                # 도장 감지 (일본 비즈니스 문서)
+                futures['stamp'] = self._executor.submit(self._detect_stamps, self._to_bgr(image))
+            futures['handwriting'] = self._executor.submit(self._detect_handwriting, gray)
+            futures['table'] = self._executor.submit(self._detect_tables, gray, edges)
+            futures['strikethrough'] = self._executor.submit(self._detect_strikethrough, gray)
+            
+            # 기본 전처리 (감지와 동시에 현재 스레드에서 실행)
+            processed = self.preprocessor._process_gray(gray, lang, doc_type)
+            result['processed_image'] = Image.fromarray(processed)
+            
+            # 감지 결과 수집 (유형별 고정 순서 유지)
+            detected = {}
+            for region_type, future in futures.items():
+                found, regions = future.result()
+                detected[region_type] = found
+                if found:
+                    for region in regions:
                         result['regions'].append({
-                            'type': 'stamp',
+                            'type': region_type,
                             'bbox': region,
-                            'confidence': 0.8  # 임의 신뢰도
+                            'confidence': self.REGION_CONFIDENCE[region_type]  # 임의 신뢰도
                         })
             
-            # 손글씨 감지
-            has_handwriting, handwriting_regions = self._detect_handwriting(gray)
+            has_stamps = detected.get('stamp', False)
+            has_handwriting = detected['handwriting']
+            has_table = detected['table']
+            result['has_stamps'] = has_stamps
             result['has_handwriting'] = has_handwriting
-            if has_handwriting:
-                for region in handwriting_regions:
-                    result['regions'].append({
-                        'type': 'handwriting',
-                        'bbox': region,
-                        'confidence': 0.7  # 임의 신뢰도
-                    })
-            
-            # 표 감지
-            has_table, table_regions = self._detect_tables(gray)
             result['has_table'] = has_table
-            if has_table:
-                for region in table_regions:
-                    result['regions'].append({
-                        'type': 'table',
-                        'bbox': region,
-                        'confidence': 0.9  # 임의 신뢰도
-                    })
-            
-            # 취소선 감지
-            has_strikethrough, strikethrough_regions = self._detect_strikethrough(gray)
-            result['has_strikethrough'] = has_strikethrough
-            if has_strikethrough:
-                for region in strikethrough_regions:
-                    result['regions'].append({
-                        'type': 'strikethrough',
-                        'bbox': region,
-                        'confidence': 0.6  # 임의 신뢰도
-                    })
+            result['has_strikethrough'] = detected['strikethrough']
             
             # 문서 유형 추론 (지정되지 않은 경우)
             if doc_type is None:
                 result['doc_type'] = self._infer_document_type(
-                    cv_image, 
+                    gray, 
                     has_handwriting, 
                     has_table, 
                     has_stamps
@@ -603,56 +997,112 @@ class DocumentPreprocessor:
         
         except Exception as e:
             logger.error(f"문서 전처리 오류: {e}")
-            result['processed_image'] = pil_image  # 오류 시 원본 이미지 반환
+            # 오류 시 원본 이미지 반환
+            result['processed_image'] = self.preprocessor._as_pil(image)
             result['error'] = str(e)
+            return result
         
+        self._put_cached(cache_key, result)
         return result
     
-    def _detect_stamps(self, image: np.ndarray) -> Tuple[bool, List[List[int]]]:
+    def _calculate_image_hash(self, image: Union[Image.Image, np.ndarray]) -> str:
         """
-        도장 감지
+        이미지 해시 계산 (캐시 키용)
         
         Args:
-            image: OpenCV 이미지 (BGR)
+            image: PIL 이미지 또는 NumPy 배열
         
         Returns:
-            도장 포함 여부, 도장 영역 목록 [[x1, y1, x2, y2], ...]
+            이미지 해시 문자열
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        if isinstance(image, np.ndarray):
+            hasher.update(f"{image.shape}:{image.dtype}".encode())
+            hasher.update(np.ascontiguousarray(image).data)
+        else:
+            hasher.update(f"{image.size}:{image.mode}".encode())
+            hasher.update(image.tobytes())
+        return hasher.hexdigest()
+    
+    def _get_cached(self, key: Tuple[str, str, Optional[str]]) -> Optional[Dict[str, Any]]:
         """
-        stamp_regions = []
+        캐시에서 처리 결과 확인
         
-        # HSV 색 공간으로 변환
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+        Args:
+            key: 캐시 키 (이미지 해시, 언어, 문서 유형)
         
-        # 빨간색 영역 마스크 (일본식 도장은 주로 빨간색)
-        lower_red1 = np.array([0, 100, 100])
-        upper_red1 = np.array([10, 255, 255])
-        lower_red2 = np.array([160, 100, 100])
-        upper_red2 = np.array([180, 255, 255])
+        Returns:
+            캐시된 처리 결과 사본 (없으면 None)
+        """
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                return None
+            self._cache.move_to_end(key)
+        
+        # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 사본 반환
+        result = dict(cached)
+        result['regions'] = [dict(region) for region in cached['regions']]
+        return result
+    
+    def _put_cached(self, key: Tuple[str, str, Optional[str]], result: Dict[str, Any]) -> None:
+        """
+        처리 결과를 캐시에 저장
         
-        mask1 = cv2.inRange(hsv, lower_red1, upper_red1)
-        mask2 = cv2.inRange(hsv, lower_red2, upper_red2)
-        red_mask = mask1 + mask2
+        Args:
+            key: 캐시 키 (이미지 해시, 언어, 문서 유형)
+            result: 처리 결과
+        """
+        entry = dict(result)
+        entry['regions'] = [dict(region) for region in result['regions']]
+        with self._cache_lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def _to_bgr(self, image: Union[Image.Image, np.ndarray]) -> np.ndarray:
+        """
+        입력 이미지를 OpenCV 컬러 배열 (BGR)로 변환
         
-        # 노이즈 제거
-        kernel = np.ones((5, 5), np.uint8)
-        red_mask = cv2.morphologyEx(red_mask, cv2.MORPH_OPEN, kernel)
+        Args:
+            image: PIL 이미지 (RGB) 또는 NumPy 배열 (BGR 또는 그레이스케일)
         
-        # 윤곽선 검출
-        contours, _ = cv2.findContours(red_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        Returns:
+            BGR NumPy 배열
+        """
+        cv_image = self.preprocessor._to_cv(image)
+        if cv_image.ndim == 2:
+            return cv2.cvtColor(cv_image, cv2.COLOR_GRAY2BGR)
+        return cv_image
+    
+    def _detect_stamps(self, 
+                      image: np.ndarray, 
+                      red_mask: Optional[np.ndarray] = None) -> Tuple[bool, List[List[int]]]:
+        """
+        도장 감지
         
-        # 도장 후보 필터링
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if area < 500:  # 너무 작은 영역 무시
-                continue
-            
-            # 경계 상자
-            x, y, w, h = cv2.boundingRect(contour)
-            
-            # 종횡비 검사 (도장은 대체로 원형 또는 정사각형에 가까움)
-            aspect_ratio = float(w) / h if h > 0 else 0
-            if 0.5 <= aspect_ratio <= 2.0:
-                stamp_regions.append([x, y, x + w, y + h])
+        Args:
+            image: OpenCV 이미지 (BGR)
+            red_mask: 미리 계산된 빨간색 마스크 (None이면 새로 계산)
+        
+        Returns:
+            도장 포함 여부, 도장 영역 목록 [[x1, y1, x2, y2], ...]
+        """
+        # 빨간색 영역 마스크
+        if red_mask is None:
+            red_mask, _ = _compute_red_mask(image)
+        
+        # 연결 요소 검출 (너무 작은 영역 무시)
+        boxes = _component_boxes(red_mask, 500)
+        x, y, w, h = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+        
+        # 종횡비 검사 (도장은 대체로 원형 또는 정사각형에 가까움)
+        aspect_ratio = w / h
+        keep = (aspect_ratio >= 0.5) & (aspect_ratio <= 2.0)
+        stamp_regions = np.stack(
+            [x[keep], y[keep], x[keep] + w[keep], y[keep] + h[keep]], axis=1
+        ).tolist()
         
         return len(stamp_regions) > 0, stamp_regions
     
@@ -672,36 +1122,21 @@ class DocumentPreprocessor:
         _, binary = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
         
         # 노이즈 제거
-        kernel = np.ones((3, 3), np.uint8)
-        opening = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
+        opening = cv2.morphologyEx(binary, cv2.MORPH_OPEN, _K3)
         
         # 획 두께 변환 (Stroke Width Transform 간소화 버전)
         dist_transform = cv2.distanceTransform(opening, cv2.DIST_L2, 5)
         
         # 텍스트 영역 확장
-        dilated = cv2.dilate(opening, kernel, iterations=2)
+        dilated = cv2.dilate(opening, _K3, iterations=2)
         
-        # 윤곽선 검출
-        contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # 연결 요소 검출 (너무 작은 영역 무시)
+        boxes = _component_boxes(dilated, 200)
         
         # 손글씨 후보 필터링
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if area < 200:  # 너무 작은 영역 무시
-                continue
-            
-            # 경계 상자
-            x, y, w, h = cv2.boundingRect(contour)
-            
-            # ROI 추출
-            roi = dist_transform[y:y+h, x:x+w]
-            
-            if roi.size == 0:
-                continue
-            
+        for x, y, w, h in boxes.tolist():
             # 획 두께 통계
-            mean_width = np.mean(roi[roi > 0]) if np.any(roi > 0) else 0
-            std_width = np.std(roi[roi > 0]) if np.any(roi > 0) else 0
+            mean_width, std_width = _stroke_stats(dist_transform, y, x, h, w)
             
             # 손글씨 특성: 획 두께 변화가 크고, 평균 두께가 인쇄된 텍스트와 다름
             if std_width / (mean_width + 1e-6) > 0.5 or mean_width > 3.0:
@@ -709,57 +1144,53 @@ class DocumentPreprocessor:
         
         return len(handwriting_regions) > 0, handwriting_regions
     
-    def _detect_tables(self, image: np.ndarray) -> Tuple[bool, List[List[int]]]:
+    def _detect_tables(self, 
+                      image: np.ndarray, 
+                      edges: Optional[np.ndarray] = None) -> Tuple[bool, List[List[int]]]:
         """
         표 영역 감지
         
         Args:
             image: 그레이스케일 OpenCV 이미지
+            edges: 미리 계산된 Canny 에지 (None이면 새로 계산)
         
         Returns:
             표 포함 여부, 표 영역 목록 [[x1, y1, x2, y2], ...]
         """
-        table_regions = []
-        
         # 에지 감지
-        edges = cv2.Canny(image, 50, 150)
+        if edges is None:
+            edges = cv2.Canny(image, 50, 150)
         
         # 선 검출을 위한 모폴로지 연산
-        kernel_h = np.ones((1, 30), np.uint8)  # 수평선 강조
-        kernel_v = np.ones((30, 1), np.uint8)  # 수직선 강조
-        
-        dilated_h = cv2.dilate(edges, kernel_h, iterations=1)
-        dilated_v = cv2.dilate(edges, kernel_v, iterations=1)
+        dilated_h = cv2.dilate(edges, _KH30, iterations=1)  # 수평선 강조
+        dilated_v = cv2.dilate(edges, _KV30, iterations=1)  # 수직선 강조
         
         # 수평선 및 수직선 결합
         table_mask = cv2.bitwise_or(dilated_h, dilated_v)
         
         # 표 영역 확장
-        kernel = np.ones((5, 5), np.uint8)
-        table_mask = cv2.dilate(table_mask, kernel, iterations=2)
+        table_mask = cv2.dilate(table_mask, _K5, iterations=2)
         
-        # 윤곽선 검출
-        contours, _ = cv2.findContours(table_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # 연결 요소 검출 (너무 작은 영역 무시)
+        boxes = _component_boxes(table_mask, 5000)
+        x, y, w, h = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
         
-        # 표 후보 필터링
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if area < 5000:  # 너무 작은 영역 무시
-                continue
-            
-            # 경계 상자
-            x, y, w, h = cv2.boundingRect(contour)
-            
-            # 종횡비 검사 (표는 일반적으로 너비가 높이보다 크거나 비슷함)
-            aspect_ratio = float(w) / h if h > 0 else 0
-            if 0.5 <= aspect_ratio <= 5.0:
-                # 선의 밀도 계산
-                roi = table_mask[y:y+h, x:x+w]
-                line_density = np.sum(roi > 0) / (w * h)
-                
-                # 일정 선 밀도 이상인 경우 표로 간주
-                if line_density > 0.05:
-                    table_regions.append([x, y, x + w, y + h])
+        # 종횡비 검사 (표는 일반적으로 너비가 높이보다 크거나 비슷함)
+        aspect_ratio = w / h
+        keep = (aspect_ratio >= 0.5) & (aspect_ratio <= 5.0)
+        x, y, w, h = x[keep], y[keep], w[keep], h[keep]
+        
+        # 적분 영상으로 각 영역의 선 밀도를 O(1)에 계산
+        integral = cv2.integral(table_mask // 255)
+        line_pixels = (integral[y + h, x + w] - integral[y, x + w]
+                       - integral[y + h, x] + integral[y, x])
+        line_density = line_pixels / (w * h)
+        
+        # 일정 선 밀도 이상인 경우 표로 간주
+        keep = line_density > 0.05
+        table_regions = np.stack(
+            [x[keep], y[keep], x[keep] + w[keep], y[keep] + h[keep]], axis=1
+        ).tolist()
         
         return len(table_regions) > 0, table_regions
     
@@ -775,49 +1206,50 @@ class DocumentPreprocessor:
         """
         strikethrough_regions = []
         
-        # 에지 감지
-        edges = cv2.Canny(image, 50, 150)
+        # 선분 검출 (에지 계산 포함)
+        lines = _detect_line_segments(image)
+        
+        if lines is None or len(lines) == 0:
+            return False, []
         
-        # 허프 라인 변환
-        lines = cv2.HoughLinesP(
-            edges, 1, np.pi/180, threshold=50, 
-            minLineLength=50, maxLineGap=10
-        )
+        # 선 좌표를 (N, 4) 배열로 정리
+        lines = np.rint(lines.reshape(-1, 4)).astype(np.int32)
+        x1, y1, x2, y2 = lines[:, 0], lines[:, 1], lines[:, 2], lines[:, 3]
         
-        if lines is None:
+        # 선 길이 및 기울기 일괄 계산
+        line_length = np.hypot(x2 - x1, y2 - y1)
+        angle = np.abs(np.degrees(np.arctan2(y2 - y1, x2 - x1)))
+        
+        # 수평에 가까운 선 (취소선은 주로 수평)
+        is_horizontal = (angle < 20) | (angle > 160)
+        candidates = lines[is_horizontal & (line_length > 50)]
+        
+        if len(candidates) == 0:
             return False, []
         
+        # 선 주변 영역 계산
+        margin = 10
+        height, width = image.shape[:2]
+        x_min = np.maximum(0, np.minimum(candidates[:, 0], candidates[:, 2]) - margin)
+        y_min = np.maximum(0, np.minimum(candidates[:, 1], candidates[:, 3]) - margin)
+        x_max = np.minimum(width, np.maximum(candidates[:, 0], candidates[:, 2]) + margin)
+        y_max = np.minimum(height, np.maximum(candidates[:, 1], candidates[:, 3]) + margin)
+        
         # 이진화
         _, binary = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
         
-        # 각 선에 대해
-        for line in lines:
-            x1, y1, x2, y2 = line[0]
-            
-            # 선 길이 계산
-            line_length = np.sqrt((x2 - x1)**2 + (y2 - y1)**2)
-            
-            # 선 기울기 계산
-            angle = np.degrees(np.arctan2(y2 - y1, x2 - x1))
-            
-            # 수평에 가까운 선 (취소선은 주로 수평)
-            is_horizontal = abs(angle) < 20 or abs(angle) > 160
-            
-            if is_horizontal and line_length > 50:
-                # 선 주변 영역 확인
-                margin = 10
-                y_min = max(0, min(y1, y2) - margin)
-                y_max = min(image.shape[0], max(y1, y2) + margin)
-                x_min = max(0, min(x1, x2) - margin)
-                x_max = min(image.shape[1], max(x1, x2) + margin)
-                
-                # 선 주변 영역에 텍스트가 있는지 확인
-                roi = binary[y_min:y_max, x_min:x_max]
-                text_density = np.sum(roi > 0) / (roi.size + 1e-6)
-                
-                # 텍스트 영역 위에 있는 선만 취소선으로 간주
-                if text_density > 0.1:
-                    strikethrough_regions.append([x_min, y_min, x_max, y_max])
+        # 적분 영상으로 각 영역의 텍스트 픽셀 수를 O(1)에 계산
+        integral = cv2.integral(binary // 255)
+        text_pixels = (integral[y_max, x_max] - integral[y_min, x_max]
+                       - integral[y_max, x_min] + integral[y_min, x_min])
+        roi_size = (y_max - y_min) * (x_max - x_min)
+        text_density = text_pixels / (roi_size + 1e-6)
+        
+        # 텍스트 영역 위에 있는 선만 취소선으로 간주
+        keep = text_density > 0.1
+        strikethrough_regions = np.stack(
+            [x_min[keep], y_min[keep], x_max[keep], y_max[keep]], axis=1
+        ).tolist()
         
         return len(strikethrough_regions) > 0, strikethrough_regions
     
@@ -830,7 +1262,7 @@ class DocumentPreprocessor:
         문서 유형 추론
         
         Args:
-            image: OpenCV 이미지 (BGR)
+            image: OpenCV 이미지 (BGR 또는 그레이스케일)
             has_handwriting: 손글씨 포함 여부
             has_table: 표 포함 여부
             has_stamps: 도장 포함 여부
@@ -8,11 +8,167 @@ import cv2
 import numpy as np
 from PIL import Image
 import logging
-from typing import Dict, Any, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 선택적 라이브러리 임포트
+try:
+    import numba  # JIT 컴파일 (골격화 가속)
+except ImportError:
+    numba = None
+    logger.warning("numba 라이브러리가 설치되지 않았습니다. 골격화가 모폴로지 반복 구현으로 동작합니다.")
+
+# 모폴로지 연산용 커널 (불변이므로 모듈 로드 시 한 번만 생성)
+_K3 = np.ones((3, 3), np.uint8)
+_K5 = np.ones((5, 5), np.uint8)
+_KCROSS = cv2.getStructuringElement(cv2.MORPH_CROSS, (3, 3))
+
+
+if numba is not None:
+    @numba.njit(cache=True, nogil=True)
+    def _zhang_suen_thinning(binary: np.ndarray) -> np.ndarray:
+        """
+        Zhang-Suen 세선화
+        
+        Args:
+            binary: 이진화 이미지 (0 또는 0이 아닌 값)
+        
+        Returns:
+            골격 이미지 (0 또는 1)
+        """
+        h, w = binary.shape
+        
+        # 경계 검사를 없애기 위해 1픽셀 여백 추가
+        img = np.zeros((h + 2, w + 2), np.uint8)
+        for i in range(h):
+            for j in range(w):
+                if binary[i, j] > 0:
+                    img[i + 1, j + 1] = 1
+        marker = np.zeros_like(img)
+        
+        changed = True
+        while changed:
+            changed = False
+            for step in range(2):
+                # 삭제 대상 표시 (현재 이미지 기준)
+                for i in range(1, h + 1):
+                    for j in range(1, w + 1):
+                        if img[i, j] == 0:
+                            continue
+                        p2 = img[i - 1, j]
+                        p3 = img[i - 1, j + 1]
+                        p4 = img[i, j + 1]
+                        p5 = img[i + 1, j + 1]
+                        p6 = img[i + 1, j]
+                        p7 = img[i + 1, j - 1]
+                        p8 = img[i, j - 1]
+                        p9 = img[i - 1, j - 1]
+                        
+                        # 이웃 전경 픽셀 수
+                        b = p2 + p3 + p4 + p5 + p6 + p7 + p8 + p9
+                        if b < 2 or b > 6:
+                            continue
+                        
+                        # 0 -> 1 전이 횟수
+                        a = ((p2 == 0 and p3 == 1) + (p3 == 0 and p4 == 1) +
+                             (p4 == 0 and p5 == 1) + (p5 == 0 and p6 == 1) +
+                             (p6 == 0 and p7 == 1) + (p7 == 0 and p8 == 1) +
+                             (p8 == 0 and p9 == 1) + (p9 == 0 and p2 == 1))
+                        if a != 1:
+                            continue
+                        
+                        if step == 0:
+                            if p2 * p4 * p6 != 0 or p4 * p6 * p8 != 0:
+                                continue
+                        else:
+                            if p2 * p4 * p8 != 0 or p2 * p6 * p8 != 0:
+                                continue
+                        marker[i, j] = 1
+                
+                # 표시된 픽셀 삭제
+                removed = 0
+                for i in range(1, h + 1):
+                    for j in range(1, w + 1):
+                        if marker[i, j]:
+                            img[i, j] = 0
+                            marker[i, j] = 0
+                            removed += 1
+                if removed > 0:
+                    changed = True
+        
+        return img[1:h + 1, 1:w + 1].copy()
+    
+    @numba.njit(cache=True, fastmath=True, nogil=True)
+    def _masked_stroke_stats(dist: np.ndarray, skeleton: np.ndarray) -> Tuple[float, float, int]:
+        """
+        골격 픽셀 위치의 선폭 평균/표준편차 (단일 순회)
+        
+        Args:
+            dist: 거리 변환 결과
+            skeleton: 골격 이미지 (0이 아닌 값이 골격)
+        
+        Returns:
+            평균 선폭, 선폭 표준편차, 골격 픽셀 수
+        """
+        h, w = dist.shape
+        total = 0.0
+        total_sq = 0.0
+        count = 0
+        for i in range(h):
+            for j in range(w):
+                if skeleton[i, j]:
+                    value = dist[i, j]
+                    total += value
+                    total_sq += value * value
+                    count += 1
+        if count == 0:
+            return 0.0, 0.0, 0
+        mean = total / count
+        return mean, np.sqrt(max(total_sq / count - mean * mean, 0.0)), count
+else:
+    _zhang_suen_thinning = None
+    
+    def _masked_stroke_stats(dist: np.ndarray, skeleton: np.ndarray) -> Tuple[float, float, int]:
+        """
+        골격 픽셀 위치의 선폭 평균/표준편차 (NumPy 대체 구현)
+        
+        Args:
+            dist: 거리 변환 결과
+            skeleton: 골격 이미지 (0이 아닌 값이 골격)
+        
+        Returns:
+            평균 선폭, 선폭 표준편차, 골격 픽셀 수
+        """
+        values = dist[skeleton > 0]
+        if values.size == 0:
+            return 0.0, 0.0, 0
+        return float(values.mean()), float(values.std()), int(values.size)
+
+
+# 빨간색 HSV 범위 (OpenCV H는 0-179, 빨간색은 양 끝에 걸쳐 있음)
+_RED_LOWER_1 = np.array([0, 100, 100], dtype=np.uint8)
+_RED_UPPER_1 = np.array([10, 255, 255], dtype=np.uint8)
+_RED_LOWER_2 = np.array([160, 100, 100], dtype=np.uint8)
+_RED_UPPER_2 = np.array([179, 255, 255], dtype=np.uint8)
+
+
+def _red_mask(hsv: np.ndarray) -> np.ndarray:
+    """
+    HSV 이미지의 빨간색 픽셀 마스크 (H값이 약 0-10 또는 160-180)
+    
+    Args:
+        hsv: HSV 이미지
+    
+    Returns:
+        빨간색 픽셀 마스크 (uint8, 빨간색 255)
+    """
+    # inRange/bitwise_or는 SIMD로 한 번에 처리 (임시 불리언 배열/인덱스 배열 없음)
+    mask = cv2.inRange(hsv, _RED_LOWER_1, _RED_UPPER_1)
+    return cv2.bitwise_or(mask, cv2.inRange(hsv, _RED_LOWER_2, _RED_UPPER_2), dst=mask)
+
 
 class SpecialItemDetector:
     """특수 항목(도장, 손글씨, 취소선 등) 감지 및 처리 클래스"""
@@ -28,6 +184,9 @@ class SpecialItemDetector:
         self.detect_handwriting = config.get('detect_handwriting', True)
         self.detect_strikethrough = config.get('detect_strikethrough', True)
         
+        # 고품질 노이즈 제거 (비-로컬 평균, 매우 느리므로 선택 사항)
+        self.high_quality_denoise = config.get('high_quality_denoise', False)
+        
         # 도장 감지 설정
         self.stamp_params = {
             'min_radius': 30,
@@ -48,6 +207,9 @@ class SpecialItemDetector:
             'line_thickness_max': 10,
             'min_line_length': 50
         }
+        
+        # 감지기 병렬 실행용 스레드 풀
+        self._pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="special-detect")
     
     def process_image(self, image: Image.Image) -> Dict[str, Any]:
         """
@@ -59,11 +221,13 @@ class SpecialItemDetector:
         Returns:
             특수 항목 정보 딕셔너리
         """
-        # PIL 이미지를 OpenCV 형식으로 변환
-        cv_image = self._pil_to_cv(image)
+        # PIL 이미지를 RGB 배열로 사용 (BGR 변환 없이 버퍼를 그대로 참조)
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        rgb_image = np.asarray(image)
         
         # 이미지 전처리
-        processed_image = self._preprocess_image(cv_image)
+        processed_image = self._preprocess_image(rgb_image)
         
         # 결과 저장 딕셔너리
         results = {
@@ -73,55 +237,51 @@ class SpecialItemDetector:
             'strikethrough_regions': []
         }
         
-        # 도장 감지
+        # 감지기는 서로 독립적이고 OpenCV 연산 중 GIL을 해제하므로 스레드로 병렬 실행
+        futures = {}
         if self.detect_stamps:
-            stamps = self._detect_stamps(cv_image, processed_image)
-            if stamps:
-                results['stamps'] = stamps
-                results['has_special_items'] = True
-        
-        # 손글씨 감지
+            # 도장 감지
+            futures['stamps'] = self._pool.submit(self._detect_stamps, rgb_image, processed_image)
         if self.detect_handwriting:
-            handwriting_regions = self._detect_handwriting(cv_image, processed_image)
-            if handwriting_regions:
-                results['handwriting_regions'] = handwriting_regions
-                results['has_special_items'] = True
-        
-        # 취소선 감지
+            # 손글씨 감지
+            futures['handwriting_regions'] = self._pool.submit(self._detect_handwriting, rgb_image, processed_image)
         if self.detect_strikethrough:
-            strikethrough_regions = self._detect_strikethrough(cv_image, processed_image)
-            if strikethrough_regions:
-                results['strikethrough_regions'] = strikethrough_regions
+            # 취소선 감지
+            futures['strikethrough_regions'] = self._pool.submit(self._detect_strikethrough, rgb_image, processed_image)
+        
+        # 감지 결과 수집
+        for key, future in futures.items():
+            items = future.result()
+            if items:
+                results[key] = items
                 results['has_special_items'] = True
         
         return results
     
-    def _pil_to_cv(self, pil_image: Image.Image) -> np.ndarray:
-        """PIL 이미지를 OpenCV 형식으로 변환"""
-        # RGB to BGR 변환을 위한 복사
-        return cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
-    
-    def _preprocess_image(self, cv_image: np.ndarray) -> Dict[str, np.ndarray]:
+    def _preprocess_image(self, rgb_image: np.ndarray) -> Dict[str, np.ndarray]:
         """
         이미지 전처리
         
         Args:
-            cv_image: OpenCV 이미지
+            rgb_image: RGB 이미지 배열
         
         Returns:
             전처리된 이미지를 포함하는 딕셔너리
         """
         # 그레이스케일 변환
-        gray = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
+        gray = cv2.cvtColor(rgb_image, cv2.COLOR_RGB2GRAY)
         
-        # 노이즈 제거
-        denoised = cv2.fastNlMeansDenoising(gray, None, 10, 7, 21)
+        # 노이즈 제거 (기본은 Canny/이진화에 충분한 가우시안 블러)
+        if self.high_quality_denoise:
+            denoised = cv2.fastNlMeansDenoising(gray, None, 10, 7, 21)
+        else:
+            denoised = cv2.GaussianBlur(gray, (5, 5), 1.4)
         
-        # 이진화
+        # 이진화 (페이지마다 Otsu 임계값 계산, 감지기는 문서/스레드 간 공유되므로 상태를 두지 않음)
         _, binary = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
         
         # 컬러 관련 처리를 위한 HSV 변환
-        hsv = cv2.cvtColor(cv_image, cv2.COLOR_BGR2HSV)
+        hsv = cv2.cvtColor(rgb_image, cv2.COLOR_RGB2HSV)
         
         # 에지 감지
         edges = cv2.Canny(denoised, 50, 150)
@@ -141,125 +301,101 @@ class SpecialItemDetector:
         이미지에서 도장 감지
         
         Args:
-            original_image: 원본 OpenCV 이미지
+            original_image: 원본 RGB 이미지
             processed_images: 전처리된 이미지 딕셔너리
         
         Returns:
             감지된 도장 목록
         """
-        stamps = []
+        # 도장 후보 (중심 x, 중심 y, 반지름, 빨간색 여부, 신뢰도)
+        candidates = []
         height, width = original_image.shape[:2]
         
-        # 1. 원형 도장 감지 (Hough Circles)
+        # 1. 원형 도장 감지 (Hough Circles, 절반 해상도에서 검출 후 좌표 복원)
+        small_gray = cv2.pyrDown(processed_images['gray'])
         circles = cv2.HoughCircles(
-            processed_images['gray'],
+            small_gray,
             cv2.HOUGH_GRADIENT,
             dp=1,
-            minDist=50,
+            minDist=25,
             param1=100,
             param2=30,
-            minRadius=self.stamp_params['min_radius'],
-            maxRadius=self.stamp_params['max_radius']
+            minRadius=max(10, self.stamp_params['min_radius'] // 2),
+            maxRadius=self.stamp_params['max_radius'] // 2
         )
         
         if circles is not None:
-            circles = np.round(circles[0, :]).astype(int)
+            # 검증은 원본 해상도의 HSV/이진화 이미지로 수행
+            circles = np.round(circles[0, :] * 2).astype(int)
             
             for (x, y, r) in circles:
                 # 범위 확인
                 if x < 0 or y < 0 or x >= width or y >= height:
                     continue
                 
-                # 도장 영역 추출
-                roi = original_image[max(0, y-r):min(height, y+r), max(0, x-r):min(width, x+r)]
-                if roi.size == 0:
+                # 도장 영역 (전처리된 HSV/이진화 이미지에서 잘라 사용)
+                y0, y1 = max(0, y-r), min(height, y+r)
+                x0, x1 = max(0, x-r), min(width, x+r)
+                hsv_roi = processed_images['hsv'][y0:y1, x0:x1]
+                if hsv_roi.size == 0:
                     continue
                 
                 # 빨간색 비율 확인 (일본식 도장은 주로 빨간색)
-                is_red_stamp = self._check_red_ratio(roi)
+                is_red_stamp = self._check_red_ratio(hsv_roi)
                 
                 # 원형 밀도 확인
-                circularity = self._check_circularity(
-                    processed_images['binary'][max(0, y-r):min(height, y+r), max(0, x-r):min(width, x+r)]
-                )
+                circularity = self._check_circularity(processed_images['binary'][y0:y1, x0:x1])
                 
                 # 도장으로 판단
                 if is_red_stamp or circularity > self.stamp_params['circle_threshold']:
-                    stamps.append({
-                        'type': 'stamp',
-                        'position': {'x': int(x), 'y': int(y)},
-                        'radius': int(r),
-                        'is_red': is_red_stamp,
-                        'confidence': float(circularity if not is_red_stamp else max(0.9, circularity))
-                    })
+                    confidence = circularity if not is_red_stamp else max(0.9, circularity)
+                    candidates.append((x, y, r, is_red_stamp, confidence))
         
         # 2. 사각형 도장 감지 (일반적으로 빨간색)
         red_mask = self._extract_red_regions(processed_images['hsv'])
-        contours, _ = cv2.findContours(red_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            
-            # 너무 작거나 큰 영역 무시
-            min_area = np.pi * (self.stamp_params['min_radius'] ** 2) * 0.8
-            max_area = np.pi * (self.stamp_params['max_radius'] ** 2) * 1.5
-            
-            if min_area <= area <= max_area:
-                x, y, w, h = cv2.boundingRect(contour)
-                
-                # 비율 검사 (도장은 대체로 정사각형에 가까움)
-                aspect_ratio = float(w) / h if h > 0 else 0
-                if 0.5 <= aspect_ratio <= 2.0:
-                    # 이미 감지된 원형 도장과 겹치는지 확인
-                    if not self._overlaps_with_existing_stamps(stamps, x, y, max(w, h)/2):
-                        stamps.append({
-                            'type': 'stamp',
-                            'position': {'x': int(x + w/2), 'y': int(y + h/2)},
-                            'radius': int(max(w, h)/2),
-                            'is_red': True,
-                            'confidence': 0.85
-                        })
-        
-        return stamps
+        _, _, stats, _ = cv2.connectedComponentsWithStats(red_mask, connectivity=8)
+        xs = stats[1:, cv2.CC_STAT_LEFT]
+        ys = stats[1:, cv2.CC_STAT_TOP]
+        ws = stats[1:, cv2.CC_STAT_WIDTH]
+        hs = stats[1:, cv2.CC_STAT_HEIGHT]
+        
+        # 너무 작거나 큰 영역 무시 (테두리만 있는 도장도 포함되도록
+        # 외곽 윤곽 면적에 해당하는 경계 상자 면적으로 판단)
+        min_area = np.pi * (self.stamp_params['min_radius'] ** 2) * 0.8
+        max_area = np.pi * (self.stamp_params['max_radius'] ** 2) * 1.5
+        areas = ws * hs
+        
+        # 비율 검사 (도장은 대체로 정사각형에 가까움)
+        aspect_ratio = ws / np.maximum(hs, 1)
+        keep = ((areas >= min_area) & (areas <= max_area) &
+                (aspect_ratio >= 0.5) & (aspect_ratio <= 2.0))
+        
+        for x, y, w, h in zip(xs[keep], ys[keep], ws[keep], hs[keep]):
+            candidates.append((int(x + w/2), int(y + h/2), int(max(w, h)/2), True, 0.85))
+        
+        # 겹치는 후보 제거 (신뢰도 높은 순으로 유지)
+        return self._suppress_overlapping_stamps(
+            np.array(candidates, dtype=np.float64).reshape(-1, 5)
+        )
     
-    def _check_red_ratio(self, image: np.ndarray) -> bool:
-        """이미지에서 빨간색 비율 확인"""
-        if image.size == 0:
+    def _check_red_ratio(self, hsv_roi: np.ndarray) -> bool:
+        """HSV 이미지 영역에서 빨간색 비율 확인"""
+        if hsv_roi.size == 0:
             return False
         
-        # HSV로 변환
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-        
-        # 빨간색 영역 마스크 (HSV에서 H값이 약 0-10 또는 160-180)
-        lower_red1 = np.array([0, 100, 100])
-        upper_red1 = np.array([10, 255, 255])
-        lower_red2 = np.array([160, 100, 100])
-        upper_red2 = np.array([180, 255, 255])
-        
-        mask1 = cv2.inRange(hsv, lower_red1, upper_red1)
-        mask2 = cv2.inRange(hsv, lower_red2, upper_red2)
-        red_mask = mask1 + mask2
-        
-        # 빨간색 픽셀 비율 계산
-        red_ratio = np.sum(red_mask > 0) / (image.shape[0] * image.shape[1])
+        # 빨간색 픽셀 비율 계산 (countNonZero는 SIMD로 임시 배열 없이 집계)
+        red_mask = _red_mask(hsv_roi)
+        red_ratio = cv2.countNonZero(red_mask) / red_mask.size
         
         return red_ratio > self.stamp_params['red_threshold']
     
     def _extract_red_regions(self, hsv_image: np.ndarray) -> np.ndarray:
         """HSV 이미지에서 빨간색 영역 추출"""
-        # 빨간색 영역 마스크 (HSV에서 H값이 약 0-10 또는 160-180)
-        lower_red1 = np.array([0, 100, 100])
-        upper_red1 = np.array([10, 255, 255])
-        lower_red2 = np.array([160, 100, 100])
-        upper_red2 = np.array([180, 255, 255])
-        
-        mask1 = cv2.inRange(hsv_image, lower_red1, upper_red1)
-        mask2 = cv2.inRange(hsv_image, lower_red2, upper_red2)
-        red_mask = mask1 + mask2
+        # 빨간색 영역 마스크
+        red_mask = _red_mask(hsv_image)
         
         # 노이즈 제거
-        kernel = np.ones((5, 5), np.uint8)
-        red_mask = cv2.morphologyEx(red_mask, cv2.MORPH_OPEN, kernel)
+        red_mask = cv2.morphologyEx(red_mask, cv2.MORPH_OPEN, _K5)
         
         return red_mask
     
@@ -268,45 +404,67 @@ class SpecialItemDetector:
         if binary_roi.size == 0:
             return 0.0
         
-        # 윤곽선 찾기
-        contours, _ = cv2.findContours(binary_roi, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # 연결 요소 통계
+        num, labels, stats, _ = cv2.connectedComponentsWithStats(binary_roi, connectivity=8)
         
-        if not contours:
+        if num < 2:
             return 0.0
         
-        # 가장 큰 윤곽선 사용
-        largest_contour = max(contours, key=cv2.contourArea)
-        area = cv2.contourArea(largest_contour)
+        # 가장 큰 연결 요소만 경계 상자 크기로 추출 (1픽셀 여백 포함)
+        k = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
+        x, y, w, h = stats[k, :4]
+        component = np.zeros((h + 2, w + 2), np.uint8)
+        component[1:-1, 1:-1][labels[y:y+h, x:x+w] == k] = 255
         
-        if area == 0:
-            return 0.0
+        # 내부 구멍 채우기 (고리 모양 도장도 외곽선 기준 면적으로 계산)
+        background = component.copy()
+        cv2.floodFill(background, None, (0, 0), 255)
+        filled = cv2.bitwise_or(component, cv2.bitwise_not(background))
+        area = cv2.countNonZero(filled)
         
-        # 원주 계산
-        perimeter = cv2.arcLength(largest_contour, True)
+        # 둘레 추정: 8-연결/4-연결 경계 픽셀 수의 평균 (arcLength와 근사)
+        boundary8 = cv2.countNonZero(cv2.subtract(filled, cv2.erode(filled, _K3)))
+        boundary4 = cv2.countNonZero(cv2.subtract(filled, cv2.erode(filled, _KCROSS)))
+        perimeter = (boundary8 + boundary4) / 2
         
         # 완벽한 원의 경우 4π×area/perimeter² = 1
         circularity = 4 * np.pi * area / (perimeter * perimeter) if perimeter > 0 else 0
         
         return min(circularity, 1.0)  # 0-1 범위로 제한
     
-    def _overlaps_with_existing_stamps(self, 
-                                      stamps: List[Dict[str, Any]], 
-                                      x: int, 
-                                      y: int, 
-                                      radius: float) -> bool:
-        """새로운 도장이 기존 도장과 겹치는지 확인"""
-        for stamp in stamps:
-            sx, sy = stamp['position']['x'], stamp['position']['y']
-            sr = stamp['radius']
-            
-            # 두 원 중심 간의 거리
-            distance = np.sqrt((x - sx)**2 + (y - sy)**2)
-            
-            # 거리가 두 반지름의 합보다 작으면 겹침
-            if distance < (radius + sr):
-                return True
+    def _suppress_overlapping_stamps(self, candidates: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        겹치는 도장 후보 제거 (신뢰도 기준 NMS)
+        
+        Args:
+            candidates: 후보 배열 (N, 5), 각 행은 [중심 x, 중심 y, 반지름, 빨간색 여부, 신뢰도]
         
-        return False
+        Returns:
+            감지된 도장 목록
+        """
+        # 신뢰도 내림차순 정렬 (동률이면 원형 도장 우선)
+        candidates = candidates[np.argsort(-candidates[:, 4], kind='stable')]
+        centers = candidates[:, :2]
+        radii = candidates[:, 2]
+        
+        keep = np.ones(len(candidates), dtype=bool)
+        for i in range(len(candidates)):
+            if not keep[i]:
+                continue
+            # 중심 간 거리의 제곱이 두 반지름 합의 제곱보다 작으면 겹침 (제곱근 생략)
+            d2 = np.sum((centers[i+1:] - centers[i]) ** 2, axis=1)
+            keep[i+1:][d2 < (radii[i+1:] + radii[i]) ** 2] = False
+        
+        return [
+            {
+                'type': 'stamp',
+                'position': {'x': int(cx), 'y': int(cy)},
+                'radius': int(r),
+                'is_red': bool(is_red),
+                'confidence': float(confidence)
+            }
+            for cx, cy, r, is_red, confidence in candidates[keep]
+        ]
     
     def _detect_handwriting(self, 
                            original_image: np.ndarray, 
@@ -315,7 +473,7 @@ class SpecialItemDetector:
         이미지에서 손글씨 영역 감지
         
         Args:
-            original_image: 원본 OpenCV 이미지
+            original_image: 원본 RGB 이미지
             processed_images: 전처리된 이미지 딕셔너리
         
         Returns:
@@ -333,21 +491,12 @@ class SpecialItemDetector:
         # 골격화 (가장 중심선만 남김)
         skeleton = self._skeletonize(binary)
         
-        # 각 골격 픽셀에서 원본 거리 변환 값 가져오기 = 선폭
-        stroke_widths = []
-        coords = np.where(skeleton > 0)
+        # 각 골격 픽셀에서의 거리 변환 값 = 선폭, 통계 계산
+        mean_width, std_width, count = _masked_stroke_stats(dist_transform, skeleton)
         
-        if len(coords[0]) == 0:
+        if count == 0:
             return handwriting_regions
         
-        for y, x in zip(coords[0], coords[1]):
-            stroke_widths.append(dist_transform[y, x])
-        
-        stroke_widths = np.array(stroke_widths)
-        
-        # 선폭 통계 계산
-        mean_width = np.mean(stroke_widths) if len(stroke_widths) > 0 else 0
-        std_width = np.std(stroke_widths) if len(stroke_widths) > 0 else 0
         width_variance = std_width / mean_width if mean_width > 0 else 0
         
         # 손글씨 특성: 선폭 변화가 크고, 평균 선폭이 인쇄된 텍스트보다 일반적으로 더 두껍거나 더 얇음
@@ -358,8 +507,7 @@ class SpecialItemDetector:
             return handwriting_regions
         
         # 텍스트 영역 감지
-        kernel = np.ones((5, 5), np.uint8)
-        dilated = cv2.dilate(binary, kernel, iterations=2)
+        dilated = cv2.dilate(binary, _K5, iterations=2)
         contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
         for contour in contours:
@@ -374,26 +522,15 @@ class SpecialItemDetector:
             # 비율 검사 (글자 영역은 일반적으로 너무 길지 않음)
             aspect_ratio = float(w) / h if h > 0 else 0
             if 0.2 <= aspect_ratio <= 5.0:
-                # ROI 추출
-                roi_binary = binary[y:y+h, x:x+w]
+                # ROI 내의 선폭 분석 (전체 이미지의 골격/거리 변환을 잘라 재사용)
+                roi_skeleton = skeleton[y:y+h, x:x+w]
+                roi_dist = dist_transform[y:y+h, x:x+w]
                 
-                # ROI 내의 골격화 및 선폭 분석
-                roi_skeleton = self._skeletonize(roi_binary)
-                roi_dist = cv2.distanceTransform(roi_binary, cv2.DIST_L2, 5)
-                
-                roi_coords = np.where(roi_skeleton > 0)
-                if len(roi_coords[0]) == 0:
+                # ROI 선폭 통계
+                roi_mean_width, roi_std_width, roi_count = _masked_stroke_stats(roi_dist, roi_skeleton)
+                if roi_count == 0:
                     continue
                 
-                roi_widths = []
-                for ry, rx in zip(roi_coords[0], roi_coords[1]):
-                    roi_widths.append(roi_dist[ry, rx])
-                
-                roi_widths = np.array(roi_widths)
-                
-                # ROI 선폭 통계
-                roi_mean_width = np.mean(roi_widths) if len(roi_widths) > 0 else 0
-                roi_std_width = np.std(roi_widths) if len(roi_widths) > 0 else 0
                 roi_variance = roi_std_width / roi_mean_width if roi_mean_width > 0 else 0
                 
                 # 손글씨 특성 확인
@@ -415,16 +552,25 @@ class SpecialItemDetector:
     
     def _skeletonize(self, binary_image: np.ndarray) -> np.ndarray:
         """이진화 이미지의 골격화"""
+        # opencv-contrib: 단일 C++ 호출로 세선화
+        if hasattr(cv2, 'ximgproc'):
+            return cv2.ximgproc.thinning(binary_image, thinningType=cv2.ximgproc.THINNING_GUOHALL)
+        
+        # numba: JIT 컴파일된 Zhang-Suen 세선화
+        if _zhang_suen_thinning is not None:
+            skeleton = _zhang_suen_thinning(binary_image)
+            skeleton *= 255
+            return skeleton
+        
+        # 대체 구현: 모폴로지 골격 반복 계산
         skeleton = np.zeros(binary_image.shape, dtype=np.uint8)
         temp_img = binary_image.copy()
         
-        kernel = cv2.getStructuringElement(cv2.MORPH_CROSS, (3, 3))
-        
         while True:
             # 열기 연산
-            eroded = cv2.erode(temp_img, kernel)
+            eroded = cv2.erode(temp_img, _KCROSS)
             # 팽창 연산
-            dilated = cv2.dilate(eroded, kernel)
+            dilated = cv2.dilate(eroded, _KCROSS)
             # 차이 계산
             temp = cv2.subtract(temp_img, dilated)
             # 골격에 추가
@@ -445,7 +591,7 @@ class SpecialItemDetector:
         이미지에서 취소선 감지
         
         Args:
-            original_image: 원본 OpenCV 이미지
+            original_image: 원본 RGB 이미지
             processed_images: 전처리된 이미지 딕셔너리
         
         Returns:
@@ -469,52 +615,62 @@ class SpecialItemDetector:
         if lines is None:
             return strikethrough_regions
         
-        # 감지된 각 선에 대해
-        for line in lines:
-            x1, y1, x2, y2 = line[0]
-            
-            # 선 길이 계산
-            line_length = np.sqrt((x2 - x1)**2 + (y2 - y1)**2)
-            
-            # 선 두께 추정
-            line_mask = np.zeros_like(edges)
-            cv2.line(line_mask, (x1, y1), (x2, y2), 255, 1)
-            
-            # 원본 이진화 이미지와 교차하는 영역 계산
-            intersection = cv2.bitwise_and(processed_images['binary'], line_mask)
-            
-            # 추정된 선 두께 계산
-            thickness = np.sum(intersection) / (255 * line_length) if line_length > 0 else 0
-            
-            # 선 기울기 계산
-            angle = np.degrees(np.arctan2(y2 - y1, x2 - x1))
-            
-            # 수평에 가까운 선 (취소선은 주로 수평)
-            is_horizontal = abs(angle) < 20 or abs(angle) > 160
-            
-            # 조건에 맞는 선만 취소선으로 간주
-            if (is_horizontal and 
-                self.strikethrough_params['line_thickness_min'] <= thickness <= self.strikethrough_params['line_thickness_max']):
-                
-                # 주변 텍스트 존재 여부 확인 (취소선은 텍스트 위에 있어야 함)
-                margin = 10
-                y_min = max(0, min(y1, y2) - margin)
-                y_max = min(original_image.shape[0], max(y1, y2) + margin)
-                x_min = max(0, min(x1, x2) - margin)
-                x_max = min(original_image.shape[1], max(x1, x2) + margin)
-                
-                roi_binary = processed_images['binary'][y_min:y_max, x_min:x_max]
-                
-                # ROI에 충분한 텍스트가 있는지 확인
-                text_density = np.sum(roi_binary) / (255 * roi_binary.size) if roi_binary.size > 0 else 0
-                
-                if text_density > 0.1:  # 10% 이상의 픽셀이 텍스트인 경우
-                    strikethrough_regions.append({
-                        'type': 'strikethrough',
-                        'start': {'x': int(x1), 'y': int(y1)},
-                        'end': {'x': int(x2), 'y': int(y2)},
-                        'thickness': float(thickness),
-                        'confidence': min(1.0, 0.7 + text_density)
-                    })
+        binary = processed_images['binary']
+        height, width = binary.shape[:2]
+        
+        # 선 좌표를 (N, 4) 배열로 정리하고 길이/기울기 일괄 계산
+        lines = lines.reshape(-1, 4)
+        x1, y1, x2, y2 = lines[:, 0], lines[:, 1], lines[:, 2], lines[:, 3]
+        dx = x2 - x1
+        dy = y2 - y1
+        line_length = np.hypot(dx, dy)
+        angle = np.abs(np.degrees(np.arctan2(dy, dx)))
+        
+        # 수평에 가까운 선 (취소선은 주로 수평)
+        idx = np.flatnonzero(((angle < 20) | (angle > 160)) & (line_length > 0))
+        if idx.size == 0:
+            return strikethrough_regions
+        
+        # 선 위의 점을 샘플링해 이진화 이미지와 겹치는 비율로 두께 추정
+        # (1픽셀 선을 그려 교차 픽셀 수 / 선 길이를 구하던 방식의 근사,
+        #  가장 긴 선 기준 픽셀 간격으로 샘플링해 짧은 선 누락을 방지)
+        n_samples = max(int(line_length[idx].max()) + 1, 16)
+        t = np.linspace(0.0, 1.0, n_samples)
+        xs = np.rint(x1[idx, None] + t * dx[idx, None]).astype(np.intp)
+        ys = np.rint(y1[idx, None] + t * dy[idx, None]).astype(np.intp)
+        coverage = (binary[ys, xs] > 0).mean(axis=1)
+        pixel_count = np.maximum(np.abs(dx[idx]), np.abs(dy[idx])) + 1
+        thickness = coverage * pixel_count / line_length[idx]
+        
+        keep = ((thickness >= self.strikethrough_params['line_thickness_min']) &
+                (thickness <= self.strikethrough_params['line_thickness_max']))
+        idx, thickness = idx[keep], thickness[keep]
+        if idx.size == 0:
+            return strikethrough_regions
+        
+        # 주변 텍스트 존재 여부 확인 (취소선은 텍스트 위에 있어야 함)
+        margin = 10
+        y_min = np.maximum(0, np.minimum(y1[idx], y2[idx]) - margin)
+        y_max = np.minimum(height, np.maximum(y1[idx], y2[idx]) + margin)
+        x_min = np.maximum(0, np.minimum(x1[idx], x2[idx]) - margin)
+        x_max = np.minimum(width, np.maximum(x1[idx], x2[idx]) + margin)
+        
+        # 적분 영상으로 각 영역의 텍스트 밀도를 O(1)에 계산
+        integral = cv2.integral(binary)
+        text_pixels = (integral[y_max, x_max] - integral[y_min, x_max]
+                       - integral[y_max, x_min] + integral[y_min, x_min]) / 255
+        roi_size = (y_max - y_min) * (x_max - x_min)
+        text_density = np.where(roi_size > 0, text_pixels / np.maximum(roi_size, 1), 0)
+        
+        # 10% 이상의 픽셀이 텍스트인 경우만 취소선으로 간주
+        for i in np.flatnonzero(text_density > 0.1):
+            line = lines[idx[i]]
+            strikethrough_regions.append({
+                'type': 'strikethrough',
+                'start': {'x': int(line[0]), 'y': int(line[1])},
+                'end': {'x': int(line[2]), 'y': int(line[3])},
+                'thickness': float(thickness[i]),
+                'confidence': min(1.0, 0.7 + float(text_density[i]))
+            })
         
         return strikethrough_regions
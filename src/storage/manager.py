@@ -7,10 +7,18 @@
 
 import os
 import io
-import uuid
+import time
+import secrets
+import stat
+import shutil
+import asyncio
+import datetime
 import logging
 import tempfile
-from typing import Dict, Any, List, Optional, Union, BinaryIO
+import threading
+import mmap
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, Union, BinaryIO
 from pathlib import Path
 
 from src.core.config import config
@@ -20,24 +28,34 @@ logger = logging.getLogger(__name__)
 
 # 선택적 라이브러리 임포트
 try:
-    import boto3
-    from botocore.exceptions import ClientError
-    S3_AVAILABLE = True
+    import aiofiles
+    AIOFILES_AVAILABLE = True
 except ImportError:
-    S3_AVAILABLE = False
-    logger.warning("boto3 라이브러리가 설치되지 않았습니다. S3 스토리지를 사용할 수 없습니다.")
+    AIOFILES_AVAILABLE = False
+    logger.warning("aiofiles 라이브러리가 설치되지 않았습니다. 로컬 파일 I/O를 스레드에서 실행합니다.")
+
+# boto3 / google-cloud-storage는 임포트 비용이 크므로 해당 스토리지를
+# 사용할 때만 _initialize_storage에서 지연 임포트
 
-try:
-    from google.cloud import storage as gcs_storage
-    GCS_AVAILABLE = True
-except ImportError:
-    GCS_AVAILABLE = False
-    logger.warning("google-cloud-storage 라이브러리가 설치되지 않았습니다. GCS 스토리지를 사용할 수 없습니다.")
+
+async def _run(fn, *args, **kwargs):
+    """블로킹 SDK 호출을 스레드에서 실행 (이벤트 루프 차단 방지)"""
+    return await asyncio.to_thread(fn, *args, **kwargs)
 
 
 class StorageManager:
     """파일 스토리지 관리 클래스"""
     
+    # 이 크기 이상의 로컬 파일은 복사 대신 메모리 매핑으로 제공
+    MMAP_THRESHOLD = 64 * 1024 * 1024
+    
+    # 서명 URL 캐시 크기 및 실제 만료 전 갱신 여유 시간 (초)
+    URL_CACHE_SIZE = 10000
+    URL_CACHE_MARGIN = 60
+    
+    # 일괄 업로드 동시 실행 수
+    BULK_UPLOAD_CONCURRENCY = 16
+    
     def __init__(self):
         """초기화"""
         # 스토리지 설정
@@ -45,10 +63,16 @@ class StorageManager:
         self.local_path = config.get('storage.local_path', './storage')
         self.s3_bucket = config.get('storage.s3_bucket', 'ocr-documents')
         self.gcs_bucket = config.get('storage.gcs_bucket', 'ocr-documents')
+        self.s3_pool_size = config.get('storage.s3_pool_size', max(50, (os.cpu_count() or 1) * 10))
         
         # 클라이언트 초기화
         self.s3_client = None
         self.gcs_client = None
+        self._transfer_config = None
+        
+        # 서명 URL 캐시: (경로, 만료 시간) -> (URL, 재사용 가능 시각)
+        self._url_cache: OrderedDict = OrderedDict()
+        self._url_cache_lock = threading.Lock()
         
         # 스토리지 초기화
         self._initialize_storage()
@@ -62,19 +86,39 @@ class StorageManager:
         
         # S3 스토리지
         elif self.storage_type == 's3':
-            if not S3_AVAILABLE:
+            try:
+                import boto3
+                from boto3.s3.transfer import TransferConfig
+                from botocore.config import Config as BotoConfig
+            except ImportError:
                 logger.error("boto3 라이브러리가 설치되지 않아 S3 스토리지를 사용할 수 없습니다.")
                 return
             
             try:
-                self.s3_client = boto3.client('s3')
+                # 동시 요청 시 TLS 재연결을 피하도록 연결 풀 확대 및 keep-alive 사용
+                self.s3_client = boto3.client('s3', config=BotoConfig(
+                    max_pool_connections=self.s3_pool_size,
+                    retries={'max_attempts': 3, 'mode': 'adaptive'},
+                    tcp_keepalive=True,
+                    signature_version='s3v4'
+                ))
+                
+                # 일괄 업로드용 전송 설정 (큰 파일은 멀티파트 파트를 동시 전송)
+                self._transfer_config = TransferConfig(
+                    multipart_threshold=8 * 1024 * 1024,
+                    multipart_chunksize=8 * 1024 * 1024,
+                    max_concurrency=self.BULK_UPLOAD_CONCURRENCY,
+                    use_threads=True
+                )
                 logger.info("S3 스토리지 초기화 성공")
             except Exception as e:
                 logger.error(f"S3 클라이언트 초기화 오류: {e}")
         
         # GCS 스토리지
         elif self.storage_type == 'gcs':
-            if not GCS_AVAILABLE:
+            try:
+                from google.cloud import storage as gcs_storage
+            except ImportError:
                 logger.error("google-cloud-storage 라이브러리가 설치되지 않아 GCS 스토리지를 사용할 수 없습니다.")
                 return
             
@@ -89,12 +133,12 @@ class StorageManager:
             self.storage_type = 'local'
             os.makedirs(self.local_path, exist_ok=True)
     
-    async def save_file(self, file_bytes: bytes, file_name: str) -> str:
+    async def save_file(self, file_bytes: Union[bytes, memoryview], file_name: str) -> str:
         """
         파일 저장
         
         Args:
-            file_bytes: 파일 내용
+            file_bytes: 파일 내용 (bytes 또는 memoryview, 로컬 저장 시 복사 없이 기록)
             file_name: 파일 이름
         
         Returns:
@@ -102,25 +146,29 @@ class StorageManager:
         """
         try:
             # 고유 폴더 ID 생성
-            folder_id = str(uuid.uuid4())
+            folder_id = secrets.token_hex(16)
             path = f"{folder_id}/{file_name}"
             
             # 스토리지 유형에 따라 저장
             if self.storage_type == 'local':
                 # 로컬 파일 시스템
                 folder_path = os.path.join(self.local_path, folder_id)
-                os.makedirs(folder_path, exist_ok=True)
+                await asyncio.to_thread(os.makedirs, folder_path, exist_ok=True)
                 
                 file_path = os.path.join(folder_path, file_name)
-                with open(file_path, 'wb') as f:
-                    f.write(file_bytes)
+                await self._write_local(file_path, file_bytes)
                 
                 logger.info(f"파일 저장 완료 (로컬): {file_path}")
                 return path
             
-            elif self.storage_type == 's3' and self.s3_client:
+            # 클라우드 SDK는 버퍼 프로토콜 객체를 받지 않으므로 필요할 때만 bytes로 변환
+            if isinstance(file_bytes, memoryview):
+                file_bytes = file_bytes.tobytes()
+            
+            if self.storage_type == 's3' and self.s3_client:
                 # S3 버킷
-                self.s3_client.put_object(
+                await _run(
+                    self.s3_client.put_object,
                     Bucket=self.s3_bucket,
                     Key=path,
                     Body=file_bytes
@@ -133,7 +181,7 @@ class StorageManager:
                 # GCS 버킷
                 bucket = self.gcs_client.bucket(self.gcs_bucket)
                 blob = bucket.blob(path)
-                blob.upload_from_string(file_bytes)
+                await _run(blob.upload_from_string, file_bytes)
                 
                 logger.info(f"파일 저장 완료 (GCS): {path}")
                 return path
@@ -145,9 +193,71 @@ class StorageManager:
             logger.error(f"파일 저장 오류: {e}")
             raise
     
+    async def save_files_bulk(self, items: List[Tuple[bytes, str]]) -> List[str]:
+        """
+        여러 파일을 같은 폴더에 동시 저장 (다중 페이지 결과 등)
+        
+        Args:
+            items: (파일 내용, 파일 이름) 튜플 목록
+        
+        Returns:
+            저장 경로 목록 (입력 순서 유지)
+        """
+        if not items:
+            return []
+        
+        # 고유 폴더 ID 생성 (모든 파일 공유)
+        folder_id = secrets.token_hex(16)
+        paths = [f"{folder_id}/{file_name}" for _, file_name in items]
+        semaphore = asyncio.Semaphore(self.BULK_UPLOAD_CONCURRENCY)
+        
+        try:
+            if self.storage_type == 'local':
+                # 로컬 파일 시스템
+                folder_path = os.path.join(self.local_path, folder_id)
+                await asyncio.to_thread(os.makedirs, folder_path, exist_ok=True)
+                
+                async def upload(file_bytes, path):
+                    async with semaphore:
+                        await self._write_local(os.path.join(self.local_path, path), file_bytes)
+            
+            elif self.storage_type == 's3' and self.s3_client:
+                # S3 버킷 (upload_fileobj가 큰 파일을 멀티파트로 나눠 동시 전송)
+                async def upload(file_bytes, path):
+                    async with semaphore:
+                        await _run(
+                            self.s3_client.upload_fileobj,
+                            io.BytesIO(file_bytes),
+                            self.s3_bucket,
+                            path,
+                            Config=self._transfer_config
+                        )
+            
+            elif self.storage_type == 'gcs' and self.gcs_client:
+                # GCS 버킷
+                bucket = self.gcs_client.bucket(self.gcs_bucket)
+                
+                async def upload(file_bytes, path):
+                    async with semaphore:
+                        await _run(bucket.blob(path).upload_from_string, file_bytes)
+            
+            else:
+                raise ValueError(f"스토리지를 사용할 수 없습니다: {self.storage_type}")
+            
+            await asyncio.gather(*[
+                upload(file_bytes, path) for (file_bytes, _), path in zip(items, paths)
+            ])
+            
+            logger.info(f"파일 일괄 저장 완료 ({self.storage_type}): {folder_id} ({len(paths)}개)")
+            return paths
+        
+        except Exception as e:
+            logger.error(f"파일 일괄 저장 오류: {e}")
+            raise
+    
     async def save_file_object(self, file_obj: BinaryIO, file_name: str) -> str:
         """
-        파일 객체 저장
+        파일 객체 저장 (전체 내용을 메모리에 올리지 않고 스트리밍)
         
         Args:
             file_obj: 파일 객체
@@ -156,8 +266,58 @@ class StorageManager:
         Returns:
             저장 경로
         """
-        file_bytes = file_obj.read()
-        return await self.save_file(file_bytes, file_name)
+        return await self.save_file_stream(file_obj, file_name)
+    
+    async def save_file_stream(self, file_obj: BinaryIO, file_name: str) -> str:
+        """
+        파일 스트림 저장 (청크 단위로 업로드)
+        
+        Args:
+            file_obj: 읽기 가능한 파일 객체
+            file_name: 파일 이름
+        
+        Returns:
+            저장 경로
+        """
+        try:
+            # 고유 폴더 ID 생성
+            folder_id = secrets.token_hex(16)
+            path = f"{folder_id}/{file_name}"
+            
+            # 스토리지 유형에 따라 저장
+            if self.storage_type == 'local':
+                # 로컬 파일 시스템
+                folder_path = os.path.join(self.local_path, folder_id)
+                await asyncio.to_thread(os.makedirs, folder_path, exist_ok=True)
+                
+                file_path = os.path.join(folder_path, file_name)
+                await asyncio.to_thread(self._copy_to_local, file_obj, file_path)
+                
+                logger.info(f"파일 저장 완료 (로컬): {file_path}")
+                return path
+            
+            elif self.storage_type == 's3' and self.s3_client:
+                # S3 버킷 (boto3가 내부적으로 멀티파트 청크 업로드)
+                await _run(self.s3_client.upload_fileobj, file_obj, self.s3_bucket, path)
+                
+                logger.info(f"파일 저장 완료 (S3): {path}")
+                return path
+            
+            elif self.storage_type == 'gcs' and self.gcs_client:
+                # GCS 버킷
+                bucket = self.gcs_client.bucket(self.gcs_bucket)
+                blob = bucket.blob(path)
+                await _run(blob.upload_from_file, file_obj)
+                
+                logger.info(f"파일 저장 완료 (GCS): {path}")
+                return path
+            
+            else:
+                raise ValueError(f"스토리지를 사용할 수 없습니다: {self.storage_type}")
+        
+        except Exception as e:
+            logger.error(f"파일 저장 오류: {e}")
+            raise
     
     async def get_file(self, path: str) -> bytes:
         """
@@ -174,22 +334,22 @@ class StorageManager:
             if self.storage_type == 'local':
                 # 로컬 파일 시스템
                 file_path = os.path.join(self.local_path, path)
-                with open(file_path, 'rb') as f:
-                    return f.read()
+                return await self._read_local(file_path)
             
             elif self.storage_type == 's3' and self.s3_client:
                 # S3 버킷
-                response = self.s3_client.get_object(
+                response = await _run(
+                    self.s3_client.get_object,
                     Bucket=self.s3_bucket,
                     Key=path
                 )
-                return response['Body'].read()
+                return await _run(response['Body'].read)
             
             elif self.storage_type == 'gcs' and self.gcs_client:
                 # GCS 버킷
                 bucket = self.gcs_client.bucket(self.gcs_bucket)
                 blob = bucket.blob(path)
-                return blob.download_as_bytes()
+                return await _run(blob.download_as_bytes)
             
             else:
                 raise ValueError(f"스토리지를 사용할 수 없습니다: {self.storage_type}")
@@ -198,24 +358,77 @@ class StorageManager:
             logger.error(f"파일 조회 오류: {e}")
             raise
     
-    async def get_file_stream(self, path: str) -> BinaryIO:
+    async def get_file_view(self, path: str) -> memoryview:
         """
-        파일 스트림 조회
+        파일 내용을 읽기 전용 버퍼로 조회 (큰 로컬 파일은 복사 없이 메모리 매핑)
         
         Args:
             path: 파일 경로
         
         Returns:
-            파일 스트림
+            파일 내용 memoryview (슬라이싱 시 복사 없음)
         """
-        # 파일 내용 가져오기
-        content = await self.get_file(path)
+        if self.storage_type == 'local':
+            file_path = os.path.join(self.local_path, path)
+            try:
+                return await asyncio.to_thread(self._map_local, file_path)
+            except Exception as e:
+                logger.error(f"파일 조회 오류: {e}")
+                raise
         
-        # 메모리 스트림 생성
-        stream = io.BytesIO(content)
-        stream.seek(0)
+        return memoryview(await self.get_file(path))
+    
+    async def get_file_buffer(self, path: str) -> BinaryIO:
+        """
+        파일 내용을 메모리 스트림으로 조회 (작은 파일용, 닫을 필요 없음)
         
-        return stream
+        Args:
+            path: 파일 경로
+        
+        Returns:
+            메모리 스트림
+        """
+        # BytesIO는 생성 직후 위치가 0이므로 seek 불필요
+        return io.BytesIO(await self.get_file(path))
+    
+    async def get_file_stream(self, path: str) -> BinaryIO:
+        """
+        파일 스트림 조회 (전체 내용을 미리 읽지 않음)
+        
+        Args:
+            path: 파일 경로
+        
+        Returns:
+            파일 스트림 (호출자가 닫아야 함)
+        """
+        try:
+            # 스토리지 유형에 따라 스트림 열기
+            if self.storage_type == 'local':
+                # 로컬 파일 시스템
+                file_path = os.path.join(self.local_path, path)
+                return await asyncio.to_thread(open, file_path, 'rb')
+            
+            elif self.storage_type == 's3' and self.s3_client:
+                # S3 버킷 (StreamingBody를 그대로 반환)
+                response = await _run(
+                    self.s3_client.get_object,
+                    Bucket=self.s3_bucket,
+                    Key=path
+                )
+                return response['Body']
+            
+            elif self.storage_type == 'gcs' and self.gcs_client:
+                # GCS 버킷
+                bucket = self.gcs_client.bucket(self.gcs_bucket)
+                blob = bucket.blob(path)
+                return await _run(blob.open, 'rb')
+            
+            else:
+                raise ValueError(f"스토리지를 사용할 수 없습니다: {self.storage_type}")
+        
+        except Exception as e:
+            logger.error(f"파일 스트림 조회 오류: {e}")
+            raise
     
     async def delete_file(self, path: str) -> bool:
         """
@@ -231,18 +444,21 @@ class StorageManager:
             # 스토리지 유형에 따라 삭제
             if self.storage_type == 'local':
                 # 로컬 파일 시스템
+                # 존재 확인 없이 바로 삭제 시도 (stat 시스템 호출 1회 절약)
                 file_path = os.path.join(self.local_path, path)
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    logger.info(f"파일 삭제 완료 (로컬): {file_path}")
-                    return True
-                else:
+                try:
+                    await asyncio.to_thread(os.remove, file_path)
+                except FileNotFoundError:
                     logger.warning(f"파일이 존재하지 않습니다: {file_path}")
                     return False
+                
+                logger.info(f"파일 삭제 완료 (로컬): {file_path}")
+                return True
             
             elif self.storage_type == 's3' and self.s3_client:
                 # S3 버킷
-                self.s3_client.delete_object(
+                await _run(
+                    self.s3_client.delete_object,
                     Bucket=self.s3_bucket,
                     Key=path
                 )
@@ -253,7 +469,7 @@ class StorageManager:
                 # GCS 버킷
                 bucket = self.gcs_client.bucket(self.gcs_bucket)
                 blob = bucket.blob(path)
-                blob.delete()
+                await _run(blob.delete)
                 logger.info(f"파일 삭제 완료 (GCS): {path}")
                 return True
             
@@ -279,28 +495,31 @@ class StorageManager:
             if self.storage_type == 'local':
                 # 로컬 파일 시스템
                 full_path = os.path.join(self.local_path, folder_path)
-                if os.path.exists(full_path) and os.path.isdir(full_path):
-                    import shutil
-                    shutil.rmtree(full_path)
-                    logger.info(f"폴더 삭제 완료 (로컬): {full_path}")
-                    return True
-                else:
+                try:
+                    await asyncio.to_thread(shutil.rmtree, full_path)
+                except (FileNotFoundError, NotADirectoryError):
                     logger.warning(f"폴더가 존재하지 않습니다: {full_path}")
                     return False
+                
+                logger.info(f"폴더 삭제 완료 (로컬): {full_path}")
+                return True
             
             elif self.storage_type == 's3' and self.s3_client:
                 # S3 버킷 (폴더 개념이 없으므로 접두사로 처리)
-                response = self.s3_client.list_objects_v2(
-                    Bucket=self.s3_bucket,
-                    Prefix=folder_path
-                )
+                keys = await self._list_s3_keys(folder_path)
                 
-                if 'Contents' in response:
-                    for obj in response['Contents']:
-                        self.s3_client.delete_object(
-                            Bucket=self.s3_bucket,
-                            Key=obj['Key']
-                        )
+                # delete_objects는 요청당 최대 1000개 키를 한 번에 삭제
+                await asyncio.gather(*[
+                    _run(
+                        self.s3_client.delete_objects,
+                        Bucket=self.s3_bucket,
+                        Delete={
+                            'Objects': [{'Key': key} for key in keys[i:i + 1000]],
+                            'Quiet': True
+                        }
+                    )
+                    for i in range(0, len(keys), 1000)
+                ])
                 
                 logger.info(f"폴더 삭제 완료 (S3): {folder_path}")
                 return True
@@ -308,10 +527,11 @@ class StorageManager:
             elif self.storage_type == 'gcs' and self.gcs_client:
                 # GCS 버킷 (폴더 개념이 없으므로 접두사로 처리)
                 bucket = self.gcs_client.bucket(self.gcs_bucket)
-                blobs = bucket.list_blobs(prefix=folder_path)
+                blobs = await _run(lambda: list(bucket.list_blobs(prefix=folder_path)))
                 
-                for blob in blobs:
-                    blob.delete()
+                # delete_blobs는 내부적으로 배치 요청을 사용
+                if blobs:
+                    await _run(bucket.delete_blobs, blobs)
                 
                 logger.info(f"폴더 삭제 완료 (GCS): {folder_path}")
                 return True
@@ -340,27 +560,18 @@ class StorageManager:
             if self.storage_type == 'local':
                 # 로컬 파일 시스템
                 full_path = os.path.join(self.local_path, folder_path)
-                if os.path.exists(full_path) and os.path.isdir(full_path):
-                    for file_name in os.listdir(full_path):
-                        if os.path.isfile(os.path.join(full_path, file_name)):
-                            files.append(os.path.join(folder_path, file_name))
+                files = await asyncio.to_thread(self._list_local, full_path, folder_path)
             
             elif self.storage_type == 's3' and self.s3_client:
-                # S3 버킷
-                response = self.s3_client.list_objects_v2(
-                    Bucket=self.s3_bucket,
-                    Prefix=folder_path
-                )
-                
-                if 'Contents' in response:
-                    files = [obj['Key'] for obj in response['Contents']]
+                # S3 버킷 (1000개 초과 시 페이지 단위로 이어서 조회)
+                files = await self._list_s3_keys(folder_path)
             
             elif self.storage_type == 'gcs' and self.gcs_client:
                 # GCS 버킷
                 bucket = self.gcs_client.bucket(self.gcs_bucket)
-                blobs = bucket.list_blobs(prefix=folder_path)
-                
-                files = [blob.name for blob in blobs]
+                files = await _run(
+                    lambda: [blob.name for blob in bucket.list_blobs(prefix=folder_path)]
+                )
             
             else:
                 raise ValueError(f"스토리지를 사용할 수 없습니다: {self.storage_type}")
@@ -371,6 +582,116 @@ class StorageManager:
             logger.error(f"파일 목록 조회 오류: {e}")
             return []
     
+    async def _list_s3_keys(self, prefix: str) -> List[str]:
+        """
+        접두사 아래의 모든 S3 객체 키 조회 (1000개 초과 시 페이지 단위로 이어서 조회)
+        
+        Args:
+            prefix: 키 접두사
+        
+        Returns:
+            객체 키 목록 (사전 순)
+        """
+        return await _run(self._list_s3_pages, prefix)
+    
+    def _list_s3_pages(self, prefix: str) -> List[str]:
+        """접두사 아래의 S3 키를 페이지 단위로 순차 조회 (스레드에서 실행)"""
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        return [
+            obj['Key']
+            for page in paginator.paginate(Bucket=self.s3_bucket, Prefix=prefix)
+            for obj in page.get('Contents', [])
+        ]
+    
+    async def _write_local(self, file_path: str, file_bytes: bytes) -> None:
+        """로컬 파일 쓰기 (이벤트 루프를 막지 않도록 비동기 처리)"""
+        if AIOFILES_AVAILABLE:
+            async with aiofiles.open(file_path, 'wb') as f:
+                await f.write(file_bytes)
+        else:
+            await asyncio.to_thread(self._write_local_sync, file_path, file_bytes)
+    
+    async def _read_local(self, file_path: str) -> bytes:
+        """로컬 파일 읽기 (이벤트 루프를 막지 않도록 비동기 처리)"""
+        if AIOFILES_AVAILABLE:
+            async with aiofiles.open(file_path, 'rb') as f:
+                return await f.read()
+        return await asyncio.to_thread(self._read_local_sync, file_path)
+    
+    @staticmethod
+    def _write_local_sync(file_path: str, file_bytes: bytes) -> None:
+        with open(file_path, 'wb') as f:
+            f.write(file_bytes)
+    
+    @staticmethod
+    def _read_local_sync(file_path: str) -> bytes:
+        with open(file_path, 'rb') as f:
+            return f.read()
+    
+    @classmethod
+    def _map_local(cls, file_path: str) -> memoryview:
+        """로컬 파일을 읽기 전용 memoryview로 반환 (큰 파일은 mmap)"""
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if size < cls.MMAP_THRESHOLD:
+                with os.fdopen(os.dup(fd), 'rb') as f:
+                    return memoryview(f.read())
+            # 매핑은 fd를 닫아도 유지되며 페이지는 접근 시점에 로드됨
+            return memoryview(mmap.mmap(fd, size, access=mmap.ACCESS_READ))
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _copy_to_local(file_obj: BinaryIO, file_path: str) -> None:
+        with open(file_path, 'wb') as f:
+            # 일반 파일이면 커널 내에서 복사 (sendfile, 사용자 공간 버퍼 없음)
+            # 파이프/소켓은 st_size가 0이므로 크기 기반 복사를 사용하지 않음
+            # 메모리에 있는 SpooledTemporaryFile(작은 업로드)은 fileno() 호출 시 임시 파일로
+            # 옮겨지므로 확인하지 않고 바로 복사
+            src_fd = None
+            if hasattr(os, 'sendfile') and getattr(file_obj, '_rolled', True):
+                try:
+                    src_fd = file_obj.fileno()
+                    src_stat = os.fstat(src_fd)
+                    if not stat.S_ISREG(src_stat.st_mode):
+                        src_fd = None
+                    else:
+                        offset = file_obj.tell()
+                        size = src_stat.st_size
+                except (AttributeError, OSError, io.UnsupportedOperation):
+                    src_fd = None
+            
+            if src_fd is not None:
+                try:
+                    while offset < size:
+                        sent = os.sendfile(f.fileno(), src_fd, offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                except OSError:
+                    # 대상이 소켓이어야 하는 플랫폼(macOS 등)은 보낸 위치부터 일반 복사로 계속
+                    file_obj.seek(offset)
+                    shutil.copyfileobj(file_obj, f, 1024 * 1024)
+                else:
+                    file_obj.seek(offset)
+            else:
+                shutil.copyfileobj(file_obj, f, 1024 * 1024)
+    
+    @staticmethod
+    def _list_local(full_path: str, folder_path: str) -> List[str]:
+        """로컬 폴더의 파일 목록 (스레드에서 실행)"""
+        # scandir 항목의 파일 유형 정보를 사용해 항목별 stat 호출을 생략
+        try:
+            with os.scandir(full_path) as entries:
+                return [
+                    os.path.join(folder_path, entry.name)
+                    for entry in entries
+                    if entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+    
     def create_temp_file(self, content: bytes = None) -> str:
         """
         임시 파일 생성
@@ -424,6 +745,28 @@ class StorageManager:
         Returns:
             공개 URL 또는 None
         """
+        # 만료 직전까지는 이전에 서명한 URL 재사용 (서명 연산 절감)
+        cache_key = (path, expires)
+        now = time.monotonic()
+        with self._url_cache_lock:
+            cached = self._url_cache.get(cache_key)
+            if cached is not None and cached[1] > now:
+                self._url_cache.move_to_end(cache_key)
+                return cached[0]
+        
+        url = self._generate_signed_url(path, expires)
+        
+        if url is not None and expires > self.URL_CACHE_MARGIN:
+            with self._url_cache_lock:
+                self._url_cache[cache_key] = (url, now + expires - self.URL_CACHE_MARGIN)
+                self._url_cache.move_to_end(cache_key)
+                while len(self._url_cache) > self.URL_CACHE_SIZE:
+                    self._url_cache.popitem(last=False)
+        
+        return url
+    
+    def _generate_signed_url(self, path: str, expires: int) -> Optional[str]:
+        """스토리지 유형별 서명 URL 생성"""
         try:
             # 스토리지 유형에 따라 URL 생성
             if self.storage_type == 's3' and self.s3_client:
@@ -434,7 +777,8 @@ class StorageManager:
                         'Bucket': self.s3_bucket,
                         'Key': path
                     },
-                    ExpiresIn=expires
+                    ExpiresIn=expires,
+                    HttpMethod='GET'
                 )
             
             elif self.storage_type == 'gcs' and self.gcs_client:
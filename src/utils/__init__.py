@@ -31,7 +31,11 @@ from src.utils.security import (
     generate_token,
     verify_token,
     hash_password,
-    verify_password
+    verify_password,
+    hash_password_async,
+    verify_password_async,
+    hash_password_for_storage,
+    verify_stored_password
 )
 
 # 모듈 초기화 로그
@@ -4,12 +4,46 @@
 """
 
 import os
-import uuid
+import secrets
+import functools
 import re
 import time
 import datetime
 from typing import Optional, Union, List, Dict, Any
 
+# 파일명 정제용 정규식 (모듈 로드 시 한 번만 컴파일)
+_FILENAME_INVALID_RE = re.compile(r'[\\/*?:"<>|]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+
+# 파일 크기 단위 (1024 배수)
+_SIZE_LABELS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# 언어 코드 정규화 매핑
+_LANG_MAP = {
+    # ISO 639-1 코드를 Tesseract 언어 코드로 매핑
+    'ja': 'jpn',
+    'en': 'eng',
+    'ko': 'kor',
+    'zh': 'chi_sim',
+    'zh-cn': 'chi_sim',
+    'zh-hans': 'chi_sim',
+    'zh-tw': 'chi_tra',
+    'zh-hant': 'chi_tra',
+    
+    # Cloud API 언어 코드를 Tesseract 언어 코드로 매핑
+    'ja-jp': 'jpn',
+    'en-us': 'eng',
+    'ko-kr': 'kor',
+    
+    # 이미 정규화된 코드는 그대로 유지
+    'jpn': 'jpn',
+    'eng': 'eng',
+    'kor': 'kor',
+    'chi_sim': 'chi_sim',
+    'chi_tra': 'chi_tra'
+}
+
 
 def generate_id(prefix: str = '') -> str:
     """
@@ -21,7 +55,8 @@ def generate_id(prefix: str = '') -> str:
     Returns:
         고유 ID 문자열
     """
-    uid = str(uuid.uuid4())
+    # UUID 객체 생성 없이 동일한 128비트 난수를 16진 문자열로 생성
+    uid = secrets.token_hex(16)
     if prefix:
         return f"{prefix}_{uid}"
     return uid
@@ -66,13 +101,13 @@ def sanitize_filename(filename: str) -> str:
     name, ext = os.path.splitext(filename)
     
     # 비허용 문자 제거 (경로 구분자 및 특수문자)
-    name = re.sub(r'[\\/*?:"<>|]', '', name)
+    name = _FILENAME_INVALID_RE.sub('', name)
     
     # 공백을 언더스코어로 변환
-    name = re.sub(r'\s+', '_', name)
+    name = _WHITESPACE_RE.sub('_', name)
     
     # 다중 언더스코어 정리
-    name = re.sub(r'_+', '_', name)
+    name = _MULTI_UNDERSCORE_RE.sub('_', name)
     
     # 파일명 길이 제한 (확장자 제외 최대 128자)
     if len(name) > 128:
@@ -108,18 +143,13 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         포맷팅된 파일 크기 문자열
     """
-    # 2^10 = 1024
-    power = 2**10
-    n = 0
-    power_labels = {0: 'B', 1: 'KB', 2: 'MB', 3: 'GB', 4: 'TB'}
-    
-    while size_bytes > power and n < 4:
-        size_bytes /= power
-        n += 1
+    # 단위 지수 = size_bytes > 1024^n 을 만족하는 최대 n (비트 길이로 바로 계산)
+    n = max(0, min(4, ((int(size_bytes) - 1).bit_length() - 1) // 10))
     
-    return f"{size_bytes:.2f} {power_labels[n]}"
+    return f"{size_bytes / (1 << (10 * n)):.2f} {_SIZE_LABELS[n]}"
 
 
+@functools.lru_cache(maxsize=64)
 def parse_language_code(lang_code: str) -> str:
     """
     언어 코드 파싱
@@ -130,35 +160,8 @@ def parse_language_code(lang_code: str) -> str:
     Returns:
         Tesseract 형식 언어 코드
     """
-    # 언어 코드 정규화 매핑
-    lang_map = {
-        # ISO 639-1 코드를 Tesseract 언어 코드로 매핑
-        'ja': 'jpn',
-        'en': 'eng',
-        'ko': 'kor',
-        'zh': 'chi_sim',
-        'zh-cn': 'chi_sim',
-        'zh-hans': 'chi_sim',
-        'zh-tw': 'chi_tra',
-        'zh-hant': 'chi_tra',
-        
-        # Cloud API 언어 코드를 Tesseract 언어 코드로 매핑
-        'ja-jp': 'jpn',
-        'en-us': 'eng',
-        'ko-kr': 'kor',
-        
-        # 이미 정규화된 코드는 그대로 유지
-        'jpn': 'jpn',
-        'eng': 'eng',
-        'kor': 'kor',
-        'chi_sim': 'chi_sim',
-        'chi_tra': 'chi_tra'
-    }
-    
-    # 소문자로 변환 후 매핑
-    norm_code = lang_map.get(lang_code.lower(), 'eng')  # 기본값은 영어
-    
-    return norm_code
+    # 소문자로 변환 후 매핑 (입력 종류가 적어 결과를 캐시)
+    return _LANG_MAP.get(lang_code.lower(), 'eng')  # 기본값은 영어
 
 
 def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 100) -> List[str]:
@@ -172,6 +175,9 @@ def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 100) -> List[st
     
     Returns:
         텍스트 청크 목록
+    
+    Raises:
+        ValueError: overlap이 chunk_size 이상인 경우
     """
     if not text:
         return []
@@ -180,21 +186,13 @@ def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 100) -> List[st
     if chunk_size >= len(text):
         return [text]
     
-    chunks = []
-    pos = 0
-    
-    while pos < len(text):
-        # 청크 끝 위치 계산
-        end = min(pos + chunk_size, len(text))
-        
-        # 청크 추출
-        chunk = text[pos:end]
-        chunks.append(chunk)
-        
-        # 다음 시작 위치 계산 (중복 고려)
-        pos = end - overlap if end < len(text) else len(text)
+    # 청크 시작 위치는 (청크 크기 - 중복) 간격의 등차수열이므로
+    # while 루프 대신 range로 한 번에 슬라이싱
+    step = chunk_size - overlap
+    if step <= 0:
+        raise ValueError("overlap은 chunk_size보다 작아야 합니다.")
     
-    return chunks
+    return [text[pos:pos + chunk_size] for pos in range(0, len(text) - overlap, step)]
 
 
 def merge_dicts(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]:
@@ -210,16 +208,18 @@ def merge_dicts(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]:
     """
     result = dict1.copy()
     
-    for key, value in dict2.items():
-        if (
-            key in result and 
-            isinstance(result[key], dict) and 
-            isinstance(value, dict)
-        ):
-            # 중첩 딕셔너리는 재귀적으로 병합
-            result[key] = merge_dicts(result[key], value)
-        else:
-            # 그 외에는 덮어쓰기
-            result[key] = value
+    # 재귀 대신 스택으로 중첩 딕셔너리 병합
+    # (입력이 변경되지 않도록 양쪽 모두 딕셔너리인 경로만 복사)
+    stack = [(result, dict2)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                target[key] = current.copy()
+                stack.append((target[key], value))
+            else:
+                # 그 외에는 덮어쓰기
+                target[key] = value
     
     return result
@@ -5,10 +5,13 @@
 """
 
 import os
+import re
+import asyncio
 import time
 import hashlib
 import hmac
 import base64
+import binascii
 import secrets
 import logging
 from typing import Dict, Any, Optional, Tuple, Union
@@ -16,17 +19,41 @@ from typing import Dict, Any, Optional, Tuple, Union
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 선택적 라이브러리 임포트
+try:
+    import argon2
+    from argon2.exceptions import VerificationError, InvalidHashError
+    ARGON2_AVAILABLE = True
+except ImportError:
+    ARGON2_AVAILABLE = False
+    logger.warning("argon2-cffi 라이브러리가 설치되지 않았습니다. 비밀번호 저장에 PBKDF2를 사용합니다.")
+
 # 비밀번호 해싱 설정
 HASH_ALGORITHM = 'sha256'
 HASH_ITERATIONS = 100000
 SALT_SIZE = 32
 KEY_LENGTH = 64
 
+# Argon2id 해셔 (신규 비밀번호 저장용, 같은 보안 수준에서 PBKDF2보다 검증 비용이 낮음)
+_ARGON2_HASHER = argon2.PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1) if ARGON2_AVAILABLE else None
+
 # 토큰 설정
 TOKEN_BYTES = 32
 TOKEN_EXPIRY = 86400  # 1일 (초 단위)
 TOKEN_SECRET = os.environ.get('TOKEN_SECRET', 'change-this-to-a-secure-secret')
 
+# HTML 태그 정규식 (모듈 로드 시 한 번만 컴파일)
+_HTML_TAG_RE = re.compile(r'<[^>]*>')
+
+# HTML 특수문자 이스케이프 변환 테이블 (한 번의 순회로 치환)
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;'
+})
+
 
 def generate_salt(size: int = SALT_SIZE) -> bytes:
     """
@@ -89,6 +116,36 @@ def verify_password(password: str, hash_bytes: bytes, salt: bytes) -> bool:
     return hmac.compare_digest(test_hash, hash_bytes)
 
 
+async def hash_password_async(password: str, salt: Optional[bytes] = None) -> Tuple[bytes, bytes]:
+    """
+    비밀번호 해싱 (비동기, 이벤트 루프를 막지 않도록 스레드에서 실행)
+    
+    Args:
+        password: 평문 비밀번호
+        salt: 솔트 (None이면 생성)
+    
+    Returns:
+        (해시, 솔트) 튜플
+    """
+    # hashlib.pbkdf2_hmac은 계산 중 GIL을 해제하므로 스레드 실행이 효과적
+    return await asyncio.to_thread(hash_password, password, salt)
+
+
+async def verify_password_async(password: str, hash_bytes: bytes, salt: bytes) -> bool:
+    """
+    비밀번호 검증 (비동기, 이벤트 루프를 막지 않도록 스레드에서 실행)
+    
+    Args:
+        password: 평문 비밀번호
+        hash_bytes: 저장된 해시
+        salt: 저장된 솔트
+    
+    Returns:
+        비밀번호 일치 여부
+    """
+    return await asyncio.to_thread(verify_password, password, hash_bytes, salt)
+
+
 def format_hash_for_storage(hash_bytes: bytes, salt: bytes) -> str:
     """
     해시와 솔트를 저장 형식으로 변환
@@ -135,6 +192,60 @@ def parse_hash_from_storage(hash_str: str) -> Tuple[bytes, bytes, str, int]:
     return hash_bytes, salt, algorithm, iterations
 
 
+def hash_password_for_storage(password: str) -> str:
+    """
+    비밀번호를 저장용 문자열로 해싱
+    
+    Args:
+        password: 평문 비밀번호
+    
+    Returns:
+        저장용 해시 문자열 (Argon2id 자기 기술 형식, 미설치 시 PBKDF2 형식)
+    """
+    if _ARGON2_HASHER is not None:
+        return _ARGON2_HASHER.hash(password)
+    
+    return format_hash_for_storage(*hash_password(password))
+
+
+def verify_stored_password(password: str, hash_str: str) -> bool:
+    """
+    저장된 해시 문자열로 비밀번호 검증 (Argon2id 및 기존 PBKDF2 형식 지원)
+    
+    Args:
+        password: 평문 비밀번호
+        hash_str: 저장된 해시 문자열
+    
+    Returns:
+        비밀번호 일치 여부
+    """
+    # Argon2 형식
+    if hash_str.startswith('$argon2'):
+        if _ARGON2_HASHER is None:
+            logger.error("argon2-cffi 라이브러리가 없어 Argon2 해시를 검증할 수 없습니다.")
+            return False
+        try:
+            return _ARGON2_HASHER.verify(hash_str, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    
+    # 기존 PBKDF2 형식: algorithm$iterations$salt$hash
+    try:
+        hash_bytes, salt, algorithm, iterations = parse_hash_from_storage(hash_str)
+    except (ValueError, binascii.Error):
+        logger.warning("잘못된 해시 형식")
+        return False
+    
+    test_hash = hashlib.pbkdf2_hmac(
+        algorithm,
+        password.encode('utf-8'),
+        salt,
+        iterations,
+        len(hash_bytes)
+    )
+    return hmac.compare_digest(test_hash, hash_bytes)
+
+
 def generate_token(user_id: Union[str, int], expiry: Optional[int] = None) -> str:
     """
     인증 토큰 생성
@@ -201,10 +312,16 @@ def verify_token(token: str) -> Optional[Dict[str, Any]]:
             data.encode('utf-8'),
             hashlib.sha256
         ).digest()
-        expected_signature_b64 = base64.urlsafe_b64encode(expected_signature).decode('utf-8').rstrip('=')
+        
+        # 수신 서명만 한 번 디코딩해 원시 다이제스트끼리 비교
+        try:
+            signature = base64.urlsafe_b64decode(signature_b64 + '=' * (-len(signature_b64) % 4))
+        except (binascii.Error, ValueError):
+            logger.warning("잘못된 토큰 서명")
+            return None
         
         # 상수 시간 비교 (타이밍 공격 방지)
-        if not hmac.compare_digest(signature_b64, expected_signature_b64):
+        if not hmac.compare_digest(signature, expected_signature):
             logger.warning("잘못된 토큰 서명")
             return None
         
@@ -234,16 +351,8 @@ def sanitize_html(html: str) -> str:
     Returns:
         정제된 문자열
     """
-    import re
-    
     # HTML 태그 제거
-    text = re.sub(r'<[^>]*>', '', html)
+    text = _HTML_TAG_RE.sub('', html)
     
     # 특수문자 이스케이프
-    text = text.replace('&', '&amp;')
-    text = text.replace('<', '&lt;')
-    text = text.replace('>', '&gt;')
-    text = text.replace('"', '&quot;')
-    text = text.replace("'", '&#39;')
-    
-    return text
+    return text.translate(_HTML_ESCAPE_TABLE)
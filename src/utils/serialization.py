@@ -0,0 +1,60 @@
+"""
+작업 직렬화 유틸리티 모듈
+- RQ 작업 데이터/결과 직렬화
+"""
+
+import zlib
+import pickle
+import logging
+from typing import Any
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# zlib 압축 수준 (1: 가장 빠름, OCR 텍스트/JSON 형태 결과에는 충분한 압축률)
+COMPRESSION_LEVEL = 1
+
+# pickle 프로토콜 2 이상의 시작 바이트 (압축 이전에 저장된 작업 데이터 판별용)
+_PICKLE_PROTO_MARKER = b'\x80'
+
+
+class CompressedPickleSerializer:
+    """
+    zlib으로 압축한 pickle 직렬화기
+
+    작업 인자(파일 바이트)와 결과(페이지 텍스트, 이미지 데이터)를 압축해
+    Redis 메모리 사용량과 작업 조회 시 전송량을 줄임.
+    압축 없이 저장된 기존 작업 데이터도 읽을 수 있음.
+    """
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        """
+        객체 직렬화 및 압축
+
+        Args:
+            obj: 직렬화할 객체
+
+        Returns:
+            압축된 바이트
+        """
+        return zlib.compress(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL), COMPRESSION_LEVEL)
+
+    @staticmethod
+    def loads(data: bytes) -> Any:
+        """
+        압축 해제 및 역직렬화
+
+        Args:
+            data: 직렬화된 바이트
+
+        Returns:
+            복원된 객체
+        """
+        if data[:1] == _PICKLE_PROTO_MARKER:
+            return pickle.loads(data)
+        return pickle.loads(zlib.decompress(data))
+
+
+# 웹/API/작업자 프로세스가 공통으로 사용하는 작업 직렬화기
+JOB_SERIALIZER = CompressedPickleSerializer
@@ -4,6 +4,7 @@
 """
 
 import os
+import re
 import logging
 from typing import Dict, Any, List, Union, Optional, Set
 
@@ -25,9 +26,31 @@ SUPPORTED_FILE_TYPES = {
     '.pdf': 'application/pdf'
 }
 
+# 지원 확장자 집합 (호출마다 새 집합을 만들지 않도록 미리 생성)
+_SUPPORTED_EXTENSIONS = frozenset(SUPPORTED_FILE_TYPES)
+
 # 기본 최대 파일 크기 (20MB)
 DEFAULT_MAX_FILE_SIZE = 20 * 1024 * 1024
 
+# 지원하는 언어 코드
+_VALID_LANG_CODES = frozenset({
+    # Tesseract 형식
+    'jpn', 'eng', 'kor', 'chi_sim', 'chi_tra',
+    
+    # ISO 639-1
+    'ja', 'en', 'ko', 'zh',
+    
+    # 국가 코드 포함
+    'ja-jp', 'en-us', 'ko-kr', 'zh-cn', 'zh-tw',
+    
+    # 스크립트 포함
+    'zh-hans', 'zh-hant'
+})
+
+# 형식 검증용 정규식 (모듈 로드 시 한 번만 컴파일)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(r'^(https?|ftp)://[^\s/$.?#].[^\s]*$')
+
 
 def validate_file_type(filename: str, allowed_types: Optional[Set[str]] = None) -> bool:
     """
@@ -45,7 +68,7 @@ def validate_file_type(filename: str, allowed_types: Optional[Set[str]] = None)
     
     # 허용된 형식이 지정되지 않은 경우 기본 지원 형식 사용
     if allowed_types is None:
-        allowed_types = set(SUPPORTED_FILE_TYPES.keys())
+        allowed_types = _SUPPORTED_EXTENSIONS
     
     # 확장자 검증
     return ext in allowed_types
@@ -103,22 +126,7 @@ def validate_language_code(lang: str) -> bool:
     Returns:
         유효 여부
     """
-    # 지원하는 언어 코드
-    valid_codes = {
-        # Tesseract 형식
-        'jpn', 'eng', 'kor', 'chi_sim', 'chi_tra',
-        
-        # ISO 639-1
-        'ja', 'en', 'ko', 'zh',
-        
-        # 국가 코드 포함
-        'ja-jp', 'en-us', 'ko-kr', 'zh-cn', 'zh-tw',
-        
-        # 스크립트 포함
-        'zh-hans', 'zh-hant'
-    }
-    
-    return lang.lower() in valid_codes
+    return lang in _VALID_LANG_CODES or lang.lower() in _VALID_LANG_CODES
 
 
 def validate_extraction_field(field: Dict[str, Any]) -> bool:
@@ -156,11 +164,8 @@ def validate_email(email: str) -> bool:
     Returns:
         유효 여부
     """
-    import re
-    
     # 간단한 이메일 형식 검증
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_url(url: str) -> bool:
@@ -173,11 +178,8 @@ def validate_url(url: str) -> bool:
     Returns:
         유효 여부
     """
-    import re
-    
     # URL 형식 검증
-    pattern = r'^(https?|ftp)://[^\s/$.?#].[^\s]*$'
-    return bool(re.match(pattern, url))
+    return bool(_URL_RE.match(url))
 
 
 def validate_json(json_str: str) -> bool:
@@ -37,7 +37,7 @@ USER_ROLES = {
 DEFAULT_ITEMS_PER_PAGE = 20
 
 # 편의성을 위한 주요 모듈/클래스 임포트
-from src.web.app import create_app
+from src.web.app import create_app, launch
 from src.web.forms import (
     LoginForm,
     UploadForm,
@@ -6,15 +6,31 @@
 """
 
 import os
+import hmac
+import time
+import asyncio
+import hashlib
 import logging
+import tempfile
+import threading
+import importlib.util
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 
+import jinja2
 from fastapi import FastAPI, Request, Depends, HTTPException, status
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.sessions import SessionMiddleware
+from starlette.middleware.sessions import SessionMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+try:
+    import orjson  # noqa: F401 (ORJSONResponse 사용 가능 여부 확인)
+    DEFAULT_RESPONSE_CLASS = ORJSONResponse
+except ImportError:
+    DEFAULT_RESPONSE_CLASS = JSONResponse
 
 from src.core.config import config
 
@@ -25,6 +41,93 @@ logger = logging.getLogger(__name__)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
 STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
+TEMPLATE_CACHE_DIR = os.path.join(tempfile.gettempdir(), "ocr_jinja_cache")
+
+# 상태 확인 API에서 보고하는 OCR 엔진 목록
+OCR_ENGINE_NAMES = ('custom_model', 'tesseract', 'google_vision', 'azure_form')
+
+# 관리자 계정 및 인증 설정 (실행 중 바뀌지 않으므로 시작 시 한 번만 조회)
+ADMIN_USERNAME = os.getenv("ADMIN_USERNAME", "admin")
+ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "admin")
+_ADMIN_USERNAME_BYTES = ADMIN_USERNAME.encode('utf-8')
+_ADMIN_PASSWORD_BYTES = ADMIN_PASSWORD.encode('utf-8')
+SECRET_KEY = config.get('app.secret_key', 'change-this-to-a-secure-secret')
+_AUTH_CACHE_KEY = SECRET_KEY.encode('utf-8')
+
+# 기본 인증 검증 결과 캐시 (실패 결과도 캐시해 반복 대입 시도 비용 제한)
+AUTH_CACHE_SIZE = 1024
+AUTH_CACHE_TTL = 300  # 초
+_auth_cache: OrderedDict = OrderedDict()
+_auth_cache_lock = threading.Lock()
+
+
+def _check_credentials(username: str, password: str) -> Optional[Dict[str, Any]]:
+    """
+    사용자 인증 정보 확인 (실제 구현에서는 데이터베이스 조회/해시 검증 필요)
+    
+    Args:
+        username: 사용자 이름
+        password: 비밀번호
+        
+    Returns:
+        사용자 정보 또는 None
+    """
+    # 상수 시간 비교 (사용자 이름과 비밀번호 모두 항상 비교해 타이밍 정보 노출 방지)
+    username_ok = hmac.compare_digest(username.encode('utf-8'), _ADMIN_USERNAME_BYTES)
+    password_ok = hmac.compare_digest(password.encode('utf-8'), _ADMIN_PASSWORD_BYTES)
+    
+    if username_ok & password_ok:
+        return {"username": ADMIN_USERNAME, "role": "admin"}
+    return None
+
+
+def _detect_engine_status() -> Dict[str, bool]:
+    """
+    OCR 엔진 사용 가능 여부 확인
+    
+    Returns:
+        엔진 이름 -> 사용 가능 여부
+    """
+    try:
+        from src.ocr.ensemble import OCREngine
+        engines = getattr(OCREngine(), 'engines', {})
+    except Exception as e:
+        logger.error(f"OCR 엔진 상태 확인 오류: {e}")
+        engines = {}
+    
+    return {name: name in engines for name in OCR_ENGINE_NAMES}
+
+
+def verify_credentials(username: str, password: str) -> Optional[Dict[str, Any]]:
+    """
+    사용자 인증 정보 확인 (TTL 캐시 적용)
+    
+    Args:
+        username: 사용자 이름
+        password: 비밀번호
+        
+    Returns:
+        사용자 정보 또는 None
+    """
+    # 평문 비밀번호 대신 비밀 키로 서명한 다이제스트를 캐시 키로 사용
+    cache_key = hmac.new(_AUTH_CACHE_KEY, f"{username}:{password}".encode('utf-8'), hashlib.sha256).digest()
+    now = time.monotonic()
+    
+    with _auth_cache_lock:
+        cached = _auth_cache.get(cache_key)
+        if cached is not None and cached[1] > now:
+            _auth_cache.move_to_end(cache_key)
+            return cached[0]
+    
+    user_info = _check_credentials(username, password)
+    
+    with _auth_cache_lock:
+        _auth_cache[cache_key] = (user_info, now + AUTH_CACHE_TTL)
+        _auth_cache.move_to_end(cache_key)
+        while len(_auth_cache) > AUTH_CACHE_SIZE:
+            _auth_cache.popitem(last=False)
+    
+    return user_info
 
 
 def create_app() -> FastAPI:
@@ -38,11 +141,19 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="초고정밀 멀티랭귀지 OCR 시스템",
         description="PDF 및 이미지에서 텍스트 추출 및 데이터 추출",
-        version="1.0.0"
+        version="1.0.0",
+        default_response_class=DEFAULT_RESPONSE_CLASS
     )
     
     # 템플릿 설정
     templates = Jinja2Templates(directory=TEMPLATE_DIR)
+    
+    # 컴파일된 템플릿 바이트코드를 디스크에 캐시 (재시작 후에도 재컴파일 생략)
+    os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+    templates.env.bytecode_cache = jinja2.FileSystemBytecodeCache(TEMPLATE_CACHE_DIR)
+    
+    # 운영 환경에서는 요청마다 템플릿 파일 변경 여부를 확인하지 않음
+    templates.env.auto_reload = config.get('app.debug', False)
     app.state.templates = templates
     
     # 정적 파일 설정
@@ -51,7 +162,7 @@ def create_app() -> FastAPI:
     # 미들웨어 설정
     app.add_middleware(
         SessionMiddleware,
-        secret_key=config.get('app.secret_key', 'change-this-to-a-secure-secret'),
+        secret_key=SECRET_KEY,
         session_cookie="ocr_session",
         max_age=config.get('web.session_lifetime', 86400)  # 기본 1일
     )
@@ -70,6 +181,7 @@ def create_app() -> FastAPI:
     
     # 인증 설정
     security = HTTPBasic()
+    auth_enabled = config.get('web.auth_enabled', True)
     
     # 인증 의존성
     async def get_current_user(
@@ -94,20 +206,15 @@ def create_app() -> FastAPI:
             return request.session["user"]
         
         # 인증 활성화 여부 확인
-        auth_enabled = config.get('web.auth_enabled', True)
         if not auth_enabled:
             # 인증 비활성화 시 게스트 사용자 반환
             return {"username": "guest", "role": "guest"}
         
         # 기본 인증 확인 (HTTP Basic Auth)
         if credentials:
-            # 기본 사용자 정보 (실제 구현에서는 데이터베이스 조회 필요)
-            admin_username = os.getenv("ADMIN_USERNAME", "admin")
-            admin_password = os.getenv("ADMIN_PASSWORD", "admin")
-            
-            if credentials.username == admin_username and credentials.password == admin_password:
-                user_info = {"username": admin_username, "role": "admin"}
-                request.session["user"] = user_info
+            user_info = verify_credentials(credentials.username, credentials.password)
+            if user_info is not None:
+                request.session["user"] = dict(user_info)
                 return user_info
         
         # 인증 실패
@@ -117,14 +224,14 @@ def create_app() -> FastAPI:
             headers={"WWW-Authenticate": "Basic"},
         )
     
-    # 의존성 앱에 저장
-    app.dependency_overrides[get_current_user] = get_current_user
-    
     # 앱 시작/종료 이벤트 설정
     @app.on_event("startup")
     async def startup_event():
         """앱 시작 시 실행할 이벤트"""
         logger.info("웹 애플리케이션 시작")
+        
+        # OCR 엔진 사용 가능 여부를 한 번만 확인 (상태 확인 요청마다 엔진을 생성하지 않도록)
+        app.state.engine_status = await asyncio.to_thread(_detect_engine_status)
     
     @app.on_event("shutdown")
     async def shutdown_event():
@@ -132,3 +239,30 @@ def create_app() -> FastAPI:
         logger.info("웹 애플리케이션 종료")
     
     return app
+
+
+def launch(host: Optional[str] = None, port: Optional[int] = None, workers: Optional[int] = None) -> None:
+    """
+    웹 애플리케이션 서버 실행 (uvloop/httptools가 설치되어 있으면 사용)
+    
+    Args:
+        host: 바인딩 호스트 (None이면 설정값 사용)
+        port: 포트 (None이면 설정값 사용)
+        workers: 작업자 프로세스 수 (None이면 설정값 사용)
+    """
+    import uvicorn
+    
+    # C 확장 이벤트 루프/HTTP 파서 사용 (없으면 순수 Python 구현으로 대체)
+    loop = 'uvloop' if importlib.util.find_spec('uvloop') else 'asyncio'
+    http = 'httptools' if importlib.util.find_spec('httptools') else 'h11'
+    logger.info(f"웹 서버 시작 (이벤트 루프: {loop}, HTTP 파서: {http})")
+    
+    uvicorn.run(
+        "src.web.app:create_app",
+        factory=True,
+        host=host or config.get('app.web_host', '0.0.0.0'),
+        port=port or config.get('app.web_port', 8000),
+        workers=workers or config.get('web.workers', 1),
+        loop=loop,
+        http=http
+    )
@@ -4,7 +4,8 @@
 """
 
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, ValidationError
+from fastapi import Request, HTTPException, status
 
 
 class LoginForm(BaseModel):
@@ -13,13 +14,15 @@ class LoginForm(BaseModel):
     password: str = Field(..., title="비밀번호")
     remember_me: bool = Field(default=False, title="로그인 상태 유지")
     
-    @validator('username')
+    @field_validator('username')
+    @classmethod
     def username_must_not_be_empty(cls, value):
         if not value.strip():
             raise ValueError('사용자 이름을 입력해주세요')
         return value
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def password_must_not_be_empty(cls, value):
         if not value.strip():
             raise ValueError('비밀번호를 입력해주세요')
@@ -28,12 +31,11 @@ class LoginForm(BaseModel):
 
 class UploadForm(BaseModel):
     """파일 업로드 폼"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
     file: Any = Field(..., title="파일")
     language: Optional[str] = Field(None, title="언어 코드")
     extract_entities: bool = Field(default=True, title="엔티티 추출 여부")
-    
-    class Config:
-        arbitrary_types_allowed = True
 
 
 class ExtractionField(BaseModel):
@@ -49,7 +51,8 @@ class ExtractionForm(BaseModel):
     fields: Optional[List[ExtractionField]] = Field(None, title="추출 필드 목록")
     language: Optional[str] = Field(None, title="언어 코드")
     
-    @validator('fields')
+    @field_validator('fields')
+    @classmethod
     def validate_fields(cls, values):
         """필드 유효성 검사"""
         if values:
@@ -73,10 +76,50 @@ class SettingsForm(BaseModel):
     detect_handwriting: bool = Field(default=True, title="손글씨 감지")
     detect_strikethrough: bool = Field(default=True, title="취소선 감지")
     
-    @validator('confidence_threshold')
+    @field_validator('confidence_threshold')
+    @classmethod
     def validate_confidence_threshold(cls, value):
         """신뢰도 임계값 유효성 검사"""
         if value < 0.0 or value > 1.0:
             raise ValueError('신뢰도 임계값은 0.0에서 1.0 사이여야 합니다.')
         
         return value
+
+
+# 검증 스키마를 모듈 로드 시 미리 빌드 (첫 요청에서 지연 빌드하지 않도록)
+for _form_class in (LoginForm, UploadForm, ExtractionField, ExtractionForm, SettingsForm):
+    _form_class.model_rebuild()
+
+
+async def _parse_form(request: Request, form_class):
+    """
+    요청 본문(폼 데이터)을 폼 모델로 변환 (비동기 의존성 공통 처리)
+    
+    Args:
+        request: FastAPI 요청 객체
+        form_class: 폼 모델 클래스
+        
+    Returns:
+        폼 모델 인스턴스
+        
+    Raises:
+        HTTPException: 폼 검증 실패
+    """
+    form = await request.form()
+    try:
+        return form_class(**form)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="; ".join(error['msg'] for error in e.errors())
+        )
+
+
+async def parse_login_form(request: Request) -> LoginForm:
+    """로그인 폼 의존성"""
+    return await _parse_form(request, LoginForm)
+
+
+async def parse_settings_form(request: Request) -> SettingsForm:
+    """설정 폼 의존성"""
+    return await _parse_form(request, SettingsForm)
@@ -6,12 +6,15 @@
 
 import os
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import aiofiles
 import json
 import redis
-from rq.job import Job
+import redis.asyncio as aioredis
+from rq.job import Job, JobStatus
 import time
+import asyncio
+import secrets
 import rq
 
 from fastapi import APIRouter, Request, Depends, HTTPException, File, UploadFile, Form, status
@@ -19,23 +22,271 @@ from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse, JSON
 from fastapi.templating import Jinja2Templates
 
 from src.core.config import config
-from src.web.forms import UploadForm, ExtractionForm, SettingsForm, LoginForm
+from src.web.forms import (
+    UploadForm, ExtractionForm, SettingsForm, LoginForm,
+    parse_login_form, parse_settings_form
+)
 from src.storage.manager import StorageManager
-from src.worker.tasks import process_document, extract_data_from_document, export_data_to_csv
+from src.extraction.field_config import FieldConfig
+from src.web.app import verify_credentials
+from src.utils.serialization import JOB_SERIALIZER
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# JSON 처리 (orjson이 있으면 C 구현 사용, 없으면 표준 json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = lambda obj: json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
 # 라우터 설정
 router = APIRouter()
 
-# Redis 연결
+# 작업 함수 경로 (작업자 프로세스에서만 임포트되도록 문자열로 지정,
+# 웹 프로세스에서 OCR/ML 의존성을 불러오지 않음)
+_PROCESS_STORED_DOCUMENT_TASK = 'src.worker.tasks.process_stored_document'
+_EXTRACT_DATA_TASK = 'src.worker.tasks.extract_data_from_document'
+
+# Redis 연결 (요청 간 공유하는 연결 풀) 및 작업 큐
 try:
-    redis_conn = redis.Redis.from_url(config.get('queue.redis_url', 'redis://localhost:6379/0'))
+    _redis_pool = redis.ConnectionPool.from_url(
+        config.get('queue.redis_url', 'redis://localhost:6379/0'),
+        max_connections=config.get('queue.redis_max_connections', 64),
+        health_check_interval=30
+    )
+    redis_conn = redis.Redis(connection_pool=_redis_pool)
+    
+    # 라우트에서 직접 사용하는 Redis 명령은 이벤트 루프를 막지 않도록 비동기 클라이언트 사용
+    # (RQ는 동기 클라이언트만 지원하므로 RQ 호출은 스레드에서 실행)
+    aredis_conn = aioredis.Redis(connection_pool=aioredis.ConnectionPool.from_url(
+        config.get('queue.redis_url', 'redis://localhost:6379/0'),
+        max_connections=config.get('queue.redis_max_connections', 64),
+        health_check_interval=30
+    ))
+    _queue = rq.Queue(
+        config.get('queue.queue_name', 'ocr_tasks'),
+        connection=redis_conn,
+        serializer=JOB_SERIALIZER,
+        default_timeout=config.get('queue.timeout', 3600)  # 기본 1시간 타임아웃
+    )
     logger.info("Redis 연결 성공")
 except Exception as e:
     logger.error(f"Redis 연결 오류: {e}")
     redis_conn = None
+    aredis_conn = None
+    _queue = None
+
+# 페이지당 기본 항목 수
+_ITEMS_PER_PAGE = config.get('web.items_per_page', 20)
+
+# Redis 상태 확인 결과 캐시 (확인 시각, 연결 여부)
+_REDIS_PING_TTL = 2.0  # 초
+_last_redis_ping = (float('-inf'), False)
+
+# 지원 파일 형식
+_SUPPORTED_EXTENSIONS = frozenset({".pdf", ".jpg", ".jpeg", ".png", ".tiff", ".tif", ".bmp", ".gif"})
+_SUPPORTED_EXTENSIONS_MSG = ", ".join([".pdf", ".jpg", ".jpeg", ".png", ".tiff", ".tif", ".bmp", ".gif"])
+
+# 스토리지 관리자 (첫 업로드 시 생성해 재사용)
+_storage_manager: Optional[StorageManager] = None
+
+
+def _get_storage_manager() -> StorageManager:
+    """공유 스토리지 관리자 반환"""
+    global _storage_manager
+    if _storage_manager is None:
+        _storage_manager = StorageManager()
+    return _storage_manager
+
+
+# 필드 설정 (파일이 바뀐 경우에만 다시 로드)
+_field_config: Optional[FieldConfig] = None
+_field_config_mtime: Optional[float] = None
+
+
+def _get_field_config() -> FieldConfig:
+    """
+    공유 필드 설정 반환 (다른 프로세스의 변경도 파일 수정 시각으로 감지)
+    
+    Returns:
+        필드 설정 객체
+    """
+    global _field_config, _field_config_mtime
+    
+    field_config = _field_config or FieldConfig()
+    try:
+        mtime = os.stat(field_config.config_file).st_mtime
+    except OSError:
+        mtime = None
+    
+    if _field_config is None or mtime != _field_config_mtime:
+        if _field_config is not None:
+            field_config = FieldConfig(field_config.config_file)
+        _field_config = field_config
+        _field_config_mtime = mtime
+    
+    return _field_config
+
+
+def _save_field_config(fields: List[Dict[str, Any]]) -> None:
+    """
+    공유 필드 설정 갱신 및 저장 (저장 후 불필요한 재로드 방지)
+    
+    Args:
+        fields: 필드 설정 목록
+    """
+    global _field_config_mtime
+    
+    field_config = _get_field_config()
+    field_config.fields = fields
+    field_config._save_fields()
+    
+    try:
+        _field_config_mtime = os.stat(field_config.config_file).st_mtime
+    except OSError:
+        _field_config_mtime = None
+
+
+# 사용자별 작업 목록 (Redis sorted set, score=타임스탬프)
+_TASKS_KEY_PREFIX = "tasks:"
+_TASKS_MAX_ITEMS = config.get('web.task_history_max_items', 1000)  # 사용자별 최대 보관 항목 수
+_TASKS_TTL = config.get('web.task_history_ttl', 604800)  # 마지막 작업 등록 후 보관 기간 (초)
+_ANON_TASKS_TTL = min(_TASKS_TTL, config.get('web.session_lifetime', 86400))  # 익명 목록은 세션 만료 후 접근 불가
+
+
+def _tasks_key(request: Request, create: bool = True) -> Optional[str]:
+    """
+    사용자별 작업 목록 Redis 키 반환 (로그인하지 않은 경우 세션별 익명 ID 사용)
+    
+    Args:
+        request: FastAPI 요청 객체
+        create: 익명 ID가 없을 때 새로 발급할지 여부 (조회 전용이면 False)
+        
+    Returns:
+        Redis 키 (create가 False이고 익명 ID가 없으면 None)
+    """
+    user = request.session.get("user")
+    if user:
+        return f"{_TASKS_KEY_PREFIX}{user['username']}"
+    
+    owner_id = request.session.get("owner_id")
+    if owner_id is None:
+        if not create:
+            return None
+        owner_id = secrets.token_hex(16)
+        request.session["owner_id"] = owner_id
+    return f"{_TASKS_KEY_PREFIX}anon:{owner_id}"
+
+
+async def _record_task(request: Request, entry: Dict[str, Any]) -> None:
+    """
+    작업 항목을 사용자별 작업 목록에 추가
+    
+    Args:
+        request: FastAPI 요청 객체
+        entry: 작업 정보 (timestamp 포함)
+    """
+    key = _tasks_key(request)
+    
+    # 추가와 함께 오래된 항목 정리 및 만료 시간 갱신 (한 번의 왕복)
+    pipe = aredis_conn.pipeline(transaction=False)
+    pipe.zadd(key, {_json_dumps(entry): entry["timestamp"]})
+    pipe.zremrangebyrank(key, 0, -_TASKS_MAX_ITEMS - 1)
+    pipe.expire(key, _TASKS_TTL if request.session.get("user") else _ANON_TASKS_TTL)
+    await pipe.execute()
+
+
+def _fetch_job_state(task_id: str) -> Tuple[str, Any, Optional[str]]:
+    """
+    작업 상태, 결과, 오류 정보 조회 (동기 RQ 호출이므로 스레드에서 실행)
+    
+    Args:
+        task_id: 작업 ID
+        
+    Returns:
+        (작업 상태, 결과, 오류 정보) 튜플
+    """
+    job = Job.fetch(task_id, connection=redis_conn, serializer=JOB_SERIALIZER)
+    job_status = job.get_status(refresh=False)
+    
+    result = job.result if job_status == JobStatus.FINISHED else None
+    error = str(job.exc_info) if job_status == JobStatus.FAILED else None
+    
+    return job_status, result, error
+
+
+# 컴파일된 템플릿 캐시 (템플릿 이름 -> Template)
+_TEMPLATE_CACHE: Dict[str, Any] = {}
+
+
+def _render(request: Request, name: str, context: Dict[str, Any], status_code: int = 200) -> HTMLResponse:
+    """
+    템플릿 렌더링 (컴파일된 템플릿을 캐시해 재사용)
+    
+    Args:
+        request: FastAPI 요청 객체
+        name: 템플릿 파일명
+        context: 템플릿 컨텍스트 (request는 자동 추가)
+        status_code: HTTP 상태 코드
+        
+    Returns:
+        HTML 응답
+    """
+    env = request.app.state.templates.env
+    
+    # 자동 리로드(디버그) 모드에서는 Jinja2가 변경 여부를 확인하도록 캐시 생략
+    template = _TEMPLATE_CACHE.get(name)
+    if template is None:
+        template = env.get_template(name)
+        if not env.auto_reload:
+            _TEMPLATE_CACHE[name] = template
+    
+    return HTMLResponse(template.render({"request": request, **context}), status_code=status_code)
+
+
+# Redis 연결 오류 페이지 캐시 (로그인 사용자 이름 -> 렌더링된 본문)
+_REDIS_UNAVAILABLE_CACHE_SIZE = 256
+_redis_unavailable_pages: Dict[Optional[str], bytes] = {}
+
+
+def _redis_unavailable(request: Request) -> HTMLResponse:
+    """
+    Redis 연결 오류 페이지 응답 (사용자별로 한 번만 렌더링)
+    
+    Args:
+        request: FastAPI 요청 객체
+        
+    Returns:
+        HTML 응답 (503)
+    """
+    # 레이아웃이 로그인 사용자 이름을 표시하므로 사용자별로 캐시
+    user = request.session.get("user")
+    key = user["username"] if user else None
+    
+    body = _redis_unavailable_pages.get(key)
+    if body is None:
+        response = _render(
+            request,
+            "error.html",
+            {
+                "page": "error",
+                "error": "Redis 연결을 사용할 수 없습니다."
+            },
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+        if request.app.state.templates.env.auto_reload:
+            return response
+        
+        body = response.body
+        if len(_redis_unavailable_pages) >= _REDIS_UNAVAILABLE_CACHE_SIZE:
+            _redis_unavailable_pages.clear()
+        _redis_unavailable_pages[key] = body
+    
+    return HTMLResponse(body, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -49,10 +300,10 @@ async def index(request: Request):
     Returns:
         HTML 응답
     """
-    templates = request.app.state.templates
-    return templates.TemplateResponse(
+    return _render(
+        request,
         "index.html",
-        {"request": request, "page": "home"}
+        {"page": "home"}
     )
 
 
@@ -67,15 +318,15 @@ async def login_page(request: Request):
     Returns:
         HTML 응답
     """
-    templates = request.app.state.templates
-    return templates.TemplateResponse(
+    return _render(
+        request,
         "login.html",
-        {"request": request, "page": "login", "form": LoginForm()}
+        {"page": "login", "form": LoginForm.model_construct()}
     )
 
 
 @router.post("/login")
-async def login(request: Request, form_data: LoginForm = Depends()):
+async def login(request: Request, form_data: LoginForm = Depends(parse_login_form)):
     """
     로그인 처리
     
@@ -86,21 +337,19 @@ async def login(request: Request, form_data: LoginForm = Depends()):
     Returns:
         리다이렉트 응답
     """
-    # 로그인 검증 (실제 구현에서는 데이터베이스 조회 필요)
-    admin_username = os.getenv("ADMIN_USERNAME", "admin")
-    admin_password = os.getenv("ADMIN_PASSWORD", "admin")
+    # 로그인 검증 (기본 인증과 같은 검증 경로 사용)
+    user_info = verify_credentials(form_data.username, form_data.password)
     
-    if form_data.username == admin_username and form_data.password == admin_password:
+    if user_info is not None:
         # 로그인 성공
-        request.session["user"] = {"username": admin_username, "role": "admin"}
+        request.session["user"] = dict(user_info)
         return RedirectResponse(url="/", status_code=status.HTTP_303_SEE_OTHER)
     
     # 로그인 실패
-    templates = request.app.state.templates
-    return templates.TemplateResponse(
+    return _render(
+        request,
         "login.html",
         {
-            "request": request,
             "page": "login",
             "form": form_data,
             "error": "잘못된 사용자 이름 또는 비밀번호입니다."
@@ -138,10 +387,10 @@ async def upload_page(request: Request):
     Returns:
         HTML 응답
     """
-    templates = request.app.state.templates
-    return templates.TemplateResponse(
+    return _render(
+        request,
         "upload.html",
-        {"request": request, "page": "upload", "form": UploadForm()}
+        {"page": "upload", "form": UploadForm.model_construct()}
     )
 
 
@@ -166,25 +415,20 @@ async def upload(
     """
     # 파일 확장자 확인
     file_ext = os.path.splitext(file.filename)[1].lower()
-    supported_types = [".pdf", ".jpg", ".jpeg", ".png", ".tiff", ".tif", ".bmp", ".gif"]
     
-    if file_ext not in supported_types:
-        templates = request.app.state.templates
-        return templates.TemplateResponse(
+    if file_ext not in _SUPPORTED_EXTENSIONS:
+        return _render(
+            request,
             "upload.html",
             {
-                "request": request,
                 "page": "upload",
-                "form": UploadForm(),
-                "error": f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(supported_types)}"
+                "form": UploadForm.model_construct(),
+                "error": f"지원하지 않는 파일 형식입니다. 지원 형식: {_SUPPORTED_EXTENSIONS_MSG}"
             },
             status_code=status.HTTP_400_BAD_REQUEST
         )
     
     try:
-        # 파일 내용 읽기
-        file_bytes = await file.read()
-        
         # 처리 옵션
         options = {
             "language": language,
@@ -197,23 +441,21 @@ async def upload(
         if redis_conn is None:
             raise HTTPException(status_code=503, detail="작업 큐를 사용할 수 없습니다.")
         
-        # 작업 큐 생성
-        queue = rq.Queue(config.get('queue.queue_name', 'ocr_tasks'), connection=redis_conn)
+        # 업로드 파일을 메모리에 읽지 않고 스토리지로 스트리밍 저장
+        # (작업에는 파일 내용 대신 저장 경로만 전달)
+        file_path = await _get_storage_manager().save_file_stream(file.file, file.filename)
         
         # 작업 큐에 추가
-        job = queue.enqueue(
-            process_document,
-            args=(file_bytes, file.filename, options),
-            job_timeout=config.get('queue.timeout', 3600)  # 기본 1시간 타임아웃
+        job = await asyncio.to_thread(
+            _queue.enqueue,
+            _PROCESS_STORED_DOCUMENT_TASK,
+            args=(file_path, file.filename, options)
         )
         
         logger.info(f"OCR 작업 큐에 추가: {job.id}, 파일: {file.filename}")
         
-        # 작업 ID를 세션에 저장 (사용자별 작업 추적)
-        if "tasks" not in request.session:
-            request.session["tasks"] = []
-        
-        request.session["tasks"].append({
+        # 작업 ID를 사용자별 작업 목록에 저장
+        await _record_task(request, {
             "id": job.id,
             "type": "ocr",
             "filename": file.filename,
@@ -228,13 +470,12 @@ async def upload(
     
     except Exception as e:
         logger.error(f"업로드 처리 오류: {e}")
-        templates = request.app.state.templates
-        return templates.TemplateResponse(
+        return _render(
+            request,
             "upload.html",
             {
-                "request": request,
                 "page": "upload",
-                "form": UploadForm(),
+                "form": UploadForm.model_construct(),
                 "error": f"파일 처리 오류: {str(e)}"
             },
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -253,68 +494,37 @@ async def result_page(request: Request, task_id: str):
     Returns:
         HTML 응답
     """
-    templates = request.app.state.templates
     
     # Redis 확인
     if redis_conn is None:
-        return templates.TemplateResponse(
-            "error.html",
-            {
-                "request": request,
-                "page": "error",
-                "error": "Redis 연결을 사용할 수 없습니다."
-            },
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
-        )
+        return _redis_unavailable(request)
     
     try:
         # 작업 가져오기
-        job = Job.fetch(task_id, connection=redis_conn)
+        job_status, result, error = await asyncio.to_thread(_fetch_job_state, task_id)
         
-        # 작업 상태 확인
-        if job.is_finished:
+        # 작업 상태에 따라 컨텍스트 구성 후 한 번만 렌더링
+        context = {"page": "result", "task_id": task_id}
+        if job_status == JobStatus.FINISHED:
             # 완료된 작업
-            result = job.result
-            return templates.TemplateResponse(
-                "result.html",
-                {
-                    "request": request,
-                    "page": "result",
-                    "task_id": task_id,
-                    "result": result,
-                    "status": "completed"
-                }
-            )
-        elif job.is_failed:
+            context["status"] = "completed"
+            context["result"] = result
+        elif job_status == JobStatus.FAILED:
             # 실패한 작업
-            return templates.TemplateResponse(
-                "result.html",
-                {
-                    "request": request,
-                    "page": "result",
-                    "task_id": task_id,
-                    "error": str(job.exc_info),
-                    "status": "failed"
-                }
-            )
+            context["status"] = "failed"
+            context["error"] = error
         else:
             # 진행 중인 작업
-            return templates.TemplateResponse(
-                "result.html",
-                {
-                    "request": request,
-                    "page": "result",
-                    "task_id": task_id,
-                    "status": "processing"
-                }
-            )
+            context["status"] = "processing"
+        
+        return _render(request, "result.html", context)
     
     except Exception as e:
         logger.error(f"결과 페이지 오류: {e}")
-        return templates.TemplateResponse(
+        return _render(
+            request,
             "error.html",
             {
-                "request": request,
                 "page": "error",
                 "error": f"결과 조회 오류: {str(e)}"
             },
@@ -339,28 +549,47 @@ async def documents_page(
     Returns:
         HTML 응답
     """
-    templates = request.app.state.templates
     
     # 페이지당 항목 수 설정
     if items_per_page is None:
-        items_per_page = config.get('web.items_per_page', 20)
+        items_per_page = _ITEMS_PER_PAGE
+    
+    page = max(page, 1)
+    start_idx = (page - 1) * items_per_page
     
-    # 사용자 작업 목록 (세션에서 가져오기)
-    tasks = request.session.get("tasks", [])
+    # 사용자 작업 목록 (Redis에서 현재 페이지만 최신순으로 조회)
+    total_items = 0
+    current_items = []
+    # 조회만 하므로 익명 ID를 새로 발급하지 않음 (작업을 등록한 적 없는 세션은 빈 목록)
+    key = _tasks_key(request, create=False)
+    if aredis_conn is not None and key is not None:
+        try:
+            pipe = aredis_conn.pipeline(transaction=False)
+            pipe.zcard(key)
+            pipe.zrevrange(key, start_idx, start_idx + items_per_page - 1)
+            total_items, raw_items = await pipe.execute()
+            current_items = [_json_loads(item) for item in raw_items]
+            
+            # 작업 상태를 한 번의 왕복으로 조회 (항목별 Job.fetch 대신 파이프라인)
+            if current_items:
+                pipe = aredis_conn.pipeline(transaction=False)
+                for item in current_items:
+                    pipe.hmget(Job.key_for(item["id"]), "status", "ended_at")
+                
+                for item, (job_status, ended_at) in zip(current_items, await pipe.execute()):
+                    # 만료된 작업은 해시가 없으므로 상태를 알 수 없음
+                    item["status"] = job_status.decode() if job_status else "unknown"
+                    item["ended_at"] = ended_at.decode() if ended_at else None
+        except Exception as e:
+            logger.error(f"작업 목록 조회 오류: {e}")
     
     # 페이지네이션
-    total_items = len(tasks)
     total_pages = (total_items + items_per_page - 1) // items_per_page
     
-    # 현재 페이지 항목
-    start_idx = (page - 1) * items_per_page
-    end_idx = min(start_idx + items_per_page, total_items)
-    current_items = tasks[start_idx:end_idx]
-    
-    return templates.TemplateResponse(
+    return _render(
+        request,
         "documents.html",
         {
-            "request": request,
             "page": "documents",
             "items": current_items,
             "current_page": page,
@@ -383,48 +612,35 @@ async def extraction_page(request: Request, task_id: str):
     Returns:
         HTML 응답
     """
-    templates = request.app.state.templates
     
     # Redis 확인
     if redis_conn is None:
-        return templates.TemplateResponse(
-            "error.html",
-            {
-                "request": request,
-                "page": "error",
-                "error": "Redis 연결을 사용할 수 없습니다."
-            },
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
-        )
+        return _redis_unavailable(request)
     
     try:
         # OCR 작업 가져오기
-        ocr_job = Job.fetch(task_id, connection=redis_conn)
+        job_status, ocr_result, _ = await asyncio.to_thread(_fetch_job_state, task_id)
         
         # OCR 작업 완료 확인
-        if not ocr_job.is_finished:
-            return templates.TemplateResponse(
+        if job_status != JobStatus.FINISHED:
+            return _render(
+                request,
                 "error.html",
                 {
-                    "request": request,
                     "page": "error",
                     "error": "OCR 작업이 아직 완료되지 않았습니다."
                 },
                 status_code=status.HTTP_400_BAD_REQUEST
             )
         
-        # OCR 결과
-        ocr_result = ocr_job.result
-        
         # 필드 설정 가져오기
-        from src.extraction.field_config import FieldConfig
-        field_config = FieldConfig()
-        fields = field_config.get_fields()
+        fields = _get_field_config().get_fields()
+        
+        return _render(
         
-        return templates.TemplateResponse(
+            request,
             "extraction.html",
             {
-                "request": request,
                 "page": "extraction",
                 "task_id": task_id,
                 "ocr_result": ocr_result,
@@ -435,10 +651,10 @@ async def extraction_page(request: Request, task_id: str):
     
     except Exception as e:
         logger.error(f"추출 페이지 오류: {e}")
-        return templates.TemplateResponse(
+        return _render(
+            request,
             "error.html",
             {
-                "request": request,
                 "page": "error",
                 "error": f"추출 페이지 오류: {str(e)}"
             },
@@ -472,7 +688,7 @@ async def extraction_submit(
         fields_data = None
         if fields:
             try:
-                fields_data = json.loads(fields)
+                fields_data = _json_loads(fields)
             except json.JSONDecodeError:
                 raise HTTPException(status_code=400, detail="필드 설정이 올바른 JSON 형식이 아닙니다.")
         
@@ -481,23 +697,17 @@ async def extraction_submit(
             "fields": fields_data
         }
         
-        # 작업 큐 생성
-        queue = rq.Queue(config.get('queue.queue_name', 'ocr_tasks'), connection=redis_conn)
-        
         # 작업 큐에 추가
-        job = queue.enqueue(
-            extract_data_from_document,
-            args=(task_id, options),
-            job_timeout=config.get('queue.timeout', 3600)  # 기본 1시간 타임아웃
+        job = await asyncio.to_thread(
+            _queue.enqueue,
+            _EXTRACT_DATA_TASK,
+            args=(task_id, options)
         )
         
         logger.info(f"데이터 추출 작업 큐에 추가: {job.id}, OCR 작업: {task_id}")
         
-        # 작업 ID를 세션에 저장 (사용자별 작업 추적)
-        if "tasks" not in request.session:
-            request.session["tasks"] = []
-        
-        request.session["tasks"].append({
+        # 작업 ID를 사용자별 작업 목록에 저장
+        await _record_task(request, {
             "id": job.id,
             "type": "extraction",
             "ocr_task_id": task_id,
@@ -531,68 +741,37 @@ async def extraction_result_page(request: Request, task_id: str):
     Returns:
         HTML 응답
     """
-    templates = request.app.state.templates
     
     # Redis 확인
     if redis_conn is None:
-        return templates.TemplateResponse(
-            "error.html",
-            {
-                "request": request,
-                "page": "error",
-                "error": "Redis 연결을 사용할 수 없습니다."
-            },
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
-        )
+        return _redis_unavailable(request)
     
     try:
         # 작업 가져오기
-        job = Job.fetch(task_id, connection=redis_conn)
+        job_status, result, error = await asyncio.to_thread(_fetch_job_state, task_id)
         
-        # 작업 상태 확인
-        if job.is_finished:
+        # 작업 상태에 따라 컨텍스트 구성 후 한 번만 렌더링
+        context = {"page": "extraction_result", "task_id": task_id}
+        if job_status == JobStatus.FINISHED:
             # 완료된 작업
-            result = job.result
-            return templates.TemplateResponse(
-                "extraction_result.html",
-                {
-                    "request": request,
-                    "page": "extraction_result",
-                    "task_id": task_id,
-                    "result": result,
-                    "status": "completed"
-                }
-            )
-        elif job.is_failed:
+            context["status"] = "completed"
+            context["result"] = result
+        elif job_status == JobStatus.FAILED:
             # 실패한 작업
-            return templates.TemplateResponse(
-                "extraction_result.html",
-                {
-                    "request": request,
-                    "page": "extraction_result",
-                    "task_id": task_id,
-                    "error": str(job.exc_info),
-                    "status": "failed"
-                }
-            )
+            context["status"] = "failed"
+            context["error"] = error
         else:
             # 진행 중인 작업
-            return templates.TemplateResponse(
-                "extraction_result.html",
-                {
-                    "request": request,
-                    "page": "extraction_result",
-                    "task_id": task_id,
-                    "status": "processing"
-                }
-            )
+            context["status"] = "processing"
+        
+        return _render(request, "extraction_result.html", context)
     
     except Exception as e:
         logger.error(f"추출 결과 페이지 오류: {e}")
-        return templates.TemplateResponse(
+        return _render(
+            request,
             "error.html",
             {
-                "request": request,
                 "page": "error",
                 "error": f"추출 결과 조회 오류: {str(e)}"
             },
@@ -611,12 +790,9 @@ async def settings_page(request: Request):
     Returns:
         HTML 응답
     """
-    templates = request.app.state.templates
     
     # 현재 설정 가져오기
-    from src.extraction.field_config import FieldConfig
-    field_config = FieldConfig()
-    fields = field_config.get_fields()
+    fields = _get_field_config().get_fields()
     
     # OCR 엔진 설정
     ocr_settings = {
@@ -639,10 +815,11 @@ async def settings_page(request: Request):
         'chi_tra': '중국어 번체'
     })
     
-    return templates.TemplateResponse(
+    return _render(
+    
+        request,
         "settings.html",
         {
-            "request": request,
             "page": "settings",
             "fields": fields,
             "ocr_settings": ocr_settings,
@@ -655,7 +832,7 @@ async def settings_page(request: Request):
 @router.post("/settings")
 async def settings_submit(
     request: Request,
-    form_data: SettingsForm = Depends()
+    form_data: SettingsForm = Depends(parse_settings_form)
 ):
     """
     설정 저장
@@ -668,18 +845,17 @@ async def settings_submit(
         리다이렉트 응답
     """
     try:
-        # 필드 설정 업데이트
-        from src.extraction.field_config import FieldConfig
-        field_config = FieldConfig()
-        
-        # 폼 데이터에서 필드 설정 파싱
+        # 폼 데이터에서 필드 설정 파싱 후 공유 필드 설정 업데이트
         if form_data.fields:
             try:
-                fields_data = json.loads(form_data.fields)
-                field_config.fields = fields_data
-                field_config._save_fields()
+                fields_data = _json_loads(form_data.fields)
             except json.JSONDecodeError:
                 raise HTTPException(status_code=400, detail="필드 설정이 올바른 JSON 형식이 아닙니다.")
+            
+            try:
+                _save_field_config(fields_data)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=f"필드 설정 형식 오류: {str(e)}")
         
         # 설정 페이지로 리다이렉트
         return RedirectResponse(
@@ -714,15 +890,12 @@ async def export_csv(request: Request, task_id: str):
     
     try:
         # 작업 가져오기
-        job = Job.fetch(task_id, connection=redis_conn)
+        job_status, result, _ = await asyncio.to_thread(_fetch_job_state, task_id)
         
         # 작업 완료 확인
-        if not job.is_finished:
+        if job_status != JobStatus.FINISHED:
             raise HTTPException(status_code=400, detail="추출 작업이 아직 완료되지 않았습니다.")
         
-        # 결과 가져오기
-        result = job.result
-        
         # 필드 데이터 확인
         if not result or 'fields' not in result:
             raise HTTPException(status_code=404, detail="추출된 필드 데이터가 없습니다.")
@@ -731,13 +904,12 @@ async def export_csv(request: Request, task_id: str):
         from src.extraction.csv_exporter import CSVExporter
         
         exporter = CSVExporter()
-        csv_data = exporter.export_single(result['fields'])
         
         # CSV 파일 다운로드 응답
         from fastapi.responses import StreamingResponse
         
         return StreamingResponse(
-            iter([csv_data.getvalue()]),
+            exporter.iter_single(result['fields']),
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment;filename=extraction_{task_id}.csv"
@@ -754,31 +926,35 @@ async def export_csv(request: Request, task_id: str):
 
 # 상태 확인 API
 @router.get("/status")
-async def status():
+async def system_status(request: Request):
     """
     시스템 상태 확인
     
+    Args:
+        request: FastAPI 요청 객체
+        
     Returns:
         JSON 응답
     """
-    from src.ocr.ensemble import OCREngine
+    global _last_redis_ping
     
-    # Redis 연결 확인
+    # Redis 연결 확인 (짧은 시간 동안은 이전 결과 재사용)
     redis_status = False
-    if redis_conn is not None:
-        try:
-            redis_status = redis_conn.ping()
-        except:
-            pass
-    
-    # OCR 엔진 확인
-    ocr_engine = OCREngine()
-    engine_status = {
-        "custom_model": hasattr(ocr_engine, 'engines') and 'custom_model' in ocr_engine.engines,
-        "tesseract": hasattr(ocr_engine, 'engines') and 'tesseract' in ocr_engine.engines,
-        "google_vision": hasattr(ocr_engine, 'engines') and 'google_vision' in ocr_engine.engines,
-        "azure_form": hasattr(ocr_engine, 'engines') and 'azure_form' in ocr_engine.engines
-    }
+    if aredis_conn is not None:
+        checked_at, redis_status = _last_redis_ping
+        now = time.monotonic()
+        if now - checked_at >= _REDIS_PING_TTL:
+            try:
+                redis_status = await aredis_conn.ping()
+            except Exception:
+                redis_status = False
+            _last_redis_ping = (now, redis_status)
+    
+    # OCR 엔진 확인 (앱 시작 시 확인한 결과 사용)
+    engine_status = getattr(request.app.state, "engine_status", None)
+    if engine_status is None:
+        from src.web.app import _detect_engine_status
+        engine_status = request.app.state.engine_status = _detect_engine_status()
     
     return {
         "status": "ok",
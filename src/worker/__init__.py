@@ -44,6 +44,7 @@ DEFAULT_WORKERS = 4
 # 편의성을 위한 주요 모듈/클래스 임포트
 from src.worker.tasks import (
     process_document,
+    process_stored_document,
     extract_data_from_document,
     export_data_to_csv,
     generate_pdf_report
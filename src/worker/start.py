@@ -7,11 +7,12 @@ OCR 작업자 프로세스 시작 스크립트
 
 import os
 import sys
+import time
 import logging
-import redis
-from rq import Worker, Queue, Connection
+from rq import SimpleWorker, Queue
 import signal
 import multiprocessing
+import multiprocessing.connection
 
 # 로깅 설정
 logging.basicConfig(
@@ -25,12 +26,16 @@ logger = logging.getLogger("ocr_worker")
 
 # 설정 로드
 from src.core.config import config
+from src.utils.serialization import JOB_SERIALIZER
 
 # Redis 연결 설정
 REDIS_URL = config.get('queue.redis_url', 'redis://localhost:6379/0')
 QUEUE_NAME = config.get('queue.queue_name', 'ocr_tasks')
 MAX_WORKERS = config.get('queue.max_workers', 4)
 
+# 비정상 종료된 작업자 재시작 대기 시간 (초, 즉시 반복 종료되는 경우 재시작 폭주 방지)
+RESTART_DELAY = config.get('queue.worker_restart_delay', 5)
+
 # 정상 종료 처리
 def handle_shutdown(signum, frame):
     """종료 시그널 처리"""
@@ -46,21 +51,42 @@ def start_worker(worker_id):
     signal.signal(signal.SIGTERM, handle_shutdown)
     
     try:
-        # Redis 연결
-        redis_conn = redis.Redis.from_url(REDIS_URL)
+        # 모델 등 무거운 처리 객체를 작업 전에 한 번만 로드
+        # (부모 프로세스에서 미리 로드한 객체와 TrOCR 가중치는 fork로 물려받아 그대로 사용)
+        from src.worker.tasks import preload_processors, redis_conn
+        preload_processors()
         
-        # 작업자 설정
-        with Connection(redis_conn):
-            worker = Worker([Queue(QUEUE_NAME)], name=f"worker-{worker_id}")
-            
-            # 작업자 시작
-            worker.work(with_scheduler=True)
+        # Redis 연결 (작업 함수와 같은 연결 풀 사용)
+        if redis_conn is None:
+            raise RuntimeError("Redis 연결을 사용할 수 없습니다.")
+        
+        # 작업자 설정 (작업마다 fork하지 않고 현재 프로세스에서 실행해 로드된 모델과 이벤트 루프 재사용)
+        queue = Queue(QUEUE_NAME, connection=redis_conn, serializer=JOB_SERIALIZER)
+        worker = SimpleWorker([queue], connection=redis_conn,
+                              name=f"worker-{worker_id}", serializer=JOB_SERIALIZER)
+        
+        # 작업자 시작 (스케줄러는 첫 번째 작업자만 실행)
+        worker.work(with_scheduler=(worker_id == 1))
     
     except Exception as e:
         logger.error(f"작업자 {worker_id} 오류: {e}")
     
     logger.info(f"작업자 {worker_id} 종료")
 
+def _spawn_worker(worker_id: int) -> multiprocessing.Process:
+    """
+    작업자 프로세스 생성 및 시작
+    
+    Args:
+        worker_id: 작업자 ID
+    
+    Returns:
+        시작된 프로세스
+    """
+    process = multiprocessing.Process(target=start_worker, args=(worker_id,))
+    process.start()
+    return process
+
 def main():
     """메인 함수"""
     logger.info(f"OCR 작업자 프로세스 시작 (작업자 수: {MAX_WORKERS})")
@@ -68,9 +94,9 @@ def main():
     logger.info(f"큐 이름: {QUEUE_NAME}")
     
     try:
-        # Redis 연결 테스트
-        redis_conn = redis.Redis.from_url(REDIS_URL)
-        if not redis_conn.ping():
+        # Redis 연결 테스트 (작업 함수와 같은 연결 풀 사용, fork 후에는 자식 프로세스에서 새 연결 생성)
+        from src.worker.tasks import redis_conn
+        if redis_conn is None or not redis_conn.ping():
             logger.error("Redis 연결 실패")
             return 1
         
@@ -78,17 +104,45 @@ def main():
         signal.signal(signal.SIGINT, handle_shutdown)
         signal.signal(signal.SIGTERM, handle_shutdown)
         
+        # fork에 안전한 처리 객체(TrOCR CPU 가중치 등)만 부모 프로세스에서 로드한 뒤 fork해
+        # 작업자 간 메모리 페이지 공유 (copy-on-write), 네트워크 클라이언트와 CUDA는 작업자에서 초기화
+        if 'fork' in multiprocessing.get_all_start_methods():
+            multiprocessing.set_start_method('fork', force=True)
+            
+            from src.worker.tasks import preload_fork_safe_processors
+            preload_fork_safe_processors()
+        
         # 다중 작업자 시작
-        processes = []
+        processes = {}
         
         for i in range(MAX_WORKERS):
-            process = multiprocessing.Process(target=start_worker, args=(i+1,))
-            processes.append(process)
-            process.start()
+            processes[i + 1] = _spawn_worker(i + 1)
+        
+        # 작업자 감시 (SimpleWorker는 작업을 작업자 프로세스에서 직접 실행하므로
+        # 네이티브 확장(OpenCV/torch) 오류로 비정상 종료되면 같은 ID로 다시 시작)
+        try:
+            while processes:
+                multiprocessing.connection.wait([process.sentinel for process in processes.values()])
+                
+                for worker_id, process in list(processes.items()):
+                    if process.is_alive():
+                        continue
+                    
+                    process.join()
+                    if process.exitcode == 0:
+                        # 정상 종료 (종료 시그널 등)
+                        del processes[worker_id]
+                        continue
+                    
+                    logger.error(f"작업자 {worker_id} 비정상 종료 (종료 코드: {process.exitcode}), "
+                                 f"{RESTART_DELAY}초 후 재시작")
+                    time.sleep(RESTART_DELAY)
+                    processes[worker_id] = _spawn_worker(worker_id)
         
-        # 작업자 프로세스 대기
-        for process in processes:
-            process.join()
+        finally:
+            # 종료 시그널 수신 시 남은 작업자의 정상 종료 대기
+            for process in processes.values():
+                process.join()
         
         return 0
     
@@ -8,16 +8,26 @@
 import io
 import os
 import json
+import math
 import time
+import queue
+import atexit
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional, Union
+import functools
+from collections import OrderedDict, defaultdict
+from typing import Dict, Any, List, Optional, Tuple, Union
 from PIL import Image
 import redis
+import redis.asyncio as aioredis
+from rq.job import Job, JobStatus
+from rq.results import Result
 
 from src.core.config import config
+from src.utils.serialization import JOB_SERIALIZER
 from src.document.pdf_processor import PDFProcessor
 from src.ocr.ensemble import OCREngine
+from src.ocr.engines.custom_model import preload_models as preload_trocr_models
 from src.ocr.preprocessor import Preprocessor, DocumentPreprocessor
 from src.ocr.postprocessor import PostProcessor
 from src.extraction.llm_processor import LLMProcessor
@@ -31,18 +41,435 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Redis 연결
+# Redis 연결 (작업자 프로세스의 RQ 작업자와 작업 함수가 공유하는 연결 풀)
 try:
-    redis_conn = redis.Redis.from_url(config.get('queue.redis_url', 'redis://localhost:6379/0'))
+    _redis_pool = redis.ConnectionPool.from_url(
+        config.get('queue.redis_url', 'redis://localhost:6379/0'),
+        max_connections=config.get('queue.worker_redis_max_connections', 16),
+        socket_keepalive=True,
+        health_check_interval=30
+    )
+    redis_conn = redis.Redis(connection_pool=_redis_pool)
     logger.info("Redis 연결 성공")
 except Exception as e:
     logger.error(f"Redis 연결 오류: {e}")
     redis_conn = None
 
 
-async def process_document_async(file_bytes: bytes, 
+# 무거운 처리 객체 (모델 로드 등) 는 프로세스당 한 번만 생성해 작업 간 재사용
+@functools.lru_cache(maxsize=1)
+def get_pdf_processor() -> PDFProcessor:
+    """공유 PDF 처리기 반환"""
+    return PDFProcessor()
+
+
+@functools.lru_cache(maxsize=1)
+def get_ocr_engine() -> OCREngine:
+    """공유 OCR 엔진 반환"""
+    return OCREngine()
+
+
+@functools.lru_cache(maxsize=1)
+def get_document_preprocessor() -> DocumentPreprocessor:
+    """공유 문서 전처리기 반환"""
+    return DocumentPreprocessor()
+
+
+@functools.lru_cache(maxsize=1)
+def get_post_processor() -> PostProcessor:
+    """공유 후처리기 반환"""
+    return PostProcessor()
+
+
+@functools.lru_cache(maxsize=1)
+def get_storage_manager() -> StorageManager:
+    """공유 스토리지 관리자 반환"""
+    return StorageManager()
+
+
+def preload_fork_safe_processors() -> None:
+    """
+    fork 전에 부모 프로세스에서 생성해도 안전한 처리 객체만 미리 생성 (작업자 간 copy-on-write 공유)
+    
+    OCR 엔진(gRPC 등 네트워크 클라이언트, CUDA 모델)과 스토리지 관리자는 fork 후 자식에서
+    사용할 수 없으므로 제외하고, TrOCR 가중치는 CPU에만 로드
+    """
+    get_pdf_processor()
+    get_document_preprocessor()
+    get_post_processor()
+    
+    if config.get('ocr.use_custom_model', True):
+        preload_trocr_models()
+    
+    logger.info("fork 전 공유 처리 객체 초기화 완료")
+
+
+def preload_processors() -> None:
+    """
+    처리 객체 미리 생성 (작업자 시작 시 호출해 첫 작업에서 모델을 로드하지 않도록 함)
+    """
+    get_pdf_processor()
+    get_ocr_engine()
+    get_document_preprocessor()
+    get_post_processor()
+    get_storage_manager()
+    logger.info("처리 객체 초기화 완료")
+
+
+# 처리 가능한 이미지 파일 확장자
+_IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".tiff", ".tif", ".bmp", ".gif"})
+
+# JPEG 인코딩 버퍼 풀 (페이지마다 새 버퍼를 만들고 키우는 대신 재사용)
+_ENCODE_BUFFER_POOL_SIZE = 8
+_encode_buffers: "queue.SimpleQueue[io.BytesIO]" = queue.SimpleQueue()
+
+
+def _encode_jpeg(image: Image.Image, quality: int = 80) -> bytes:
+    """
+    이미지를 JPEG 바이트로 인코딩 (PIL 인코더는 GIL을 해제하므로 스레드에서 병렬 실행 가능)
+    
+    Args:
+        image: PIL 이미지
+        quality: JPEG 품질
+    
+    Returns:
+        JPEG 바이트
+    """
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    
+    try:
+        buffer = _encode_buffers.get_nowait()
+    except queue.Empty:
+        buffer = io.BytesIO()
+    
+    try:
+        # 기존 할당 크기를 유지하도록 truncate 없이 처음부터 덮어쓰고, 쓴 길이만큼만 복사
+        buffer.seek(0)
+        image.save(buffer, format="JPEG", quality=quality)
+        size = buffer.tell()
+        with buffer.getbuffer() as view:
+            return bytes(view[:size])
+    finally:
+        if _encode_buffers.qsize() < _ENCODE_BUFFER_POOL_SIZE:
+            _encode_buffers.put(buffer)
+
+
+# 작업자 프로세스별 이벤트 루프 (작업마다 새로 만들지 않고 재사용)
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_pid: Optional[int] = None
+
+
+def _cancel_pending_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    루프에 남은 작업 취소 및 정리 (다음 작업 실행 중에 이전 작업의 태스크가 재개되지 않도록)
+    
+    Args:
+        loop: 이벤트 루프
+    """
+    pending = [task for task in asyncio.all_tasks(loop) if not task.done()]
+    if not pending:
+        return
+    
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    logger.warning(f"이전 작업의 미완료 태스크 {len(pending)}개 취소")
+
+
+def _run_async(coro) -> Any:
+    """
+    작업자 프로세스의 공유 이벤트 루프에서 코루틴 실행
+    
+    작업 시간 초과(JobTimeoutException) 등으로 실행이 중단되면 해당 작업이 만든 태스크를
+    모두 취소한 뒤 반환하므로, 루프를 재사용해도 작업 간 상태가 섞이지 않음
+    
+    Args:
+        coro: 실행할 코루틴
+    
+    Returns:
+        코루틴 실행 결과
+    """
+    global _loop, _loop_pid
+    
+    # fork된 작업자 프로세스는 부모의 루프를 물려받지 않고 자체 루프 생성
+    if _loop is None or _loop.is_closed() or _loop_pid != os.getpid():
+        _loop = asyncio.new_event_loop()
+        _loop_pid = os.getpid()
+        asyncio.set_event_loop(_loop)
+        atexit.register(_loop.close)
+    
+    try:
+        return _loop.run_until_complete(coro)
+    finally:
+        _cancel_pending_tasks(_loop)
+
+
+# 비동기 작업에서 사용하는 Redis 클라이언트 (이벤트 루프에 묶이므로 루프별로 생성)
+_async_redis: Optional[aioredis.Redis] = None
+_async_redis_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_async_redis() -> aioredis.Redis:
+    """
+    현재 이벤트 루프용 비동기 Redis 클라이언트 반환 (작업자 루프를 재사용하므로 보통 프로세스당 하나)
+    
+    Returns:
+        비동기 Redis 클라이언트
+    """
+    global _async_redis, _async_redis_loop
+    
+    loop = asyncio.get_running_loop()
+    if _async_redis is None or _async_redis_loop is not loop:
+        _async_redis = aioredis.Redis.from_url(
+            config.get('queue.redis_url', 'redis://localhost:6379/0'),
+            max_connections=config.get('queue.worker_redis_max_connections', 16),
+            socket_keepalive=True,
+            health_check_interval=30
+        )
+        _async_redis_loop = loop
+    
+    return _async_redis
+
+
+# 완료된 작업 결과 캐시 (완료 결과는 바뀌지 않으므로 같은 작업을 참조하는 후속 작업은 Redis 조회 생략,
+# 작업 함수는 작업자 프로세스의 단일 이벤트 루프에서만 실행되므로 잠금 불필요)
+_FINISHED_RESULT_CACHE_SIZE = 256
+_FINISHED_RESULT_CACHE_TTL = 60  # 초
+_finished_results: OrderedDict = OrderedDict()
+
+
+def _get_cached_result(task_id: str) -> Tuple[bool, Any]:
+    """
+    캐시된 완료 작업 결과 조회
+    
+    Args:
+        task_id: 작업 ID
+    
+    Returns:
+        (캐시 적중 여부, 결과) 튜플
+    """
+    entry = _finished_results.get(task_id)
+    if entry is None:
+        return False, None
+    
+    expires_at, result = entry
+    if expires_at < time.monotonic():
+        del _finished_results[task_id]
+        return False, None
+    
+    _finished_results.move_to_end(task_id)
+    return True, result
+
+
+def _without_image_data(result: Any) -> Any:
+    """
+    페이지 이미지 데이터를 뺀 작업 결과 반환 (원본은 수정하지 않음)
+    
+    Args:
+        result: 작업 결과
+    
+    Returns:
+        페이지별 image_data가 제거된 결과 (제거할 것이 없으면 원본)
+    """
+    if not isinstance(result, dict) or not isinstance(result.get("pages"), list):
+        return result
+    if not any(isinstance(page, dict) and "image_data" in page for page in result["pages"]):
+        return result
+    
+    stripped = dict(result)
+    stripped["pages"] = [
+        {key: value for key, value in page.items() if key != "image_data"} if isinstance(page, dict) else page
+        for page in result["pages"]
+    ]
+    return stripped
+
+
+def _put_cached_result(task_id: str, result: Any) -> None:
+    """
+    완료 작업 결과 캐시 저장 (가장 오래 사용하지 않은 항목부터 제거)
+    
+    후속 작업(데이터 추출, 보고서, CSV)은 페이지 이미지를 사용하지 않으므로
+    항목 크기를 제한하기 위해 image_data는 저장하지 않음
+    
+    Args:
+        task_id: 작업 ID
+        result: 작업 결과
+    """
+    result = _without_image_data(result)
+    _finished_results[task_id] = (time.monotonic() + _FINISHED_RESULT_CACHE_TTL, result)
+    _finished_results.move_to_end(task_id)
+    while len(_finished_results) > _FINISHED_RESULT_CACHE_SIZE:
+        _finished_results.popitem(last=False)
+
+
+async def _fetch_job_results(task_ids: List[str]) -> Dict[str, Tuple[str, Any]]:
+    """
+    작업 상태와 결과를 일괄 조회 (작업 해시와 결과 스트림을 각각 한 번의 비동기 파이프라인으로 조회,
+    캐시된 완료 결과는 Redis를 조회하지 않음)
+    
+    Args:
+        task_ids: 작업 ID 목록
+    
+    Returns:
+        작업 ID -> (작업 상태, 결과) (존재하는 작업만 포함, 완료되지 않은 작업의 결과는 None,
+        완료 결과의 페이지 image_data는 제외)
+    """
+    states = {}
+    missing_ids = []
+    for task_id in task_ids:
+        hit, result = _get_cached_result(task_id)
+        if hit:
+            states[task_id] = (JobStatus.FINISHED, result)
+        else:
+            missing_ids.append(task_id)
+    
+    if not missing_ids:
+        return states
+    
+    aredis = _get_async_redis()
+    
+    # 작업 해시 일괄 조회 (이벤트 루프를 막지 않도록 비동기 클라이언트 사용)
+    async with aredis.pipeline(transaction=False) as pipe:
+        for task_id in missing_ids:
+            pipe.hgetall(Job.key_for(task_id))
+        raw_jobs = await pipe.execute()
+    
+    finished_jobs = []
+    for task_id, raw_job in zip(missing_ids, raw_jobs):
+        if not raw_job:
+            logger.warning(f"작업 조회 오류 ({task_id}): 작업을 찾을 수 없습니다.")
+            continue
+        
+        job = Job(task_id, connection=redis_conn, serializer=JOB_SERIALIZER)
+        job.restore(raw_job)
+        
+        job_status = job.get_status(refresh=False)
+        states[task_id] = (job_status, None)
+        if job_status == JobStatus.FINISHED:
+            finished_jobs.append(job)
+    
+    # 최신 결과 일괄 조회
+    async with aredis.pipeline(transaction=False) as pipe:
+        for job in finished_jobs:
+            pipe.xrevrange(Result.get_key(job.id), '+', '-', count=1)
+        entries_list = await pipe.execute() if finished_jobs else []
+    
+    for job, entries in zip(finished_jobs, entries_list):
+        result = None
+        if entries:
+            result_id, payload = entries[0]
+            latest = Result.restore(job.id, result_id.decode(), payload,
+                                    connection=redis_conn, serializer=job.serializer)
+            if latest.type == Result.Type.SUCCESSFUL:
+                result = latest.return_value
+        else:
+            # 결과 스트림이 없으면 작업 해시의 결과 사용 (이전 형식)
+            result = job.result
+        # 캐시 적중 여부와 관계없이 같은 형태의 결과 반환
+        result = _without_image_data(result)
+        states[job.id] = (JobStatus.FINISHED, result)
+        _put_cached_result(job.id, result)
+    
+    return states
+
+
+def _require_finished_ocr_result(job_results: Dict[str, Tuple[str, Any]], ocr_task_id: str) -> Any:
+    """
+    조회한 작업 상태에서 완료된 OCR 작업 결과 확인
+    
+    Args:
+        job_results: _fetch_job_results 조회 결과
+        ocr_task_id: OCR 작업 ID
+    
+    Returns:
+        OCR 결과
+    
+    Raises:
+        ValueError: 작업이 없거나 완료되지 않은 경우
+    """
+    if ocr_task_id not in job_results:
+        raise ValueError(f"OCR 작업을 찾을 수 없습니다: {ocr_task_id}")
+    
+    job_status, ocr_result = job_results[ocr_task_id]
+    if job_status != JobStatus.FINISHED:
+        raise ValueError("OCR 작업이 아직 완료되지 않았습니다.")
+    
+    return ocr_result
+
+
+async def _load_finished_job(ocr_task_id: str) -> Any:
+    """
+    완료된 OCR 작업 결과 조회
+    
+    Args:
+        ocr_task_id: OCR 작업 ID
+    
+    Returns:
+        OCR 결과
+    
+    Raises:
+        ValueError: 작업이 없거나 완료되지 않은 경우
+    """
+    job_results = await _fetch_job_results([ocr_task_id])
+    return _require_finished_ocr_result(job_results, ocr_task_id)
+
+
+def _load_pages(pdf_processor: PDFProcessor,
+                file_bytes: Union[bytes, memoryview],
+                file_ext: str,
+                check_orientation: bool) -> List[Dict[str, Any]]:
+    """
+    문서를 페이지 이미지 목록으로 변환 (PDF와 이미지 파일을 같은 페이지 처리 경로로 처리)
+    
+    Args:
+        pdf_processor: PDF 처리기
+        file_bytes: 파일 바이트
+        file_ext: 파일 확장자
+        check_orientation: PDF 페이지 방향 보정 여부
+    
+    Returns:
+        페이지 정보 목록 (page_num, image, orientation)
+    """
+    if file_ext == ".pdf":
+        # PDF를 이미지로 변환 및 방향 보정
+        page_results = pdf_processor.convert_to_images(
+            file_bytes, 
+            check_orientation=check_orientation
+        )
+        if not page_results:
+            raise ValueError("PDF 변환 실패")
+        return page_results
+    
+    if file_ext in _IMAGE_EXTENSIONS:
+        image = Image.open(io.BytesIO(file_bytes))
+        
+        # 큰 JPEG는 디코딩 단계에서 축소 (libjpeg DCT 스케일링, 최대 크기 이상은 유지)
+        max_size = pdf_processor.image_max_size
+        resized = False
+        if image.format == "JPEG" and max(image.size) > max_size:
+            scale = max_size / max(image.size)
+            resized = image.draft(image.mode, (math.ceil(image.width * scale), math.ceil(image.height * scale))) is not None
+        
+        page = {
+            "page_num": 1,
+            "image": image,
+            "orientation": 0  # 기본값
+        }
+        
+        # 원본 그대로인 JPEG는 반환 이미지로 다시 인코딩하지 않고 업로드된 바이트를 사용
+        if image.format == "JPEG" and not resized:
+            page["source_jpeg"] = file_bytes
+        
+        return [page]
+    
+    raise ValueError(f"지원하지 않는 파일 형식: {file_ext}")
+
+
+async def process_document_async(file_bytes: Union[bytes, memoryview], 
                                 file_name: str, 
-                                options: Dict[str, Any]) -> Dict[str, Any]:
+                                options: Dict[str, Any],
+                                file_path: Optional[str] = None) -> Dict[str, Any]:
     """
     문서 처리 작업 (비동기 버전)
     
@@ -50,6 +477,7 @@ async def process_document_async(file_bytes: bytes,
         file_bytes: 파일 바이트
         file_name: 파일 이름
         options: 처리 옵션
+        file_path: 이미 저장된 파일의 스토리지 경로 (지정 시 저장 생략)
     
     Returns:
         처리 결과
@@ -64,18 +492,22 @@ async def process_document_async(file_bytes: bytes,
         return_images = options.get('return_images', False)
         check_orientation = options.get('check_orientation', True)
         
+        # 페이지 처리 중 반복해서 참조하는 설정은 작업 시작 시 한 번만 조회
+        debug_mode = config.get('app.debug', False)
+        
         # 파일 확장자 확인
         file_ext = os.path.splitext(file_name)[1].lower()
         
-        # 필요한 컴포넌트 초기화
-        pdf_processor = PDFProcessor()
-        ocr_engine = OCREngine()
-        doc_preprocessor = DocumentPreprocessor()
-        post_processor = PostProcessor()
-        storage_manager = StorageManager()
+        # 필요한 컴포넌트 (프로세스 단위로 재사용)
+        pdf_processor = get_pdf_processor()
+        ocr_engine = get_ocr_engine()
+        doc_preprocessor = get_document_preprocessor()
+        post_processor = get_post_processor()
+        storage_manager = get_storage_manager()
         
-        # 파일 저장
-        file_path = await storage_manager.save_file(file_bytes, file_name)
+        # 파일 저장 (웹에서 이미 저장한 경우 생략)
+        if file_path is None:
+            file_path = await storage_manager.save_file(file_bytes, file_name)
         
         # 처리 결과
         result = {
@@ -86,40 +518,39 @@ async def process_document_async(file_bytes: bytes,
             "pages": []
         }
         
-        # PDF 처리
-        if file_ext == ".pdf":
-            logger.info(f"PDF 문서 처리 시작: {file_name}")
-            
-            # PDF를 이미지로 변환 및 방향 보정
-            page_results = pdf_processor.convert_to_images(
-                file_bytes, 
-                check_orientation=check_orientation
-            )
-            
-            if not page_results:
-                raise ValueError("PDF 변환 실패")
+        # 페이지 이미지 준비 (PDF는 페이지별 이미지로 변환, 이미지 파일은 단일 페이지)
+        page_results = _load_pages(pdf_processor, file_bytes, file_ext, check_orientation)
+        logger.info(f"{'PDF' if file_ext == '.pdf' else '이미지'} 문서 처리 시작: {file_name}")
+        
+        # 페이지 동시 처리 수 제한
+        semaphore = asyncio.Semaphore(config.get('ocr.page_concurrency', 4))
+        
+        async def _process_page(page_result: Dict[str, Any], page_language: Optional[str]) -> Dict[str, Any]:
+            """
+            페이지 하나를 전처리, OCR, 후처리
             
-            # 각 페이지 처리
-            for page_result in page_results:
+            Args:
+                page_result: 페이지 정보 (page_num, image, orientation)
+                page_language: 문서 언어 (None이면 자동 감지)
+                
+            Returns:
+                페이지 결과
+            """
+            async with semaphore:
                 page_num = page_result['page_num']
                 image = page_result['image']
-                orientation = page_result['orientation']
                 
-                logger.info(f"PDF 페이지 {page_num}/{len(page_results)} 처리 중")
+                logger.info(f"페이지 {page_num}/{len(page_results)} 처리 중")
                 
-                # 이미지 전처리
-                doc_info = doc_preprocessor.process_document(image, language)
+                # 이미지 전처리 (CPU 작업이므로 스레드에서 실행해 다른 페이지의 OCR 대기와 겹치게 함)
+                doc_info = await asyncio.to_thread(doc_preprocessor.process_document, image, page_language)
                 processed_image = doc_info['processed_image']
                 
                 # OCR 텍스트 인식
-                ocr_result = await ocr_engine.recognize_text(processed_image, language, use_cache)
-                
-                # 후처리
-                processed_result = post_processor.process(ocr_result)
+                ocr_result = await ocr_engine.recognize_text(processed_image, page_language, use_cache)
                 
-                # 언어 정보 (자동 감지된 경우)
-                if language is None and 'language' in processed_result:
-                    language = processed_result['language']
+                # 후처리 (스레드에서 실행)
+                processed_result = await asyncio.to_thread(post_processor.process, ocr_result)
                 
                 # 페이지 결과 저장
                 page_info = {
@@ -127,11 +558,11 @@ async def process_document_async(file_bytes: bytes,
                     "text": processed_result["text"],
                     "language": processed_result["language"],
                     "confidence": processed_result["confidence"],
-                    "orientation": orientation
+                    "orientation": page_result['orientation']
                 }
                 
                 # 문서 분석 정보 포함
-                if doc_info['has_special_items']:
+                if doc_info['has_stamps'] or doc_info['has_handwriting'] or doc_info['has_table'] or doc_info['has_strikethrough']:
                     page_info["special_items"] = {
                         "has_stamps": doc_info['has_stamps'],
                         "has_handwriting": doc_info['has_handwriting'],
@@ -140,117 +571,66 @@ async def process_document_async(file_bytes: bytes,
                         "regions": doc_info['regions']
                     }
                 
-                # 엔티티 추출 (요청된 경우)
-                if extract_entities:
-                    entities = post_processor.extract_business_entities(
+                # 엔티티 추출 (요청된 경우, 텍스트가 없는 빈 페이지는 건너뜀)
+                if extract_entities and processed_result["text"].strip():
+                    entities = await asyncio.to_thread(
+                        post_processor.extract_business_entities,
                         processed_result["text"], 
                         processed_result["language"]
                     )
                     if entities:
                         page_info["entities"] = entities
                 
-                # 이미지 데이터 포함 (요청된 경우)
+                # 이미지 데이터 포함 (요청된 경우, 인코딩은 스레드에서 진행)
                 if return_images:
-                    buffer = io.BytesIO()
-                    image.save(buffer, format="JPEG", quality=80)
-                    page_info["image_data"] = buffer.getvalue()
+                    if "source_jpeg" in page_result:
+                        page_info["image_data"] = bytes(page_result["source_jpeg"])
+                    else:
+                        page_info["image_data"] = await asyncio.to_thread(_encode_jpeg, image)
                 
                 # 디버깅용 엔진별 결과 포함
-                if config.get('app.debug', False) and "engine_results" in processed_result:
+                if debug_mode and "engine_results" in processed_result:
                     page_info["engine_results"] = processed_result["engine_results"]
                 
-                result["pages"].append(page_info)
-            
-        # 이미지 파일 처리
-        elif file_ext in [".jpg", ".jpeg", ".png", ".tiff", ".tif", ".bmp", ".gif"]:
-            logger.info(f"이미지 문서 처리 시작: {file_name}")
-            
-            # 이미지 불러오기
-            image = Image.open(io.BytesIO(file_bytes))
-            
-            # 문서 전처리
-            doc_info = doc_preprocessor.process_document(image, language)
-            processed_image = doc_info['processed_image']
-            
-            # OCR 텍스트 인식
-            ocr_result = await ocr_engine.recognize_text(processed_image, language, use_cache)
-            
-            # 후처리
-            processed_result = post_processor.process(ocr_result)
-            
-            # 언어 정보 (자동 감지된 경우)
-            if language is None and 'language' in processed_result:
-                language = processed_result['language']
-            
-            # 결과 저장
-            page_info = {
-                "page_num": 1,
-                "text": processed_result["text"],
-                "language": processed_result["language"],
-                "confidence": processed_result["confidence"],
-                "orientation": 0  # 기본값
-            }
-            
-            # 문서 분석 정보 포함
-            if doc_info['has_stamps'] or doc_info['has_handwriting'] or doc_info['has_table'] or doc_info['has_strikethrough']:
-                page_info["special_items"] = {
-                    "has_stamps": doc_info['has_stamps'],
-                    "has_handwriting": doc_info['has_handwriting'],
-                    "has_table": doc_info['has_table'],
-                    "has_strikethrough": doc_info['has_strikethrough'],
-                    "regions": doc_info['regions']
-                }
-            
-            # 엔티티 추출 (요청된 경우)
-            if extract_entities:
-                entities = post_processor.extract_business_entities(
-                    processed_result["text"], 
-                    processed_result["language"]
-                )
-                if entities:
-                    page_info["entities"] = entities
-            
-            # 이미지 데이터 포함 (요청된 경우)
-            if return_images:
-                buffer = io.BytesIO()
-                image.save(buffer, format="JPEG", quality=80)
-                page_info["image_data"] = buffer.getvalue()
-            
-            # 디버깅용 엔진별 결과 포함
-            if config.get('app.debug', False) and "engine_results" in processed_result:
-                page_info["engine_results"] = processed_result["engine_results"]
-            
-            result["pages"].append(page_info)
+                return page_info
         
-        else:
-            raise ValueError(f"지원하지 않는 파일 형식: {file_ext}")
+        # 언어 자동 감지가 필요하면 첫 페이지 결과로 언어를 확정한 뒤 나머지 페이지 처리
+        remaining_pages = page_results
+        if language is None:
+            first_page = await _process_page(page_results[0], None)
+            language = first_page.get("language")
+            result["pages"].append(first_page)
+            remaining_pages = page_results[1:]
+        
+        # 나머지 페이지 동시 처리 (페이지 순서 유지)
+        result["pages"].extend(await asyncio.gather(
+            *(_process_page(page_result, language) for page_result in remaining_pages)
+        ))
         
         # 결과 정리
         if result["pages"]:
-            # 전체 텍스트 및 신뢰도 계산
-            all_text = "\n\n".join([page["text"] for page in result["pages"]])
-            avg_confidence = sum([page["confidence"] for page in result["pages"]]) / len(result["pages"])
+            # 전체 텍스트, 신뢰도, 엔티티를 한 번의 순회로 집계
+            text_parts = []
+            total_confidence = 0.0
+            # 유형별 집합으로 모아 중복 제거
+            all_entities = defaultdict(set)
             
-            result["text"] = all_text
-            result["confidence"] = avg_confidence
+            for page in result["pages"]:
+                text_parts.append(page["text"])
+                total_confidence += page["confidence"]
+                if extract_entities and "entities" in page:
+                    for entity_type, entities in page["entities"].items():
+                        all_entities[entity_type].update(entities)
+            
+            result["text"] = "\n\n".join(text_parts)
+            result["confidence"] = total_confidence / len(result["pages"])
             result["language"] = result["pages"][0]["language"]
             
-            # 문서 전체 엔티티 추출
+            # 문서 전체 엔티티
             if extract_entities:
-                all_entities = {}
-                
-                for page in result["pages"]:
-                    if "entities" in page:
-                        for entity_type, entities in page["entities"].items():
-                            if entity_type not in all_entities:
-                                all_entities[entity_type] = []
-                            all_entities[entity_type].extend(entities)
-                
-                # 중복 제거
-                for entity_type in all_entities:
-                    all_entities[entity_type] = list(set(all_entities[entity_type]))
-                
-                result["entities"] = all_entities
+                result["entities"] = {
+                    entity_type: list(entities) for entity_type, entities in all_entities.items()
+                }
         
         # 처리 시간 업데이트
         result["process_time"] = time.time() - start_time
@@ -280,13 +660,52 @@ def process_document(file_bytes: bytes,
     Returns:
         처리 결과
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    return _run_async(process_document_async(file_bytes, file_name, options))
+
+
+async def process_stored_document_async(file_path: str, 
+                                      file_name: str, 
+                                      options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    스토리지에 저장된 문서 처리 작업 (비동기 버전)
+    
+    Args:
+        file_path: 스토리지 내 파일 경로
+        file_name: 파일 이름
+        options: 처리 옵션
+    
+    Returns:
+        처리 결과
+    """
     try:
-        result = loop.run_until_complete(process_document_async(file_bytes, file_name, options))
-        return result
-    finally:
-        loop.close()
+        # 큰 로컬 파일은 메모리 매핑으로 복사 없이 조회
+        file_bytes = await get_storage_manager().get_file_view(file_path)
+    except Exception as e:
+        logger.error(f"저장된 문서 조회 오류: {e}")
+        return {
+            "error": f"파일을 찾을 수 없습니다: {file_path}",
+            "file_name": file_name,
+            "process_time": 0
+        }
+    
+    return await process_document_async(file_bytes, file_name, options, file_path=file_path)
+
+
+def process_stored_document(file_path: str, 
+                            file_name: str, 
+                            options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    스토리지에 저장된 문서 처리 작업 (동기 래퍼)
+    
+    Args:
+        file_path: 스토리지 내 파일 경로
+        file_name: 파일 이름
+        options: 처리 옵션
+    
+    Returns:
+        처리 결과
+    """
+    return _run_async(process_stored_document_async(file_path, file_name, options))
 
 
 async def extract_data_from_document_async(ocr_task_id: str, 
@@ -308,20 +727,8 @@ async def extract_data_from_document_async(ocr_task_id: str,
         if redis_conn is None:
             raise ValueError("Redis 연결을 사용할 수 없습니다.")
         
-        # 작업 조회
-        from rq.job import Job
-        
-        try:
-            ocr_job = Job.fetch(ocr_task_id, connection=redis_conn)
-        except Exception as e:
-            raise ValueError(f"OCR 작업을 찾을 수 없습니다: {ocr_task_id}")
-        
-        # OCR 작업 완료 확인
-        if not ocr_job.is_finished:
-            raise ValueError("OCR 작업이 아직 완료되지 않았습니다.")
-        
-        # OCR 결과 가져오기
-        ocr_result = ocr_job.result
+        # 완료된 OCR 작업 결과 조회
+        ocr_result = await _load_finished_job(ocr_task_id)
         
         if not ocr_result or "text" not in ocr_result:
             raise ValueError("유효한 OCR 결과가 없습니다.")
@@ -371,13 +778,7 @@ def extract_data_from_document(ocr_task_id: str,
     Returns:
         추출 결과
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        result = loop.run_until_complete(extract_data_from_document_async(ocr_task_id, options))
-        return result
-    finally:
-        loop.close()
+    return _run_async(extract_data_from_document_async(ocr_task_id, options))
 
 
 async def generate_pdf_report_async(ocr_task_id: str, 
@@ -399,32 +800,17 @@ async def generate_pdf_report_async(ocr_task_id: str,
         if redis_conn is None:
             raise ValueError("Redis 연결을 사용할 수 없습니다.")
         
-        # OCR 작업 조회
-        from rq.job import Job
-        
-        try:
-            ocr_job = Job.fetch(ocr_task_id, connection=redis_conn)
-        except Exception as e:
-            raise ValueError(f"OCR 작업을 찾을 수 없습니다: {ocr_task_id}")
+        # OCR 작업 및 추출 작업(있는 경우)을 함께 조회
+        task_ids = [ocr_task_id, extraction_task_id] if extraction_task_id else [ocr_task_id]
+        job_results = await _fetch_job_results(task_ids)
         
         # OCR 작업 완료 확인
-        if not ocr_job.is_finished:
-            raise ValueError("OCR 작업이 아직 완료되지 않았습니다.")
-        
-        # OCR 결과 가져오기
-        ocr_result = ocr_job.result
+        ocr_result = _require_finished_ocr_result(job_results, ocr_task_id)
         
-        # 추출 작업 결과 (있는 경우)
+        # 추출 작업 결과 (있는 경우, 완료되지 않았으면 None)
         extraction_result = None
-        
         if extraction_task_id:
-            try:
-                extraction_job = Job.fetch(extraction_task_id, connection=redis_conn)
-                
-                if extraction_job.is_finished:
-                    extraction_result = extraction_job.result
-            except Exception as e:
-                logger.warning(f"추출 작업 조회 오류: {e}")
+            _, extraction_result = job_results.get(extraction_task_id, (None, None))
         
         # TODO: PDF 보고서 생성 로직 구현
         # 실제 구현 시 reportlab, FPDF 또는 다른 PDF 생성 라이브러리 사용
@@ -461,13 +847,7 @@ def generate_pdf_report(ocr_task_id: str,
     Returns:
         보고서 생성 결과
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        result = loop.run_until_complete(generate_pdf_report_async(ocr_task_id, extraction_task_id))
-        return result
-    finally:
-        loop.close()
+    return _run_async(generate_pdf_report_async(ocr_task_id, extraction_task_id))
 
 
 async def export_data_to_csv_async(task_ids: List[str], 
@@ -489,22 +869,14 @@ async def export_data_to_csv_async(task_ids: List[str],
         if redis_conn is None:
             raise ValueError("Redis 연결을 사용할 수 없습니다.")
         
-        # 작업 조회
-        from rq.job import Job
+        # 추출 결과 수집 (작업 수와 관계없이 Redis 왕복 2회)
+        job_results = await _fetch_job_results(task_ids)
         
-        # 추출 결과 수집
         extraction_results = []
-        
         for task_id in task_ids:
-            try:
-                job = Job.fetch(task_id, connection=redis_conn)
-                
-                if job.is_finished:
-                    result = job.result
-                    if result and "fields" in result:
-                        extraction_results.append(result)
-            except Exception as e:
-                logger.warning(f"작업 조회 오류 ({task_id}): {e}")
+            _, result = job_results.get(task_id, (None, None))
+            if result and "fields" in result:
+                extraction_results.append(result)
         
         if not extraction_results:
             raise ValueError("내보낼 추출 결과가 없습니다.")
@@ -559,10 +931,4 @@ def export_data_to_csv(task_ids: List[str],
     Returns:
         CSV 내보내기 결과
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        result = loop.run_until_complete(export_data_to_csv_async(task_ids, options))
-        return result
-    finally:
-        loop.close()
+    return _run_async(export_data_to_csv_async(task_ids, options))
@@ -0,0 +1,32 @@
+"""
+공용 테스트 픽스처 모듈
+- 테스트 이미지 픽스처
+- 실제 외부 API를 호출하는 테스트(live 마커) 제어
+"""
+
+import os
+import pytest
+
+from tests.helpers import create_test_image
+
+
+@pytest.fixture(scope="session")
+def test_image():
+    """테스트 이미지 픽스처 (읽기 전용, 세션 동안 한 번만 생성)"""
+    return create_test_image()
+
+
+def pytest_configure(config):
+    """사용자 정의 마커 등록"""
+    config.addinivalue_line("markers", "live: 실제 LLM API를 호출하는 테스트 (RUN_LIVE_TESTS=1 설정 시 실행)")
+
+
+def pytest_collection_modifyitems(config, items):
+    """RUN_LIVE_TESTS가 설정되지 않으면 live 테스트 건너뜀"""
+    if os.environ.get('RUN_LIVE_TESTS'):
+        return
+    
+    skip_live = pytest.mark.skip(reason="실제 API 호출 테스트 (RUN_LIVE_TESTS=1 설정 시 실행)")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
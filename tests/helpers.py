@@ -0,0 +1,36 @@
+"""
+테스트 헬퍼 모듈
+- 테스트 이미지 생성
+"""
+
+import functools
+from PIL import Image, ImageDraw, ImageFont
+
+
+# 테스트용 폰트 (이미지마다 폰트 파일을 다시 열지 않도록 캐시)
+@functools.lru_cache(maxsize=4)
+def _get_font(size=24):
+    """테스트용 폰트 로드 (시스템 기본 폰트)"""
+    try:
+        return ImageFont.truetype("Arial", size)
+    except IOError:
+        return ImageFont.load_default()
+
+
+# 테스트용 고정 이미지 생성 함수
+def create_test_image(text="테스트", size=(300, 100), bg_color=(255, 255, 255), text_color=(0, 0, 0)):
+    """테스트용 이미지 생성"""
+    image = Image.new('RGB', size, color=bg_color)
+    draw = ImageDraw.Draw(image)
+    
+    # 텍스트 쓰기 (시스템 기본 폰트)
+    font = _get_font(24)
+    
+    # 텍스트 중앙 정렬
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    position = ((size[0] - (right - left)) / 2, (size[1] - (bottom - top)) / 2)
+    
+    # 텍스트 그리기
+    draw.text(position, text, font=font, fill=text_color)
+    
+    return image
@@ -8,7 +8,7 @@ import os
 import json
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
 # 메인 애플리케이션 로드
 from main import app
@@ -127,6 +127,30 @@ class TestAPI:
         assert response.json()["task_id"] == "test-job-id"
         assert response.json()["status"] == "processing"
     
+    def test_ocr_batch_cleanup_on_enqueue_error(self):
+        """OCR 일괄 API 큐 추가 실패 시 저장 파일 정리 테스트"""
+        storage_manager = MagicMock()
+        storage_manager.save_file_stream = AsyncMock(side_effect=["uploads/a.pdf", "uploads/b.png"])
+        storage_manager.delete_file = AsyncMock(return_value=True)
+        mock_queue = MagicMock()
+        mock_queue.enqueue_many.side_effect = RuntimeError("redis down")
+        
+        with patch('src.api.routes.queue', mock_queue), \
+             patch('src.api.routes._get_storage_manager', return_value=storage_manager):
+            response = client.post(
+                "/api/v1/ocr/batch",
+                files=[
+                    ("files", ("a.pdf", b"%PDF-1.4", "application/pdf")),
+                    ("files", ("b.png", b"png", "image/png"))
+                ],
+                data={"options": "{}"}
+            )
+        
+        # 응답 검증 (작업으로 이어지지 못한 파일은 모두 삭제)
+        assert response.status_code == 500
+        deleted = sorted(call.args[0] for call in storage_manager.delete_file.await_args_list)
+        assert deleted == ["uploads/a.pdf", "uploads/b.png"]
+    
     @patch('rq.job.Job.fetch')
     def test_get_ocr_result_processing(self, mock_job_fetch, mock_redis):
         """OCR 결과 조회 API 처리 중 테스트"""
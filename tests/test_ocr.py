@@ -10,31 +10,37 @@ import json
 import pytest
 import asyncio
 from unittest.mock import patch, MagicMock
-from PIL import Image
+from PIL import Image, ImageDraw
 import numpy as np
+import cv2
 import io
 
 # 테스트 대상 모듈 임포트
 from src.ocr.ensemble import OCREngine
 from src.ocr.engines.base import BaseOCREngine
-from src.ocr.preprocessor import Preprocessor
+from src.ocr.preprocessor import Preprocessor, DocumentPreprocessor, _compute_red_mask
 from src.ocr.postprocessor import PostProcessor
 from src.ocr.special_handlers import SpecialItemDetector
+from tests.helpers import create_test_image
 
 
 # 테스트용 더미 OCR 엔진 클래스
 class DummyOCREngine(BaseOCREngine):
     """테스트용 더미 OCR 엔진"""
     
-    def __init__(self, result_text="테스트 텍스트", confidence=0.9, language="kor"):
+    def __init__(self, result_text="테스트 텍스트", confidence=0.9, language="kor", delay=0.0):
         super().__init__()
         self.name = "dummy_engine"
         self.result_text = result_text
         self.result_confidence = confidence
         self.result_language = language
+        self.delay = delay
+        self.completed = 0
     
     async def recognize(self, image, lang=None):
         """더미 인식 결과 반환"""
+        await asyncio.sleep(self.delay)
+        self.completed += 1
         return self.format_result(
             self.result_text, 
             self.result_language, 
@@ -42,38 +48,10 @@ class DummyOCREngine(BaseOCREngine):
         )
 
 
-# 테스트용 고정 이미지 생성 함수
-def create_test_image(text="테스트", size=(300, 100), bg_color=(255, 255, 255), text_color=(0, 0, 0)):
-    """테스트용 이미지 생성"""
-    from PIL import Image, ImageDraw, ImageFont
-    image = Image.new('RGB', size, color=bg_color)
-    draw = ImageDraw.Draw(image)
-    
-    # 텍스트 쓰기 (시스템 기본 폰트)
-    try:
-        font = ImageFont.truetype("Arial", 24)
-    except IOError:
-        font = ImageFont.load_default()
-    
-    # 텍스트 중앙 정렬
-    text_width, text_height = draw.textsize(text, font=font)
-    position = ((size[0] - text_width) / 2, (size[1] - text_height) / 2)
-    
-    # 텍스트 그리기
-    draw.text(position, text, font=font, fill=text_color)
-    
-    return image
-
-
 # 테스트 클래스
 class TestOCREngine:
     """OCR 엔진 테스트 클래스"""
     
-    @pytest.fixture
-    def test_image(self):
-        """테스트 이미지 픽스처"""
-        return create_test_image()
-    
     @pytest.fixture
     def mock_ocr_engine(self):
         """모의 OCR 엔진 픽스처"""
@@ -113,14 +91,23 @@ class TestOCREngine:
     @pytest.mark.asyncio
     async def test_recognize_with_specified_language(self, test_image, mock_ocr_engine):
         """특정 언어 지정 시 인식 기능 테스트"""
+        # 일본어 엔진만 즉시 응답하고 나머지는 지연
+        mock_ocr_engine.engines["engine1"].delay = 1.0
+        mock_ocr_engine.engines["engine2"].delay = 1.0
+        mock_ocr_engine.early_exit_threshold = 0.7
+        
         # 일본어로 지정하여 OCR 실행
-        result = await mock_ocr_engine.recognize_text(test_image, lang="jpn")
+        result = await mock_ocr_engine.recognize_text(test_image, lang="jpn", use_cache=False)
         
         # 결과 검증
         assert result is not None
         assert result['language'] == "jpn"
         # 일본어 결과가 우선되어야 함
         assert "テキスト" in result['text']
+        
+        # 조기 종료로 나머지 엔진은 완료 전에 취소되어야 함
+        assert mock_ocr_engine.engines["engine1"].completed == 0
+        assert mock_ocr_engine.engines["engine2"].completed == 0
     
     @pytest.mark.asyncio
     async def test_cache_functionality(self, test_image, mock_ocr_engine):
@@ -131,6 +118,10 @@ class TestOCREngine:
         mock_ocr_engine.cache = mock_cache
         mock_ocr_engine.cache_enabled = True
         
+        # 이미지 해시 계산 횟수 기록
+        hash_spy = MagicMock(wraps=mock_ocr_engine._calculate_image_hash)
+        mock_ocr_engine._calculate_image_hash = hash_spy
+        
         # 첫 번째 OCR 실행 (캐시 미스)
         result1 = await mock_ocr_engine.recognize_text(test_image)
         
@@ -138,6 +129,13 @@ class TestOCREngine:
         assert mock_cache.get.called
         assert mock_cache.setex.called
         
+        # 조회/저장이 같은 캐시 키를 사용하고 해시는 한 번만 계산해야 함
+        assert hash_spy.call_count == 1
+        assert mock_cache.get.call_args[0][0] == mock_cache.setex.call_args[0][0]
+        
+        # 캐시 값은 바이트로 직렬화되어야 함
+        assert isinstance(mock_cache.setex.call_args[0][2], bytes)
+        
         # 캐시 히트 시뮬레이션
         cached_result = {
             "text": "캐시된 텍스트",
@@ -162,11 +160,6 @@ class TestPreprocessor:
         """전처리기 픽스처"""
         return Preprocessor()
     
-    @pytest.fixture
-    def test_image(self):
-        """테스트 이미지 픽스처"""
-        return create_test_image()
-    
     def test_process_image_basic(self, preprocessor, test_image):
         """기본 이미지 전처리 테스트"""
         # 이미지 전처리
@@ -183,13 +176,14 @@ class TestPreprocessor:
         """다양한 언어에 대한 전처리 테스트"""
         # 언어별 전처리
         langs = ["jpn", "kor", "eng", "chi_sim"]
+        results = preprocessor.process_image_multi(test_image, langs)
         
-        for lang in langs:
-            processed = preprocessor.process_image(test_image, lang=lang)
-            
-            # 결과 검증
-            assert processed is not None
+        # 결과 검증 (언어별 결과가 개별 전처리 결과와 동일해야 함)
+        assert list(results) == langs
+        for lang, processed in results.items():
             assert isinstance(processed, Image.Image)
+            expected = preprocessor.process_image(test_image, lang=lang)
+            assert np.array_equal(np.asarray(processed), np.asarray(expected))
     
     def test_process_for_different_doc_types(self, preprocessor, test_image):
         """다양한 문서 유형에 대한 전처리 테스트"""
@@ -202,6 +196,65 @@ class TestPreprocessor:
             # 결과 검증
             assert processed is not None
             assert isinstance(processed, Image.Image)
+    
+    def test_process_image_batch(self, preprocessor, test_image):
+        """여러 언어 변형 일괄 전처리 테스트"""
+        # 같은 이미지의 언어별 변형 일괄 전처리
+        langs = ["jpn", "kor", "eng", "chi_sim"]
+        images = [test_image] * len(langs)
+        results = preprocessor.process_image_batch(images, langs)
+        
+        # 결과 검증 (개별 전처리 결과와 동일해야 함)
+        assert len(results) == len(images)
+        for lang, processed in zip(langs, results):
+            expected = preprocessor.process_image(test_image, lang=lang)
+            assert np.array_equal(np.asarray(processed), np.asarray(expected))
+    
+    @staticmethod
+    def _contour_regions(mask, min_area):
+        """바깥 윤곽선 기준 영역 (findContours + contourArea 기준 경로)"""
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        regions = []
+        for contour in contours:
+            if cv2.contourArea(contour) >= min_area:
+                x, y, w, h = cv2.boundingRect(contour)
+                regions.append([x, y, x + w, y + h])
+        return sorted(regions)
+    
+    def test_detector_regions_match_contours(self):
+        """도장/표 감지 영역이 바깥 윤곽선 기준 결과와 같은지 테스트"""
+        doc_preprocessor = DocumentPreprocessor()
+        
+        # 고리 모양 도장 (내부 글자 포함) + 픽셀 수는 적지만 윤곽선 면적은 큰 가는 도장
+        stamp = np.full((300, 400, 3), 255, np.uint8)
+        cv2.circle(stamp, (100, 100), 60, (0, 0, 255), 7)
+        cv2.rectangle(stamp, (85, 85), (115, 115), (0, 0, 255), -1)
+        cv2.circle(stamp, (300, 200), 13, (0, 0, 255), 6)
+        red_mask, _ = _compute_red_mask(stamp)
+        
+        has_stamps, stamp_regions = doc_preprocessor._detect_stamps(stamp)
+        assert has_stamps
+        assert sorted(stamp_regions) == self._contour_regions(red_mask, 500)
+        assert len(stamp_regions) == 2
+        
+        # 셀 안에 글자가 있는 괘선 표
+        table = np.full((400, 600), 255, np.uint8)
+        for y in range(50, 351, 60):
+            cv2.line(table, (50, y), (550, y), 0, 2)
+        for x in range(50, 551, 100):
+            cv2.line(table, (x, 50), (x, 350), 0, 2)
+        for y in range(80, 351, 60):
+            for x in range(70, 551, 100):
+                cv2.putText(table, "12", (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, 0, 1)
+        
+        edges = cv2.Canny(table, 50, 150)
+        table_mask = cv2.bitwise_or(cv2.dilate(edges, np.ones((1, 30), np.uint8)),
+                                    cv2.dilate(edges, np.ones((30, 1), np.uint8)))
+        table_mask = cv2.dilate(table_mask, np.ones((5, 5), np.uint8), iterations=2)
+        
+        has_tables, table_regions = doc_preprocessor._detect_tables(table, edges)
+        assert has_tables
+        assert sorted(table_regions) == self._contour_regions(table_mask, 5000)
 
 
 class TestPostProcessor:
@@ -305,6 +358,13 @@ class TestPostProcessor:
         
         # 금액 추출 확인
         assert any("123,456" in amount or "¥123,456" in amount for amount in entities["amounts"])
+        
+        # 모든 엔티티는 전체 일치 문자열로 반환
+        assert all(isinstance(value, str) for values in entities.values() for value in values)
+        
+        # 같은 유형의 패턴끼리 겹치는 일치도 모두 추출
+        entities = postprocessor.extract_business_entities("合計 ¥1,000円", "jpn")
+        assert sorted(entities["amounts"]) == ["1,000円", "¥1,000"]
 
 
 class TestSpecialItemDetector:
@@ -320,7 +380,7 @@ class TestSpecialItemDetector:
         }
         return SpecialItemDetector(special_config)
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def stamp_image(self):
         """도장 이미지 픽스처"""
         # 빨간색 원 생성 (도장 시뮬레이션)
@@ -329,7 +389,7 @@ class TestSpecialItemDetector:
         draw.ellipse((100, 100, 200, 200), fill=(255, 0, 0))
         return image
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def handwriting_image(self):
         """손글씨 이미지 픽스처"""
         # 불규칙한 선으로 손글씨 시뮬레이션
@@ -343,7 +403,7 @@ class TestSpecialItemDetector:
         
         return image
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def strikethrough_image(self):
         """취소선 이미지 픽스처"""
         # 글자 위에 수평선 그리기